@@ -0,0 +1,94 @@
+"""
+차트 렌더러 벤치마크
+
+mplfinance 기본 경로와 템플릿 재사용(fast) 경로의 차트당 렌더링 시간과
+최대 메모리 사용량을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_chart_render --charts 20
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+import utils.chart_generator as chart_generator
+
+
+def make_ohlcv(days: int = 22, seed: int = 0) -> pd.DataFrame:
+    """랜덤 워크 기반 OHLCV 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, days)))
+    opens = closes * (1 + rng.normal(0, 0.005, days))
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.01, days))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.01, days))
+    volumes = rng.integers(1_000_000, 5_000_000, days)
+    return pd.DataFrame(
+        {"Open": opens, "High": highs, "Low": lows, "Close": closes, "Volume": volumes},
+        index=index,
+    )
+
+
+def run_renderer(renderer: str, frames: List[pd.DataFrame], out_dir: str) -> Dict:
+    """지정된 렌더러로 차트를 그리며 시간/메모리 측정"""
+    chart_generator.CHART_RENDERER = renderer
+    markets = list(chart_generator.MARKET_NAMES_KR)
+
+    latencies = []
+    tracemalloc.start()
+    for i, hist in enumerate(frames):
+        market_name = markets[i % len(markets)]
+        save_path = os.path.join(out_dir, f"{renderer}_{i}.png")
+        start = time.perf_counter()
+        if not chart_generator.render_price_chart(hist, market_name, save_path):
+            raise RuntimeError(f"{renderer} 렌더링 실패")
+        latencies.append(time.perf_counter() - start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "renderer": renderer,
+        # 첫 차트는 템플릿/스타일 생성 비용을 포함하므로 별도 표기
+        "first_ms": latencies[0] * 1000,
+        "median_ms": statistics.median(latencies[1:] or latencies) * 1000,
+        "peak_mb": peak / 1024 / 1024,
+        "size_kb": os.path.getsize(save_path) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차트 렌더러 벤치마크")
+    parser.add_argument("--charts", type=int, default=20, help="렌더링할 차트 수")
+    parser.add_argument("--days", type=int, default=22, help="차트당 캔들 수")
+    parser.add_argument("--font", help="한글 폰트 경로 (기본값: 시스템 설정)")
+    args = parser.parse_args()
+
+    if args.font:
+        chart_generator.font_path = args.font
+
+    frames = [make_ohlcv(args.days, seed) for seed in range(args.charts)]
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        results = [
+            run_renderer(renderer, frames, out_dir)
+            for renderer in ("mplfinance", "fast")
+        ]
+
+    print(f"{'renderer':<12}{'first(ms)':>12}{'median(ms)':>12}{'peak(MB)':>10}{'size(KB)':>10}")
+    for r in results:
+        print(
+            f"{r['renderer']:<12}{r['first_ms']:>12.1f}{r['median_ms']:>12.1f}"
+            f"{r['peak_mb']:>10.1f}{r['size_kb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+오프라인 전체 파이프라인 벤치마크
+
+녹화된 픽스처(없으면 시드 기반 합성 데이터)로 외부 데이터 소스를 대체하고
+ReportGenerator.generate_report()를 N회 실행하여 전체 및 단계별
+(collect/charts/process/build) 소요 시간의 중앙값과 p95를 출력합니다.
+결과물(리포트, 차트, 데이터 저장소, 로그)은 임시 디렉토리에 생성됩니다.
+
+실행:
+    # 네트워크 없이 합성 픽스처로 측정
+    python -m benchmarks.bench_pipeline --runs 5
+
+    # 실제 소스 응답을 한 번 녹화한 뒤 재생하여 측정
+    python -m benchmarks.bench_pipeline --record benchmarks/fixtures.pkl.gz
+    python -m benchmarks.bench_pipeline --fixtures benchmarks/fixtures.pkl.gz --runs 10
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+
+import config.settings as settings
+from benchmarks.fixtures import FixtureSources
+from src.logger import logger
+
+STAGE_GROUPS = {
+    "collect": lambda name: name.startswith("collect."),
+    "charts": lambda name: name.startswith("charts."),
+    "process": lambda name: name.startswith("process."),
+    "build": lambda name: name == "build" or name.startswith("render."),
+}
+
+
+def isolate_outputs(stack: ExitStack, out_dir: str):
+    """리포트/차트/데이터/로그 경로를 임시 디렉토리로 변경"""
+    import utils.chart_cache as chart_cache
+    from utils.rolling_stats import rolling_store
+
+    reports_dir = os.path.join(out_dir, "reports")
+    images_dir = os.path.join(reports_dir, "images")
+    stack.enter_context(mock.patch.object(settings, "REPORTS_DIR", reports_dir))
+    stack.enter_context(mock.patch.object(settings, "IMAGES_DIR", images_dir))
+    stack.enter_context(
+        mock.patch.object(settings, "DATA_DIR", os.path.join(out_dir, "data"))
+    )
+    stack.enter_context(
+        mock.patch.object(
+            chart_cache,
+            "CHART_CACHE_DIR",
+            os.path.join(out_dir, "data", "chart_cache"),
+        )
+    )
+    # 롤링 통계 상태는 실행마다 out_dir의 파일에서 다시 로드 (--warm-cache일 때만 이어 씀)
+    stack.enter_context(mock.patch.object(rolling_store, "states", {}))
+    stack.enter_context(mock.patch.object(rolling_store, "_loaded", False))
+
+
+def quiet_logger(log_dir: str):
+    """벤치마크 중 로그는 임시 파일에만 기록 (콘솔은 경고 이상만)"""
+    logger.log_directory = log_dir
+    logger._logger = None
+    for handler in logger.handlers:
+        if not isinstance(handler, logging.FileHandler):
+            handler.setLevel(logging.WARNING)
+
+
+def run_once(
+    sources: FixtureSources,
+    sections: Optional[List[str]],
+    workers: Optional[int],
+    out_dir: str,
+) -> Dict[str, float]:
+    """파이프라인 1회 실행 후 전체/단계 그룹별 소요 시간 반환"""
+    from src.report_generator import ReportGenerator
+
+    with ExitStack() as stack:
+        isolate_outputs(stack, out_dir)
+        stack.enter_context(sources)
+
+        # --warm-cache에서도 수집 단계는 매번 측정하도록 체크포인트는 사용하지 않음
+        generator = ReportGenerator(
+            sections=sections,
+            workers=workers or settings.CHART_WORKERS,
+            refresh=True,
+        )
+        started = time.perf_counter()
+        generator.generate_report()
+        total = time.perf_counter() - started
+
+    timings = {"total": total}
+    for group, match in STAGE_GROUPS.items():
+        timings[group] = sum(
+            record["seconds"]
+            for name, record in logger.metrics.stages.items()
+            if match(name)
+        )
+    return timings
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """단계별 중앙값/p95 (ms)"""
+    return {
+        key: {
+            "median_ms": float(np.median([s[key] for s in samples]) * 1000),
+            "p95_ms": float(np.percentile([s[key] for s in samples], 95) * 1000),
+        }
+        for key in samples[0]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 파이프라인 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 예열 횟수")
+    parser.add_argument("--fixtures", help="재생할 녹화 파일 (.pkl.gz)")
+    parser.add_argument(
+        "--record", help="실제 소스로 1회 실행하여 녹화 파일 저장 (네트워크 필요)"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="녹화되지 않은 호출을 합성 데이터로 대체하지 않고 실패 처리",
+    )
+    parser.add_argument("--sections", help="실행할 섹션 (쉼표 구분, 기본값: 전체)")
+    parser.add_argument("--workers", type=int, help="차트 워커 수")
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="실행 간 출력 디렉토리(차트 캐시 포함)를 재사용",
+    )
+    parser.add_argument("--font", help="한글 폰트 경로 (기본값: 시스템 설정)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if args.font:
+        import utils.chart_generator as chart_generator
+
+        chart_generator.font_path = args.font
+
+    sections = args.sections.split(",") if args.sections else None
+
+    with tempfile.TemporaryDirectory() as root:
+        quiet_logger(os.path.join(root, "logs"))
+
+        if args.record:
+            sources = FixtureSources(mode="record")
+            run_once(sources, sections, args.workers, os.path.join(root, "record"))
+            sources.save(args.record)
+            print(f"녹화 완료: {args.record} ({len(sources.records)}개 호출)")
+            return
+
+        if args.fixtures:
+            sources = FixtureSources.load(args.fixtures, synthetic=not args.strict)
+        else:
+            sources = FixtureSources()
+
+        samples = []
+        for i in range(args.warmup + args.runs):
+            out_dir = os.path.join(root, "run" if args.warm_cache else f"run{i}")
+            timings = run_once(sources, sections, args.workers, out_dir)
+            if i >= args.warmup:
+                samples.append(timings)
+
+    results = summarize(samples)
+    if args.json:
+        print(json.dumps({"runs": args.runs, "stages": results}, indent=2))
+        return
+
+    print(f"파이프라인 벤치마크 ({args.runs}회, 예열 {args.warmup}회)")
+    print(f"{'단계':<10}{'median(ms)':>12}{'p95(ms)':>12}")
+    for key, stats in results.items():
+        print(f"{key:<10}{stats['median_ms']:>12.1f}{stats['p95_ms']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
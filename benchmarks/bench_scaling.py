@@ -0,0 +1,156 @@
+"""
+규모 확장 벤치마크
+
+합성 데이터 생성기로 현재 리포트 규모의 1x/10x/100x/1000x 데이터를 만들고
+지표 커널(compute_metrics), DataProcessor, OptionAnalyzer(analyze_market_options), MarkdownBuilder의
+소요 시간과 최대 메모리(tracemalloc)를 배율별로 측정합니다.
+직전 배율 대비 증가율이 배율 증가보다 크면 초선형(superlinear) 구간입니다.
+
+실행:
+    python -m benchmarks.bench_scaling --scales 1,10,100
+    python -m benchmarks.bench_scaling --scales 10,100,1000 --json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.bench_pipeline import quiet_logger
+from benchmarks.synthetic import SyntheticMarket, frame_bytes
+from src.data_processor import DataProcessor
+from src.markdown_builder import MarkdownBuilder
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, Dict[str, float]]:
+    """함수 실행 시간(ms)과 최대 메모리(MB) 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {"ms": elapsed * 1000, "peak_mb": peak / 1024 / 1024}
+
+
+def run_scale(scale: int, strikes: int) -> Dict[str, Dict[str, float]]:
+    """한 배율에서 구성 요소별 시간/메모리 측정"""
+    from utils.option_analysis import analyze_market_options
+
+    from utils.market_metrics import compute_metrics
+
+    market = SyntheticMarket(scale=scale, strikes=strikes, seed=scale)
+    data = {
+        "us_market": market.get_all_us_market_data(),
+        "kr_market": market.get_all_kr_market_data(),
+        "us_treasury": market.get_all_treasury_data(),
+        "forex": market.get_all_forex_data(),
+        "news": market.get_all_news(),
+        "calendar": market.get_important_events(),
+        "buffett_indicator": market.get_buffett_status(),
+    }
+    option_chains = market.get_market_option_data()
+    # 지수/국채/환율 전 종목을 하나로 묶은 패널 (지표 커널 측정용)
+    sections = ("us_market", "kr_market", "us_treasury", "forex")
+    count = sum(market.size(name) for name in sections)
+    panel = market.ohlcv_panel([f"I{i:05d}" for i in range(count)], 1000.0)
+
+    processor = DataProcessor()
+    builder = MarkdownBuilder()
+    results = {}
+
+    _, results["metrics_kernel"] = measure(lambda: compute_metrics(panel))
+    results["metrics_kernel"]["input_mb"] = frame_bytes(panel) / 1024 / 1024
+
+    data["options"], results["option_analyzer"] = measure(
+        lambda: analyze_market_options(option_chains)
+    )
+    results["option_analyzer"]["input_mb"] = frame_bytes(option_chains) / 1024 / 1024
+
+    def process_all() -> Dict[str, str]:
+        return {
+            "us_market": processor.process_us_market_data(data["us_market"]),
+            "kr_market": processor.process_kr_market_data(data["kr_market"]),
+            "us_treasury": processor.process_us_treasury_data(data["us_treasury"]),
+            "forex": processor.process_forex_data(data["forex"]),
+            "news": processor.process_news_data(data["news"]),
+            "calendar": processor.process_economic_calendar(data["calendar"]),
+            "buffett_indicator": processor.process_buffett_indicator_data(
+                data["buffett_indicator"]
+            ),
+            "options": processor.process_options_data(data["options"]),
+        }
+
+    summaries, results["data_processor"] = measure(process_all)
+
+    report, results["markdown_builder"] = measure(
+        lambda: builder.build_report(
+            us_market_data=data["us_market"],
+            us_market_summary=summaries["us_market"],
+            us_treasury_data=data["us_treasury"],
+            us_treasury_summary=summaries["us_treasury"],
+            kr_market_data=data["kr_market"],
+            kr_market_summary=summaries["kr_market"],
+            forex_data=data["forex"],
+            forex_summary=summaries["forex"],
+            buffett_indicator_data=data["buffett_indicator"],
+            buffett_indicator_summary=summaries["buffett_indicator"],
+            news_summary=summaries["news"],
+            calendar_summary=summaries["calendar"],
+            options_data=data["options"],
+            options_summary=summaries["options"],
+        )
+    )
+    results["markdown_builder"]["output_kb"] = len(report.encode("utf-8")) / 1024
+
+    return results
+
+
+def print_curves(scales: List[int], runs: Dict[int, Dict[str, Dict[str, float]]]):
+    """구성 요소별 배율-시간/메모리 곡선 출력"""
+    for component in runs[scales[0]]:
+        print(f"\n[{component}]")
+        print(f"{'scale':>7}{'ms':>12}{'peak MB':>10}{'time x':>9}{'mem x':>9}")
+        previous = None
+        for scale in scales:
+            stats = runs[scale][component]
+            growth = ""
+            if previous:
+                time_growth = stats["ms"] / previous["ms"] if previous["ms"] else 0
+                mem_growth = (
+                    stats["peak_mb"] / previous["peak_mb"] if previous["peak_mb"] else 0
+                )
+                growth = f"{time_growth:>9.1f}{mem_growth:>9.1f}"
+            print(f"{scale:>7}{stats['ms']:>12.1f}{stats['peak_mb']:>10.2f}{growth}")
+            previous = stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규모 확장 벤치마크")
+    parser.add_argument(
+        "--scales", default="1,10,100,1000", help="측정할 배율 (쉼표 구분)"
+    )
+    parser.add_argument("--strikes", type=int, default=200, help="만기별 행사가 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        # 옵션 분석의 지수별 로그가 저장소 로그 파일에 쌓이지 않도록 함
+        quiet_logger(os.path.join(log_dir, "logs"))
+        runs = {scale: run_scale(scale, args.strikes) for scale in scales}
+
+    if args.json:
+        print(json.dumps({str(scale): runs[scale] for scale in scales}, indent=2))
+        return
+
+    print(f"규모 확장 벤치마크 (배율: {', '.join(map(str, scales))})")
+    print_curves(scales, runs)
+
+
+if __name__ == "__main__":
+    main()
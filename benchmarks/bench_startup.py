@@ -0,0 +1,93 @@
+"""
+모듈 콜드 스타트 벤치마크
+
+새 인터프리터에서 모듈을 import 하는 데 걸리는 시간을 측정하고,
+무거운 외부 라이브러리가 import 시점에 로드되지 않는지 확인합니다.
+예산을 초과하거나 금지된 모듈이 로드되면 종료 코드 1을 반환합니다.
+
+실행:
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 모듈별 콜드 스타트 예산 (ms, 인터프리터 기동 시간 제외)
+STARTUP_BUDGET_MS = {
+    "src.report_generator": 150,
+    "src.data_processor": 50,
+    "src.markdown_builder": 50,
+    "src.logger": 50,
+}
+
+# import 시점에 로드되면 안 되는 무거운 모듈
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "mplfinance",
+    "yfinance",
+    "pykrx",
+    "fredapi",
+    "selenium",
+    "selenium_stealth",
+    "webdriver_manager",
+    "requests",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"ms": elapsed, "heavy": heavy}}))
+"""
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str, runs: int) -> dict:
+    """새 인터프리터에서 모듈 import 시간을 runs회 측정"""
+    timings = []
+    heavy = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        heavy = result["heavy"]
+
+    return {"module": module, "median_ms": statistics.median(timings), "heavy": heavy}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="모듈 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="모듈별 측정 횟수")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<24}{'median(ms)':>12}{'budget(ms)':>12}  heavy imports")
+    for module, budget in STARTUP_BUDGET_MS.items():
+        result = measure(module, args.runs)
+        over_budget = result["median_ms"] > budget
+        failed = failed or over_budget or bool(result["heavy"])
+        print(
+            f"{module:<24}{result['median_ms']:>12.1f}{budget:>12}  "
+            f"{', '.join(result['heavy']) or '-'}{'  (FAIL)' if over_budget else ''}"
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
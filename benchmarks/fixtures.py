@@ -0,0 +1,411 @@
+"""
+외부 데이터 소스 녹화/재생 픽스처
+
+yfinance, pykrx, FRED, DeepSearch(뉴스), investing.com(경제 지표) 호출을
+로컬 대체 구현으로 바꿔 네트워크 없이 전체 파이프라인을 실행합니다.
+
+- record: 실제 라이브러리 호출 결과를 그대로 기록 (네트워크 필요)
+- replay: 기록된 결과를 반환하고, 기록에 없는 호출은 시드 기반 합성 데이터로 대체
+
+수집기는 호출 시점의 날짜로 조회 기간을 계산하므로, 호출 키에는 날짜 대신
+조회 기간(일 수)을 사용하여 다른 날에도 같은 픽스처가 재생되도록 합니다.
+
+사용 예:
+    with FixtureSources.load("fixtures.pkl.gz"):
+        ReportGenerator().generate_report()
+"""
+
+import gzip
+import hashlib
+import json
+import pickle
+from collections import namedtuple
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+OptionChain = namedtuple("OptionChain", ["calls", "puts"])
+
+# 합성 데이터 기준 가격 (심볼별)
+BASE_LEVELS = {
+    "^GSPC": 5800.0,
+    "^SPX": 5800.0,
+    "^IXIC": 18500.0,
+    "^NDX": 20500.0,
+    "^DJI": 42000.0,
+    "^VIX": 16.0,
+    "^W5000": 58000.0,
+    "^IRX": 4.3,
+    "^TNX": 4.2,
+    "^TYX": 4.5,
+    "USDKRW=X": 1400.0,
+    "EURKRW=X": 1500.0,
+    "JPYKRW=X": 9.3,
+    "CNYKRW=X": 195.0,
+    "1001": 2600.0,
+    "2001": 750.0,
+}
+
+KRX_COLUMNS = {
+    "Open": "시가",
+    "High": "고가",
+    "Low": "저가",
+    "Close": "종가",
+    "Volume": "거래량",
+}
+
+
+def _to_datetime(value: Any) -> datetime:
+    """datetime/문자열(YYYY-MM-DD, YYYYMMDD) 날짜 변환"""
+    if isinstance(value, datetime):
+        return value
+    return pd.Timestamp(str(value)).to_pydatetime()
+
+
+def _span_days(start: Any, end: Any) -> int:
+    """조회 기간 일 수"""
+    if start is None or end is None:
+        return 0
+    return (_to_datetime(end) - _to_datetime(start)).days
+
+
+def _rng(*key: Any) -> np.random.Generator:
+    """호출 키로 재현 가능한 난수 생성기 (프로세스와 무관하게 동일)"""
+    digest = hashlib.sha256(repr(key).encode("utf-8")).digest()
+    return np.random.default_rng(int.from_bytes(digest[:8], "little"))
+
+
+def synthetic_ohlcv(symbol: str, days: int, seed_key: Tuple = ()) -> pd.DataFrame:
+    """기하 브라운 운동 기반 OHLCV 데이터 (영업일 기준, 오늘까지)"""
+    rng = _rng("ohlcv", symbol, days, *seed_key)
+    periods = max(1, int(days * 5 / 7))
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=periods)
+
+    base = BASE_LEVELS.get(symbol, 100.0)
+    # 마지막 종가가 기준 가격이 되도록 조정 (긴 기간에서도 현재 수준 유지)
+    path = np.exp(np.cumsum(rng.normal(0.0002, 0.01, periods)))
+    closes = base * path / path[-1]
+    opens = closes * (1 + rng.normal(0, 0.004, periods))
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.008, periods))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.008, periods))
+    volumes = rng.integers(1_000_000, 5_000_000, periods).astype(float)
+
+    return pd.DataFrame(
+        {"Open": opens, "High": highs, "Low": lows, "Close": closes, "Volume": volumes},
+        index=index,
+    )
+
+
+def synthetic_option_chain(
+    symbol: str, expiry: str, strikes: int = 81, spot: Optional[float] = None
+) -> OptionChain:
+    """행사가별 변동성 스마일을 가진 옵션 체인
+
+    Args:
+        symbol: 기초자산 심볼
+        expiry: 만기일 (YYYY-MM-DD)
+        strikes: 행사가 개수 (현재가 ±20% 구간)
+        spot: 기초자산 가격 (기본값: BASE_LEVELS 또는 100)
+    """
+    rng = _rng("chain", symbol, expiry)
+    spot = spot or BASE_LEVELS.get(symbol, 100.0)
+    strikes = np.round(spot * np.linspace(0.8, 1.2, strikes), 2)
+    moneyness = strikes / spot - 1
+    days = max(1, (_to_datetime(expiry) - datetime.now()).days)
+
+    # 풋 쪽이 높은 스큐 + 기간에 따라 완만해지는 스마일
+    atm_iv = 0.16 + 0.01 * np.sqrt(days / 30)
+    iv = atm_iv - 0.25 * moneyness + 0.9 * moneyness**2
+
+    def chain(put: bool) -> pd.DataFrame:
+        weight = np.exp(-((moneyness + (0.03 if put else -0.03)) ** 2) / 0.004)
+        return pd.DataFrame(
+            {
+                "contractSymbol": [
+                    f"{symbol}{expiry}{'P' if put else 'C'}{k}" for k in strikes
+                ],
+                "strike": strikes,
+                "lastPrice": np.maximum(
+                    (strikes - spot) if put else (spot - strikes), 0
+                )
+                + spot * iv * np.sqrt(days / 365) * 0.4,
+                "volume": (weight * rng.integers(500, 5000) * (1.2 if put else 1.0))
+                .round()
+                .astype(int),
+                "openInterest": (weight * rng.integers(5000, 50000)).round().astype(int),
+                "impliedVolatility": iv * (1 + rng.normal(0, 0.01, len(strikes))),
+            }
+        )
+
+    return OptionChain(calls=chain(False), puts=chain(True))
+
+
+def synthetic_expiries(symbol: str, count: int = 16) -> Tuple[str, ...]:
+    """오늘 이후 금요일 만기 목록"""
+    today = datetime.now()
+    first_friday = today + timedelta(days=(4 - today.weekday()) % 7 or 7)
+    return tuple(
+        (first_friday + timedelta(weeks=i)).strftime("%Y-%m-%d") for i in range(count)
+    )
+
+
+def synthetic_fred_series(series_id: str, start: Any, end: Any) -> pd.Series:
+    """FRED 시리즈 (GDP는 분기, 그 외는 일별)"""
+    end_date = _to_datetime(end) if end else datetime.now()
+    start_date = _to_datetime(start) if start else end_date - timedelta(days=365)
+
+    if series_id == "GDP":
+        index = pd.date_range(start_date, end_date, freq="QS")
+        growth = np.exp(np.linspace(0, np.log(10.5), len(index)))
+        return pd.Series(2800.0 * growth, index=index)
+
+    index = pd.date_range(start_date, end_date, freq="D")
+    return pd.Series(5.50, index=index)
+
+
+def synthetic_news(section: str, count: int = 5) -> Dict[str, Any]:
+    """DeepSearch 응답 형식의 뉴스 목록"""
+    rng = _rng("news", section)
+    now = datetime.now()
+    return {
+        "data": [
+            {
+                "title": f"Synthetic {section} headline {i}",
+                "title_ko": f"합성 {section} 뉴스 {i}",
+                "summary": f"Synthetic summary {i} " * int(rng.integers(5, 20)),
+                "published_at": (now - timedelta(hours=i)).isoformat(),
+                "publisher": "Fixture News",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def synthetic_calendar_events(count: int = 40) -> list:
+    """investing.com 경제 지표 이벤트 목록 (오늘/내일, KST)"""
+    rng = _rng("calendar", count)
+    today = datetime.now()
+    countries = ["미국", "한국", "유로존", "일본", "중국"]
+    return [
+        {
+            "time": f"{int(rng.integers(0, 24)):02d}:{int(rng.integers(0, 4)) * 15:02d}",
+            "date": (today + timedelta(days=i % 2)).strftime("%Y-%m-%d"),
+            "country": countries[i % len(countries)],
+            "event": f"합성 경제 지표 {i}",
+            "importance": "⭐" * int(rng.integers(1, 4)),
+            "actual": f"{rng.normal(2, 1):.1f}%",
+            "forecast": f"{rng.normal(2, 1):.1f}%",
+            "previous": f"{rng.normal(2, 1):.1f}%",
+        }
+        for i in range(count)
+    ]
+
+
+class FakeResponse:
+    """requests.Response 대체 (json/raise_for_status/content만 지원)"""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self._payload = payload
+        self.status_code = 200
+        self.content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+class FixtureSources:
+    """외부 데이터 소스 녹화/재생 컨텍스트
+
+    컨텍스트 안에서는 라이브러리 진입점이 대체되며, 종료 시 원래대로 복원됩니다.
+    """
+
+    def __init__(
+        self,
+        records: Optional[Dict[Tuple, Any]] = None,
+        mode: str = "replay",
+        synthetic: bool = True,
+    ):
+        """
+        Args:
+            records: {호출 키: 결과} (replay 입력, record 출력)
+            mode: "record" 또는 "replay"
+            synthetic: replay 시 기록에 없는 호출을 합성 데이터로 대체할지 여부
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"잘못된 모드: {mode}")
+        self.records: Dict[Tuple, Any] = dict(records or {})
+        self.mode = mode
+        self.synthetic = synthetic
+        self.calls: Dict[str, int] = {}
+        self._stack: Optional[ExitStack] = None
+
+    @classmethod
+    def load(cls, path: str, synthetic: bool = True) -> "FixtureSources":
+        """녹화 파일(.pkl.gz)에서 재생용 인스턴스 생성"""
+        with gzip.open(path, "rb") as f:
+            return cls(pickle.load(f), mode="replay", synthetic=synthetic)
+
+    def save(self, path: str) -> str:
+        """녹화 결과 저장"""
+        with gzip.open(path, "wb") as f:
+            pickle.dump(self.records, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    def _call(self, key: Tuple, real: Callable[[], Any], fake: Callable[[], Any]):
+        """녹화/재생 공통 처리"""
+        self.calls[key[0]] = self.calls.get(key[0], 0) + 1
+
+        if self.mode == "record":
+            result = real()
+            self.records[key] = result
+            return result
+
+        if key in self.records:
+            return self.records[key]
+        if not self.synthetic:
+            raise KeyError(f"녹화되지 않은 호출: {key}")
+        return fake()
+
+    # --- 대체 구현 ---
+
+    def _ticker_class(self, real_ticker):
+        sources = self
+
+        class FixtureTicker:
+            """yfinance.Ticker 대체"""
+
+            def __init__(self, symbol: str, *args, **kwargs):
+                self.symbol = symbol
+                self._real = None
+                self._args = args
+                self._kwargs = kwargs
+
+            @property
+            def real(self):
+                if self._real is None:
+                    self._real = real_ticker(self.symbol, *self._args, **self._kwargs)
+                return self._real
+
+            def history(self, period=None, start=None, end=None, **kwargs):
+                span = _span_days(start, end) if start is not None else period
+                key = ("yf.history", self.symbol, span, kwargs.get("interval", "1d"))
+                days = 1 if period == "1d" else (span if isinstance(span, int) else 30)
+                return sources._call(
+                    key,
+                    lambda: self.real.history(
+                        period=period, start=start, end=end, **kwargs
+                    ),
+                    lambda: synthetic_ohlcv(self.symbol, max(days, 2)),
+                )
+
+            @property
+            def options(self):
+                return sources._call(
+                    ("yf.options", self.symbol),
+                    lambda: tuple(self.real.options),
+                    lambda: synthetic_expiries(self.symbol),
+                )
+
+            def option_chain(self, expiry: str):
+                # 만기는 날짜마다 바뀌므로 만기 순번을 키로 사용
+                position = list(self.options).index(expiry)
+                return sources._call(
+                    ("yf.option_chain", self.symbol, position),
+                    lambda: OptionChain(*self.real.option_chain(expiry)[:2]),
+                    lambda: synthetic_option_chain(self.symbol, expiry),
+                )
+
+        return FixtureTicker
+
+    def __enter__(self) -> "FixtureSources":
+        import yfinance
+        import fredapi
+        from pykrx import stock
+        import requests
+        from utils.calendar import EconomicCalendar
+        from utils.rate_limiter import yahoo_limiter
+
+        real_ticker = yfinance.Ticker
+        real_download = yfinance.download
+        real_krx = stock.get_index_ohlcv_by_date
+        real_get_series = fredapi.Fred.get_series
+        real_requests_get = requests.get
+        real_events = EconomicCalendar.get_important_events
+
+        def download(tickers, start=None, end=None, **kwargs):
+            span = _span_days(start, end)
+            return self._call(
+                ("yf.download", str(tickers), span),
+                lambda: real_download(tickers, start=start, end=end, **kwargs),
+                lambda: synthetic_ohlcv(str(tickers), span or 365),
+            )
+
+        def get_index_ohlcv_by_date(fromdate, todate, ticker, *args, **kwargs):
+            span = _span_days(fromdate, todate)
+            return self._call(
+                ("krx.ohlcv", ticker, span),
+                lambda: real_krx(fromdate, todate, ticker, *args, **kwargs),
+                lambda: synthetic_ohlcv(ticker, span).rename(columns=KRX_COLUMNS),
+            )
+
+        def get_series(fred, series_id, observation_start=None, observation_end=None, **kwargs):
+            span = _span_days(observation_start, observation_end)
+            return self._call(
+                ("fred.series", series_id, span),
+                lambda: real_get_series(
+                    fred, series_id, observation_start, observation_end, **kwargs
+                ),
+                lambda: synthetic_fred_series(
+                    series_id, observation_start, observation_end
+                ),
+            )
+
+        def fred_init(fred, api_key=None, *args, **kwargs):
+            # 재생 시에는 API 키 없이도 생성 가능하도록 함
+            fred.api_key = api_key
+
+        def requests_get(url, params=None, **kwargs):
+            section = url.rstrip("/").split("/")[-2:]
+            return self._call(
+                ("http.get", "/".join(section)),
+                lambda: real_requests_get(url, params=params, **kwargs),
+                lambda: FakeResponse(synthetic_news("/".join(section))),
+            )
+
+        def get_important_events(calendar):
+            return self._call(
+                ("calendar.events",),
+                lambda: real_events(calendar),
+                lambda: synthetic_calendar_events(),
+            )
+
+        self._stack = ExitStack()
+        patches = [
+            mock.patch.object(yfinance, "Ticker", self._ticker_class(real_ticker)),
+            mock.patch.object(yfinance, "download", download),
+            mock.patch.object(stock, "get_index_ohlcv_by_date", get_index_ohlcv_by_date),
+            mock.patch.object(fredapi.Fred, "get_series", get_series),
+            mock.patch.object(requests, "get", requests_get),
+            mock.patch.object(EconomicCalendar, "get_important_events", get_important_events),
+        ]
+        if self.mode == "replay":
+            patches.append(mock.patch.object(fredapi.Fred, "__init__", fred_init))
+            # 네트워크 요청이 없으므로 Yahoo 요청 제한으로 인한 대기는 측정에서 제외
+            patches.append(mock.patch.object(yahoo_limiter, "rate", 1e9))
+            patches.append(mock.patch.object(yahoo_limiter, "burst", 1e9))
+
+        for patch in patches:
+            self._stack.enter_context(patch)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+        return False
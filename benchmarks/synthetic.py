@@ -0,0 +1,196 @@
+"""
+합성 시장 데이터 생성기
+
+수집기(utils/)와 같은 반환 형식의 데이터를 배율(scale)에 맞춰 생성합니다.
+scale=1이면 현재 리포트 규모(미국 지수 3개, 한국 지수 2개, 국채 3종, 환율 4종,
+옵션 기초자산 3개, 경제 지표 40건, 뉴스 15건)이고, 배율만큼 종목/이벤트 수가
+늘어납니다. 가격은 종목 패널 단위로 벡터화된 기하 브라운 운동(GBM)으로 만들고,
+지표는 수집기와 같은 패널 커널(utils.market_metrics.compute_metrics)로 계산합니다.
+
+사용 예:
+    market = SyntheticMarket(scale=100)
+    us_market = market.get_all_us_market_data()
+    options = market.get_market_option_data()
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import (
+    synthetic_calendar_events,
+    synthetic_news,
+    synthetic_option_chain,
+)
+from utils.market_metrics import OHLCV_COLUMNS, compute_metrics, to_records
+
+# scale=1 기준 규모
+BASE_SIZES = {
+    "us_market": 3,
+    "kr_market": 2,
+    "us_treasury": 3,
+    "forex": 4,
+    "options": 3,
+    "calendar": 40,
+    "news": 5,  # 카테고리별
+}
+
+
+class SyntheticMarket:
+    """수집기 인터페이스를 따르는 합성 데이터 생성기"""
+
+    def __init__(
+        self,
+        scale: int = 1,
+        days: int = 252,
+        seed: int = 0,
+        expiries: int = 3,
+        strikes: int = 200,
+    ):
+        """
+        Args:
+            scale: 현재 규모 대비 배율
+            days: 가격 패널 길이 (영업일)
+            seed: 난수 시드
+            expiries: 기초자산별 옵션 만기 수
+            strikes: 만기별 행사가 수
+        """
+        self.scale = scale
+        self.days = days
+        self.seed = seed
+        self.expiries = expiries
+        self.strikes = strikes
+        self.rng = np.random.default_rng(seed)
+
+    def size(self, name: str) -> int:
+        """섹션별 생성 개수"""
+        return BASE_SIZES[name] * self.scale
+
+    def price_panel(
+        self, count: int, base: float, volatility: float = 0.01
+    ) -> Dict[str, np.ndarray]:
+        """종목 count개의 OHLCV 패널 (days x count 배열)"""
+        shocks = self.rng.normal(0.0002, volatility, (self.days, count))
+        path = np.exp(np.cumsum(shocks, axis=0))
+        levels = base * self.rng.uniform(0.5, 1.5, count)
+        closes = levels * path / path[-1]
+        opens = closes * (1 + self.rng.normal(0, volatility / 2, closes.shape))
+        highs = np.maximum(opens, closes) * (
+            1 + self.rng.uniform(0, volatility, closes.shape)
+        )
+        lows = np.minimum(opens, closes) * (
+            1 - self.rng.uniform(0, volatility, closes.shape)
+        )
+        volumes = self.rng.integers(1_000_000, 5_000_000, closes.shape).astype(float)
+        return {
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": closes,
+            "volume": volumes,
+        }
+
+    def ohlcv_panel(
+        self, names: List[str], base: float, volatility: float = 0.01
+    ) -> pd.DataFrame:
+        """price_panel을 build_panel 형식((필드, 종목) 2단 컬럼)의 DataFrame으로 변환"""
+        arrays = self.price_panel(len(names), base, volatility)
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=self.days)
+        return pd.concat(
+            {
+                column: pd.DataFrame(arrays[column.lower()], index=index, columns=names)
+                for column in OHLCV_COLUMNS
+            },
+            axis=1,
+        )
+
+    def get_all_us_market_data(self) -> Dict[str, Dict[str, Any]]:
+        names = ["S&P 500", "NASDAQ", "DOW"]
+        names += [f"US{i:04d}" for i in range(self.size("us_market") - len(names))]
+        return to_records(compute_metrics(self.ohlcv_panel(names, 5000.0)), "market")
+
+    def get_all_kr_market_data(self) -> Dict[str, Dict[str, Any]]:
+        names = ["KOSPI", "KOSDAQ"]
+        names += [f"KR{i:04d}" for i in range(self.size("kr_market") - len(names))]
+        return to_records(compute_metrics(self.ohlcv_panel(names, 2000.0)), "market")
+
+    def get_all_treasury_data(self) -> Dict[str, Dict[str, Any]]:
+        names = ["2년물", "10년물", "30년물"]
+        names += [f"{i + 1}개월물" for i in range(self.size("us_treasury") - len(names))]
+        table = compute_metrics(self.ohlcv_panel(names, 4.3, volatility=0.02))
+        table["fed_spread"] = table["close"] - 5.50
+        return to_records(table, "treasury")
+
+    def get_all_forex_data(self) -> Dict[str, Dict[str, Any]]:
+        names = ["USD/KRW", "EUR/KRW", "JPY/KRW", "CNY/KRW"]
+        names += [f"C{i:03d}/KRW" for i in range(self.size("forex") - len(names))]
+        panel = self.ohlcv_panel(names, 1000.0, volatility=0.005)
+        return to_records(compute_metrics(panel), "forex")
+
+    def get_all_news(self) -> Dict[str, List[Dict[str, Any]]]:
+        count = self.size("news")
+        return {
+            category: synthetic_news(category, count)["data"]
+            for category in ("kr_economic", "global_economic", "global_business")
+        }
+
+    def get_important_events(self) -> List[Dict[str, Any]]:
+        return synthetic_calendar_events(self.size("calendar"))
+
+    def get_buffett_status(self) -> Dict[str, Any]:
+        return {
+            "current_ratio": 195.0,
+            "trend_value": 170.0,
+            "historical_mean": 110.0,
+            "historical_std": 35.0,
+            "deviation_from_trend": 14.7,
+            "zscore": 2.43,
+            "upper_2std": 190.0,
+            "lower_2std": 60.0,
+            "market_status": "매우 과대평가",
+        }
+
+    def get_market_option_data(
+        self, spots: Optional[Dict[str, float]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """get_market_option_data()와 같은 형식의 옵션 체인 (기초자산별 만기 목록)"""
+        names = ["SPX", "NDX", "VIX"]
+        names += [f"OPT{i:04d}" for i in range(self.size("options") - len(names))]
+        spots = spots or {}
+
+        today = datetime.now()
+        first_friday = today + timedelta(days=(4 - today.weekday()) % 7 or 7)
+        expiries = [
+            (first_friday + timedelta(weeks=4 * i)).strftime("%Y-%m-%d")
+            for i in range(self.expiries)
+        ]
+
+        market_data = {}
+        for name in names:
+            spot = spots.get(name) or float(self.rng.uniform(50, 5000))
+            chains = []
+            for expiry in expiries:
+                chain = synthetic_option_chain(name, expiry, self.strikes, spot)
+                chains.append(
+                    {
+                        "expiry": expiry,
+                        "calls": chain.calls,
+                        "puts": chain.puts,
+                        "underlying_price": spot,
+                    }
+                )
+            market_data[name] = chains
+        return market_data
+
+
+def frame_bytes(data: Any) -> int:
+    """중첩 데이터에 포함된 DataFrame 메모리 합계 (bytes)"""
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, dict):
+        return sum(frame_bytes(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return sum(frame_bytes(value) for value in data)
+    return 0
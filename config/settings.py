@@ -9,25 +9,90 @@ load_dotenv()
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 REPORTS_DIR = os.path.join(BASE_DIR, "reports")
 IMAGES_DIR = os.path.join(REPORTS_DIR, "images")
+LOGS_DIR = os.path.join(BASE_DIR, "logs")
+DATA_DIR = os.path.join(BASE_DIR, "data")  # 날짜별 수집 데이터 저장소
+PROFILES_DIR = os.path.join(BASE_DIR, "profiles")  # --profile 실행 결과
+RECORDS_DIR = os.path.join(BASE_DIR, "records")  # 실행별 수집 데이터 녹화본
 
 # 날짜 형식
 DATE_FORMAT = "%Y-%m-%d"
 TODAY = datetime.now().strftime(DATE_FORMAT)
 
+# 로그 형식 ("text": 기존 텍스트 로그, "json": 실행 ID/단계/소요 시간을 포함한 JSON Lines)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+
 # 파일 포맷
-REPORT_FILENAME_FORMAT = "{date}_market_report.md"
-IMAGE_FILENAME_FORMAT = "{market_name}_price.png"
+REPORT_FILENAME_FORMAT = "{date}_market_report.{extension}"
+REPORT_FORMATS = ["md"]  # 리포트 출력 형식 ("md", "html", "json" 중 선택, 첫 번째가 기본 리포트)
+RUN_SUMMARY_FILENAME_FORMAT = "{date}_run_summary.json"
+RECORD_FILENAME_FORMAT = "{date}_record.pkl.gz"
+SNAPSHOT_FILENAME_FORMAT = "{date}_metrics.json"
+IMAGE_FILENAME_FORMAT = "{market_name}_price.{extension}"
+COMPOSITE_IMAGE_FILENAME_FORMAT = "market_overview.{extension}"
 
 # 데이터 수집 설정
 LOOKBACK_DAYS = 365
 NEWS_LIMIT = 5
 NEWS_LANGUAGES = ["ko", "en"]
 
+# 수집기 격리 설정 (섹션별 제한 시간과 재시도, 실패 시 최근 정상 데이터 사용)
+COLLECT_TIMEOUT = 120  # 섹션별 제한 시간 (초, 재시도 포함)
+# 섹션별 제한 시간 재정의 (python -m src.log_analysis --stage collect. 의 p99에 여유를 둠)
+# - calendar: Selenium 크롤링 p90 335초, p99 378초 (2024-12 ~ 2025-03 로그)
+# - options: p99 8초이지만 만기별 옵션 체인 조회가 몰리면 길어질 수 있음
+COLLECT_TIMEOUTS = {"calendar": 480, "options": 180}
+COLLECT_RETRIES = 2  # 실패 시 재시도 횟수
+COLLECT_BACKOFF = 2.0  # 첫 재시도 대기 시간 (초, 이후 2배씩 증가)
+COLLECT_MAX_BACKOFF = 15.0  # 재시도 대기 시간 상한 (초)
+FALLBACK_MAX_AGE_DAYS = 7  # 대체 데이터로 사용할 이전 수집 데이터의 최대 경과일
+
+# yfinance 요청 제한 (프로세스 공용 토큰 버킷 + 적응형 동시성)
+YAHOO_RATE = 2.0  # 초당 요청 수
+YAHOO_BURST = 5  # 연속 요청 허용 개수
+YAHOO_MIN_CONCURRENCY = 1  # 동시 요청 한도 하한
+YAHOO_MAX_CONCURRENCY = 4  # 동시 요청 한도 상한
+YAHOO_THROTTLE_COOLDOWN = 10.0  # 요청 제한(429) 감지 후 대기 시간 (초)
+
+# 공용 HTTP 세션 (yfinance/FRED 연결 재사용)
+HTTP_POOL_SIZE = 16  # 호스트별 연결 풀 크기 (동시 요청 + 헤지 요청)
+HTTP_RETRIES = 2  # 연결 오류/5xx 응답 재시도 횟수
+HTTP_BACKOFF = 0.5  # 재시도 대기 계수 (초)
+
+# 외부 요청 지연 시간 예산 (소스별 p90을 넘기면 같은 요청을 한 번 더 보냄)
+REQUEST_TIMEOUT = 30  # 개별 요청 최대 대기 시간 (초)
+HEDGE_QUANTILE = 0.9  # 헤지 요청 기준 분위수
+HEDGE_DEFAULT_BUDGET = 5.0  # 기록이 부족할 때의 예산 (초)
+HEDGE_MIN_BUDGET = 0.5  # 예산 하한 (초)
+HEDGE_MIN_SAMPLES = 10  # 기록 기반 예산을 사용하기 위한 최소 표본 수
+LATENCY_DECAY = 0.95  # 실행마다 이전 기록에 곱하는 가중치
+
+# 지표 히스토리 설정 (data/history.sqlite3)
+HISTORY_STREAK_MIN = 3  # 요약문에 언급할 최소 연속 상승/하락 거래일 수
+HISTORY_EXTREME_YEARS = (3, 1)  # 요약문에 언급할 최고/최저 기간 (년)
+HISTORY_COVERAGE_SLACK_DAYS = 7  # 기간 시작 직후 휴장일을 감안한 기록 시작일 허용 범위 (일)
+
+# 증분 롤링 통계 설정 (data/rolling_stats.pkl, 52주 고가/저가, 이동평균, 변동성)
+ROLLING_MAX_GAP_DAYS = 10  # 저장된 상태를 이어 쓸 최대 경과일 (초과 시 전체 기간 다시 조회)
+
 # 시장 데이터 설정
 US_INDICES = {"S&P 500": "^GSPC", "NASDAQ": "^IXIC", "DOW": "^DJI"}
 US_TREASURIES = {"2년물": "^IRX", "10년물": "^TNX", "30년물": "^TYX"}
 KRX_INDICES = {"KOSPI": "1001", "KOSDAQ": "2001"}
 
+# 차트 설정
+CHART_WORKERS = None  # 차트 렌더링 프로세스 수 (None: CPU 코어 수)
+CHART_RENDERER = "mplfinance"  # "mplfinance" 또는 템플릿 재사용 방식인 "fast"
+CHART_CACHE_ENABLED = True  # 동일 데이터 차트 재사용 여부
+CHART_FORMAT = "png"  # 이미지 형식 ("png" 또는 "webp")
+CHART_DPI = 100  # 저장 해상도
+CHART_QUANTIZE_COLORS = None  # PNG 팔레트 양자화 색상 수 (예: 256, None이면 사용 안 함)
+CHART_WEBP_QUALITY = 80  # WebP 품질 (0~100)
+CHART_LAYOUT = "per_index"  # "per_index": 지수별 이미지, "composite": 전체 지수 한 장
+# 차트 캐시 (data/ 아래에 두어 커밋 대상인 reports/에 쌓이지 않도록 함)
+CHART_CACHE_DIR = os.path.join(DATA_DIR, "chart_cache")
+CHART_CACHE_MAX_AGE_DAYS = 30  # 마지막 사용 후 보관 기간 (일)
+CHART_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 전체 크기 상한 (오래 사용하지 않은 것부터 삭제)
+
 # 환율 설정
 CURRENCIES = ["USD/KRW", "EUR/KRW", "JPY/KRW", "CNY/KRW"]
 
@@ -57,14 +122,77 @@ def get_daily_image_path():
     return os.path.join(IMAGES_DIR, TODAY)
 
 
-def get_report_filepath(date=TODAY):
+def get_report_filepath(date=TODAY, extension="md"):
     """리포트 파일의 전체 경로를 반환"""
-    return os.path.join(REPORTS_DIR, REPORT_FILENAME_FORMAT.format(date=date))
+    return os.path.join(
+        REPORTS_DIR, REPORT_FILENAME_FORMAT.format(date=date, extension=extension)
+    )
+
+
+def get_run_summary_filepath(date=TODAY):
+    """실행 요약(JSON) 파일의 전체 경로를 반환 (리포트와 같은 디렉토리)"""
+    return os.path.join(REPORTS_DIR, RUN_SUMMARY_FILENAME_FORMAT.format(date=date))
+
+
+def get_profile_dirpath(date=TODAY):
+    """프로파일 결과 디렉토리 경로를 반환 (실행 시각별로 구분)"""
+    return os.path.join(PROFILES_DIR, f"{date}_{datetime.now().strftime('%H%M%S')}")
+
+
+def get_snapshot_dirpath():
+    """일별 지표 스냅샷 디렉토리 경로를 반환"""
+    return os.path.join(REPORTS_DIR, "metrics")
+
+
+def get_snapshot_filepath(date=TODAY):
+    """지표 스냅샷 파일의 전체 경로를 반환"""
+    return os.path.join(
+        get_snapshot_dirpath(), SNAPSHOT_FILENAME_FORMAT.format(date=date)
+    )
+
 
+def get_record_filepath(date=TODAY):
+    """수집 데이터 녹화 파일의 전체 경로를 반환"""
+    return os.path.join(RECORDS_DIR, RECORD_FILENAME_FORMAT.format(date=date))
 
-def get_image_filepath(market_name, date=TODAY):
+
+def get_data_dirpath(date=TODAY):
+    """날짜별 수집 데이터 디렉토리 경로를 반환"""
+    return os.path.join(DATA_DIR, date)
+
+
+def get_latency_history_filepath():
+    """소스별 응답 시간 히스토그램 파일 경로를 반환"""
+    return os.path.join(DATA_DIR, "latency_histograms.json")
+
+
+def get_render_cache_filepath(date=TODAY):
+    """섹션 렌더링 캐시 파일 경로를 반환 (날짜별 수집 데이터와 같은 디렉토리)"""
+    return os.path.join(get_data_dirpath(date), "render_cache.json")
+
+
+def get_history_db_filepath():
+    """종목별 일별 지표 히스토리 DB(SQLite) 경로를 반환"""
+    return os.path.join(DATA_DIR, "history.sqlite3")
+
+
+def get_rolling_state_filepath():
+    """종목별 증분 롤링 통계 상태 파일 경로를 반환"""
+    return os.path.join(DATA_DIR, "rolling_stats.pkl")
+
+
+def get_image_filepath(market_name, date=TODAY, extension=CHART_FORMAT):
     """이미지 파일의 전체 경로를 반환"""
     daily_path = os.path.join(IMAGES_DIR, date)
     return os.path.join(
-        daily_path, IMAGE_FILENAME_FORMAT.format(market_name=market_name)
+        daily_path,
+        IMAGE_FILENAME_FORMAT.format(market_name=market_name, extension=extension),
+    )
+
+
+def get_composite_image_filepath(date=TODAY, extension=CHART_FORMAT):
+    """전체 지수 통합 이미지 파일의 전체 경로를 반환"""
+    daily_path = os.path.join(IMAGES_DIR, date)
+    return os.path.join(
+        daily_path, COMPOSITE_IMAGE_FILENAME_FORMAT.format(extension=extension)
     )
@@ -1,7 +1,11 @@
+# 템플릿 버전: 섹션 렌더링 방식을 바꾸면 올려서 기존 렌더링 캐시를 무효화
+# (템플릿 문자열 자체의 변경은 캐시 키에 자동으로 반영됨)
+TEMPLATE_VERSION = 1
+
 # 마크다운 리포트 템플릿
 REPORT_TEMPLATE = """
 # {date} 시장 동향 리포트
-
+{chart_overview}
 ## 1. 한국 시장 동향
 {kr_market_summary}
 
@@ -33,10 +37,18 @@ MARKET_SECTION_TEMPLATE = """
 - 종가: {close:,.2f} ({change:+.2f}%)
 - 거래량: {volume:,}
 - 52주 최고가 대비: {year_high_ratio:.1f}%
+{chart}"""
 
+# 지수별 차트 이미지 템플릿
+MARKET_CHART_TEMPLATE = """
 ![{market_name} Price Movement]({image_path})
 """
 
+# 전체 지수 통합 차트 템플릿 (CHART_LAYOUT = "composite")
+COMPOSITE_CHART_TEMPLATE = """
+![주요 지수 가격 추이]({image_path})
+"""
+
 # 국채 수익률 섹션 템플릿
 TREASURY_SECTION_TEMPLATE = """
 ### {treasury_name}
@@ -1,4 +1,125 @@
-from src.report_generator import generate_daily_report
+import argparse
+from datetime import datetime
+from typing import List, Optional
+
+from config.settings import DATE_FORMAT
+from src.sections import SECTIONS
+
+
+def parse_sections(value: str) -> List[str]:
+    """쉼표로 구분된 섹션 목록 파싱"""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 섹션: {', '.join(unknown)} (사용 가능: {', '.join(SECTIONS)})"
+        )
+    return names
+
+
+def parse_formats(value: str) -> List[str]:
+    """쉼표로 구분된 리포트 출력 형식 목록 파싱 (지원 여부는 ReportGenerator에서 검증)"""
+    formats = [fmt.strip().lower() for fmt in value.split(",") if fmt.strip()]
+    if not formats:
+        raise argparse.ArgumentTypeError("출력 형식을 하나 이상 지정하세요 (예: md,html,json)")
+    return formats
+
+
+def parse_date(value: str) -> str:
+    """리포트 날짜 형식 검증"""
+    try:
+        datetime.strptime(value, DATE_FORMAT)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식 오류: {value} (예: 2025-01-31)")
+    return value
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="일일 시장 리포트 생성")
+    parser.add_argument(
+        "--sections",
+        type=parse_sections,
+        default=None,
+        help=f"실행할 섹션 (쉼표 구분, 기본값: 전체). 사용 가능: {', '.join(SECTIONS)}",
+    )
+    parser.add_argument(
+        "--date",
+        type=parse_date,
+        default=None,
+        help="리포트 날짜 YYYY-MM-DD (기본값: 오늘)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="차트 데이터 조회/렌더링 워커 수 (기본값: settings.CHART_WORKERS)",
+    )
+    parser.add_argument(
+        "--formats",
+        type=parse_formats,
+        default=None,
+        help="리포트 출력 형식 (쉼표 구분, md/html/json, 기본값: settings.REPORT_FORMATS)",
+    )
+    parser.add_argument(
+        "--no-charts", action="store_true", help="차트 데이터 조회 및 생성 생략"
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--cache-only",
+        action="store_true",
+        help="네트워크 수집 없이 해당 날짜에 저장된 데이터만 사용",
+    )
+    source.add_argument(
+        "--record",
+        action="store_true",
+        help="수집 데이터를 records/<날짜>_record.pkl.gz 녹화본으로 저장",
+    )
+    source.add_argument(
+        "--replay",
+        metavar="DATE_OR_PATH",
+        help="녹화본을 재생하여 네트워크 없이 리포트 재생성 (날짜 또는 파일 경로)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="체크포인트(data/<날짜>/)를 무시하고 모든 섹션을 새로 수집",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="단계별 cProfile 통계와 메모리 사용량을 profiles/ 에 저장",
+    )
+    args = parser.parse_args(argv)
+    if args.refresh and (args.cache_only or args.replay):
+        parser.error("--refresh는 --cache-only/--replay와 함께 사용할 수 없습니다")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> str:
+    args = parse_args(argv)
+
+    # 수집기 import 비용은 선택된 섹션에서만 발생
+    from src.report_generator import generate_daily_report
+
+    options = dict(
+        date=args.date,
+        sections=args.sections,
+        charts=not args.no_charts,
+        cache_only=args.cache_only,
+        profile=args.profile,
+        record=args.record,
+        replay=args.replay,
+        refresh=args.refresh,
+        formats=args.formats,
+    )
+    if args.workers is not None:
+        options["workers"] = args.workers
+
+    report_path = generate_daily_report(**options)
+    print(f"리포트 생성 완료: {report_path}")
+    return report_path
+
 
 if __name__ == "__main__":
-    generate_daily_report()
+    main()
@@ -1,10 +1,67 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta, timezone
-import pandas as pd
+from config.settings import DATE_FORMAT, HISTORY_STREAK_MIN, HISTORY_EXTREME_YEARS
 from config.templates import NEWS_TEMPLATE, CALENDAR_TEMPLATE
 
 
 class DataProcessor:
+    def __init__(self, date: Optional[str] = None, history: Optional[Any] = None):
+        """
+        Args:
+            date: 리포트 기준 날짜 (기본값: 실행 시점의 한국 날짜)
+                과거 날짜 리포트를 재생성할 때 같은 결과가 나오도록 기준일로 사용합니다.
+            history: 지표 히스토리 DB (src.history_db.HistoryDB, 없으면 히스토리 문맥 생략)
+        """
+        self.date = date
+        self.history = history
+
+    def build_history_context(
+        self, data: Dict[str, Dict[str, Any]], value_key: str
+    ) -> str:
+        """
+        히스토리 DB 기반 문맥 문장 생성 (연속 상승/하락, 최근 N년 최고/최저)
+
+        시세 종목의 기준일은 최신 봉의 거래일(trade_date)이며, 없으면 리포트 날짜를
+        사용합니다.
+
+        Args:
+            data: 종목별 데이터 ({종목 이름: {value_key: float, 'change': float, ...}})
+            value_key: 최고/최저를 판단할 값 (예: 'close', 'rate', 'yield_rate')
+
+        Returns:
+            str: 문맥 문장 (히스토리가 없거나 언급할 내용이 없으면 빈 문자열)
+        """
+        if self.history is None or not self.date:
+            return ""
+
+        notes = []
+        try:
+            for name, info in data.items():
+                date = info.get("trade_date") or self.date
+                streak = self.history.streak(name, "change", date)
+                if abs(streak) >= HISTORY_STREAK_MIN:
+                    direction = "상승" if streak > 0 else "하락"
+                    notes.append(f"{name} {abs(streak)}거래일 연속 {direction}")
+
+                value = info.get(value_key)
+                if value is None:
+                    continue
+                for higher, label in ((True, "최고"), (False, "최저")):
+                    years = self.history.extreme_years(
+                        name, value_key, value, date, HISTORY_EXTREME_YEARS, higher
+                    )
+                    if years:
+                        notes.append(f"{name} 최근 {years}년 중 {label} 수준")
+                        break
+        except Exception as e:
+            # 로거는 시작 시간에 영향이 있어 실패했을 때만 로드
+            from src.logger import logger
+
+            logger.warning(f"히스토리 문맥 생성 실패: {str(e)}")
+            return ""
+
+        return ", ".join(notes) + "." if notes else ""
+
     def process_us_market_data(self, data: Dict[str, Dict[str, Any]]) -> str:
         """
         미국 시장 데이터를 분석하여 요약 텍스트 생성
@@ -88,6 +145,11 @@ class DataProcessor:
             f"가장 큰 변화를 보였습니다."
         )
 
+        # 히스토리 DB 기반 문맥 (연속 상승/하락, 최근 N년 최고/최저)
+        context = self.build_history_context(data, "close")
+        if context:
+            summary = summary.strip() + "\n" + context
+
         return summary.strip()
 
     def process_kr_market_data(self, data: Dict[str, Dict[str, Any]]) -> str:
@@ -180,6 +242,11 @@ class DataProcessor:
                 f"큰 폭의 변동을 보였습니다."
             )
 
+        # 히스토리 DB 기반 문맥 (연속 상승/하락, 최근 N년 최고/최저)
+        context = self.build_history_context(data, "close")
+        if context:
+            summary = summary.strip() + "\n" + context
+
         return summary.strip()
 
     def process_us_treasury_data(self, data: Dict[str, Dict[str, Any]]) -> str:
@@ -270,6 +337,11 @@ class DataProcessor:
 
             summary.append(" ".join(term_summary))
 
+        # 히스토리 DB 기반 문맥 (연속 상승/하락, 최근 N년 최고/최저)
+        context = self.build_history_context(data, "yield_rate")
+        if context:
+            summary.append(context)
+
         return "\n\n".join(summary)
 
     def process_forex_data(self, data: Dict[str, Dict[str, Any]]) -> str:
@@ -373,6 +445,11 @@ class DataProcessor:
                 f"가장 큰 변동을 보였습니다."
             )
 
+        # 히스토리 DB 기반 문맥 (연속 상승/하락, 최근 N년 최고/최저)
+        context = self.build_history_context(data, "rate")
+        if context:
+            summary = summary.strip() + "\n" + context
+
         return summary.strip()
 
     def process_news_data(self, news_data: Dict[str, List[Dict[str, Any]]]) -> str:
@@ -428,10 +505,13 @@ class DataProcessor:
         if not calendar_data:
             return "예정된 주요 경제 지표가 없습니다."
 
-        # 현재 한국 시간
-        now_kst = datetime.now(timezone(timedelta(hours=9)))
-        target_date = now_kst.strftime("%Y-%m-%d")
-        next_date = (now_kst + timedelta(days=1)).strftime("%Y-%m-%d")
+        # 리포트 기준일 (지정되지 않으면 현재 한국 시간)
+        if self.date:
+            base_date = datetime.strptime(self.date, DATE_FORMAT)
+        else:
+            base_date = datetime.now(timezone(timedelta(hours=9)))
+        target_date = base_date.strftime("%Y-%m-%d")
+        next_date = (base_date + timedelta(days=1)).strftime("%Y-%m-%d")
 
         # 헤더 추가
         formatted = [f"{target_date} ~ {next_date} 경제 지표 일정\n"]
@@ -0,0 +1,145 @@
+import json
+import os
+import pickle
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import DATE_FORMAT, get_data_dirpath
+from src.logger import logger
+
+# 마지막 수집 실행의 섹션별 결과 (중단/실패한 실행을 이어서 수집할 때 사용)
+RUN_STATE_FILENAME = "_run.json"
+
+
+class DataStore:
+    """날짜별 수집 데이터 저장소
+
+    섹션별 수집 결과를 pickle 파일로 저장하여, 일부 섹션만 다시 수집하거나
+    네트워크 없이(--cache-only) 리포트를 다시 만들 때 재사용합니다.
+    """
+
+    def __init__(self, date: str, directory: Optional[str] = None):
+        """
+        Args:
+            date: 리포트 날짜
+            directory: 저장 디렉토리 (기본값: data/<날짜>)
+        """
+        self.date = date
+        self.directory = directory or get_data_dirpath(date)
+
+    def get_path(self, name: str) -> str:
+        """섹션 데이터 파일 경로"""
+        return os.path.join(self.directory, f"{name}.pkl")
+
+    def has(self, name: str) -> bool:
+        """저장된 섹션 데이터 존재 여부"""
+        return os.path.exists(self.get_path(name))
+
+    def save(self, name: str, data: Any) -> Optional[str]:
+        """섹션 데이터 저장
+
+        Returns:
+            Optional[str]: 저장 경로 (실패 시 None)
+        """
+        path = self.get_path(name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            logger.warning(f"수집 데이터 저장 실패 ({name}): {str(e)}")
+            return None
+
+    def load(self, name: str) -> Optional[Any]:
+        """섹션 데이터 로드 (없거나 읽을 수 없으면 None)"""
+        path = self.get_path(name)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"수집 데이터 로드 실패 ({name}): {str(e)}")
+            return None
+
+    def load_run_state(self) -> Dict[str, Any]:
+        """마지막 수집 실행 상태 (없거나 읽을 수 없으면 빈 딕셔너리)
+
+        Returns:
+            Dict[str, Any]: {"status": "running"|"complete"|"incomplete",
+                "sections": {섹션 이름: "ok"|"stale"|"failed"}}
+        """
+        path = os.path.join(self.directory, RUN_STATE_FILENAME)
+        if not os.path.exists(path):
+            return {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"수집 실행 상태 로드 실패: {str(e)}")
+            return {}
+
+    def save_run_state(self, state: Dict[str, Any]) -> Optional[str]:
+        """수집 실행 상태 저장 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            Optional[str]: 저장 경로 (실패 시 None)
+        """
+        path = os.path.join(self.directory, RUN_STATE_FILENAME)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            logger.warning(f"수집 실행 상태 저장 실패: {str(e)}")
+            return None
+
+    def list_sections(self) -> List[str]:
+        """저장된 섹션 이름 목록"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            os.path.splitext(name)[0]
+            for name in os.listdir(self.directory)
+            if name.endswith(".pkl")
+        )
+
+    def find_previous(
+        self, name: str, max_age_days: Optional[int] = None
+    ) -> Optional[Tuple[str, Any]]:
+        """이전 날짜에 저장된 가장 최근의 (비어 있지 않은) 섹션 데이터
+
+        Args:
+            name: 섹션 이름
+            max_age_days: 현재 날짜 기준 최대 경과일 (None이면 제한 없음)
+
+        Returns:
+            Optional[Tuple[str, Any]]: (수집 날짜, 데이터), 없으면 None
+        """
+        root = os.path.dirname(self.directory)
+        if not os.path.isdir(root):
+            return None
+
+        current = datetime.strptime(self.date, DATE_FORMAT)
+        dates = []
+        for entry in os.listdir(root):
+            try:
+                age = (current - datetime.strptime(entry, DATE_FORMAT)).days
+            except ValueError:
+                continue
+            if age > 0 and (max_age_days is None or age <= max_age_days):
+                dates.append(entry)
+
+        for date in sorted(dates, reverse=True):
+            data = DataStore(date, os.path.join(root, date)).load(name)
+            if data:
+                return date, data
+        return None
@@ -0,0 +1,454 @@
+"""
+일별 지표 히스토리 DB
+
+리포트마다 수집한 지표를 종목(지수, 국채, 통화쌍 등)별로 SQLite에 누적하고,
+(종목, 지표, 날짜) 기본 키 인덱스로 연속 상승/하락, N일 최고/최저, 기간 통계를
+조회합니다. DataProcessor는 이 결과로 "5거래일 연속 하락", "최근 3년 중 최고 수준"
+같은 문맥을 요약문에 추가합니다.
+
+시세 종목(DATED_SECTIONS)의 행은 리포트 날짜가 아니라 봉의 거래일(trade_date)을
+키로 저장하므로 휴장일에 다시 실행해도 같은 봉이 중복되지 않습니다. 수집기가
+조회한 일별 시계열(series_buffer)도 함께 저장하여, 리포트를 실행하지 않은 날을
+포함한 조회 기간 전체(LOOKBACK_DAYS)를 첫 실행부터 문맥에 사용합니다.
+
+실행:
+    python -m src.history_db --import-snapshots
+    python -m src.history_db --streak KOSPI
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import (
+    CURRENCIES,
+    DATE_FORMAT,
+    HISTORY_COVERAGE_SLACK_DAYS,
+    KRX_INDICES,
+    US_INDICES,
+    US_TREASURIES,
+    get_history_db_filepath,
+)
+from src.snapshot import KEY_SEPARATOR, flatten_metrics, list_snapshots, read_snapshot
+
+# 2: 시세 종목의 행을 리포트 날짜 대신 거래일 기준으로 저장
+HISTORY_SCHEMA_VERSION = 2
+
+# 최상위 키가 종목 이름인 섹션 (예: {"KOSPI": {...}, "KOSDAQ": {...}})
+# 나머지 섹션(버핏 지표)은 섹션 이름 자체를 종목으로 사용합니다.
+INSTRUMENT_SECTIONS = ("us_market", "kr_market", "us_treasury", "forex", "options")
+
+# 종목별 값에 봉의 거래일(trade_date)이 포함된 시세 섹션
+DATED_SECTIONS = ("us_market", "kr_market", "us_treasury", "forex")
+DATE_KEY = "trade_date"
+
+# 시세 종목 이름 (스키마 1에서 리포트 날짜로 저장된 행을 정리할 때 사용)
+DATED_INSTRUMENTS = (
+    *US_INDICES,
+    *KRX_INDICES,
+    *US_TREASURIES,
+    *CURRENCIES,
+)
+
+# 날짜 상한 (기준일을 지정하지 않은 조회)
+MAX_DATE = "9999-12-31"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    instrument TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (instrument, metric, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def section_rows(
+    section: str, data: Any, date: str
+) -> Iterable[Tuple[str, str, str, Optional[float]]]:
+    """섹션 데이터를 (종목, 지표, 날짜, 값) 행으로 변환
+
+    시세 섹션은 종목별 거래일(trade_date)을, 그 외에는 리포트 날짜(date)를 사용합니다.
+    """
+    if not data:
+        return
+    if section in INSTRUMENT_SECTIONS and isinstance(data, dict):
+        for instrument, values in data.items():
+            metrics, labels = flatten_metrics(values)
+            row_date = labels.get(DATE_KEY, date)
+            for metric, value in metrics.items():
+                yield str(instrument), metric, row_date, value
+    else:
+        metrics, _ = flatten_metrics(data)
+        for metric, value in metrics.items():
+            yield section, metric, date, value
+
+
+class SeriesBuffer:
+    """수집기가 조회한 종목별 일별 지표를 히스토리 DB에 저장하기 전까지 보관
+
+    수집기는 종목 이름과 (거래일, {지표: 값}) 목록을 넣기만 하고, 리포트 생성기가
+    히스토리 저장 단계에서 한 번에 꺼내 HistoryDB.record_series로 저장합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rows: List[Tuple[str, str, str, Optional[float]]] = []
+
+    def add(
+        self, instrument: str, series: Iterable[Tuple[str, Dict[str, float]]]
+    ) -> None:
+        rows = [
+            (instrument, metric, date, value)
+            for date, metrics in series
+            for metric, value in metrics.items()
+            if value is not None and not math.isnan(value)
+        ]
+        with self._lock:
+            self.rows.extend(rows)
+
+    def drain(self) -> List[Tuple[str, str, str, Optional[float]]]:
+        """보관 중인 행을 꺼내고 비움"""
+        with self._lock:
+            rows, self.rows = self.rows, []
+        return rows
+
+
+# 모든 수집기가 공유하는 프로세스 전역 시계열 버퍼
+series_buffer = SeriesBuffer()
+
+
+def shift_date(date: str, days: int) -> str:
+    """기준일에서 days일 이전 날짜"""
+    return (datetime.strptime(date, DATE_FORMAT) - timedelta(days=days)).strftime(
+        DATE_FORMAT
+    )
+
+
+class HistoryDB:
+    """종목별 일별 지표 저장소 (SQLite)
+
+    조회 함수는 모두 기준일(date) 이전(당일 포함) 기록만 사용하므로 과거 날짜
+    리포트를 다시 만들어도 그 날짜 기준의 결과가 나옵니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: DB 파일 경로 (기본값: settings.get_history_db_filepath())
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get_path(self) -> str:
+        return self.path or get_history_db_filepath()
+
+    def connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 호출 시 파일과 테이블 생성)"""
+        if self._conn is None:
+            path = self.get_path()
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """이전 스키마의 행 정리 후 스키마 버전 기록
+
+        스키마 1은 시세 종목도 리포트 날짜로 저장했으므로(미국 종목은 거래일보다
+        하루 늦고, 휴장일 실행은 같은 봉이 중복) 해당 행을 지우고 수집기 시계열로
+        다시 채웁니다.
+        """
+        rows = conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchall()
+        version = int(rows[0][0]) if rows else HISTORY_SCHEMA_VERSION
+        with conn:
+            if version < 2:
+                conn.executemany(
+                    "DELETE FROM metrics WHERE instrument = ?",
+                    [(name,) for name in DATED_INSTRUMENTS],
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(HISTORY_SCHEMA_VERSION),),
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self.connect().execute(sql, params).fetchall()
+
+    def record(self, date: str, sections: Dict[str, Any]) -> int:
+        """하루치 섹션 데이터 저장 (같은 날짜의 기존 값은 교체)
+
+        Args:
+            date: 리포트 날짜 (시세 섹션은 종목별 거래일 사용)
+            sections: {섹션 이름: 수집 데이터}
+
+        Returns:
+            int: 저장한 행 수
+        """
+        return self._write(
+            row
+            for section, data in sections.items()
+            for row in section_rows(section, data, date)
+        )
+
+    def record_series(
+        self, rows: Iterable[Tuple[str, str, str, Optional[float]]]
+    ) -> int:
+        """수집기가 조회한 일별 시계열 저장 (SeriesBuffer.drain 결과, 같은 거래일은 교체)
+
+        Returns:
+            int: 저장한 행 수
+        """
+        return self._write(rows)
+
+    def _write(self, rows: Iterable[Tuple[str, str, str, Optional[float]]]) -> int:
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metrics (instrument, metric, date, value) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def import_snapshots(self, directory: Optional[str] = None) -> int:
+        """저장된 지표 스냅샷(reports/metrics/)을 DB로 가져오기
+
+        Returns:
+            int: 가져온 날짜 수
+        """
+        imported = 0
+        for date, path in list_snapshots(directory):
+            snapshot = read_snapshot(path)
+            if snapshot is None:
+                continue
+
+            sections: Dict[str, Dict[str, Any]] = {}
+            labels = snapshot.get("labels", {})
+            for key, value in snapshot["metrics"].items():
+                section, _, rest = key.partition(KEY_SEPARATOR)
+                if section in snapshot.get("stale", {}):
+                    continue
+                if section in INSTRUMENT_SECTIONS:
+                    instrument, _, metric = rest.partition(KEY_SEPARATOR)
+                    prefix = KEY_SEPARATOR.join((section, instrument, ""))
+                    trade_date = labels.get(prefix + DATE_KEY)
+                    if section in DATED_SECTIONS and trade_date is None:
+                        # 거래일이 없는 이전 스냅샷의 시세는 날짜를 알 수 없으므로 제외
+                        continue
+                    values = sections.setdefault(section, {}).setdefault(
+                        instrument, {}
+                    )
+                    values[metric] = value
+                    if trade_date is not None:
+                        values[DATE_KEY] = trade_date
+                else:
+                    sections.setdefault(section, {})[rest] = value
+
+            if self.record(date, sections):
+                imported += 1
+        return imported
+
+    def value(
+        self, instrument: str, metric: str, date: Optional[str] = None
+    ) -> Optional[float]:
+        """기준일 이전(당일 포함) 가장 최근 값"""
+        rows = self._query(
+            "SELECT value FROM metrics WHERE instrument = ? AND metric = ? "
+            "AND date <= ? AND value IS NOT NULL ORDER BY date DESC LIMIT 1",
+            (instrument, metric, date or MAX_DATE),
+        )
+        return rows[0][0] if rows else None
+
+    def series(
+        self,
+        instrument: str,
+        metric: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """기간 내 (날짜, 값) 목록 (날짜 오름차순)"""
+        return self._query(
+            "SELECT date, value FROM metrics WHERE instrument = ? AND metric = ? "
+            "AND date >= ? AND date <= ? AND value IS NOT NULL ORDER BY date",
+            (instrument, metric, start or "", end or MAX_DATE),
+        )
+
+    def first_date(self, instrument: str, metric: str) -> Optional[str]:
+        """가장 오래된 기록 날짜"""
+        rows = self._query(
+            "SELECT MIN(date) FROM metrics WHERE instrument = ? AND metric = ? "
+            "AND value IS NOT NULL",
+            (instrument, metric),
+        )
+        return rows[0][0] if rows else None
+
+    def streak(
+        self, instrument: str, metric: str = "change", date: Optional[str] = None
+    ) -> int:
+        """기준일까지 같은 부호가 이어진 기록 수
+
+        시세 종목은 거래일 기준으로 저장되고 수집기 시계열로 리포트를 만들지 않은
+        날도 채워지므로 연속 거래일 수가 됩니다.
+
+        Returns:
+            int: 연속 양수이면 +N, 연속 음수이면 -N, 최근 값이 0이거나 없으면 0
+        """
+        date = date or MAX_DATE
+        latest = self.value(instrument, metric, date)
+        if not latest:
+            return 0
+
+        sign = 1 if latest > 0 else -1
+        condition = "value <= 0" if sign > 0 else "value >= 0"
+        rows = self._query(
+            f"SELECT MAX(date) FROM metrics WHERE instrument = ? AND metric = ? "
+            f"AND date <= ? AND value IS NOT NULL AND {condition}",
+            (instrument, metric, date),
+        )
+        broken = rows[0][0] or ""
+        rows = self._query(
+            "SELECT COUNT(*) FROM metrics WHERE instrument = ? AND metric = ? "
+            "AND date <= ? AND date > ? AND value IS NOT NULL",
+            (instrument, metric, date, broken),
+        )
+        return sign * rows[0][0]
+
+    def last_beyond(
+        self,
+        instrument: str,
+        metric: str,
+        value: float,
+        date: Optional[str] = None,
+        higher: bool = True,
+    ) -> Optional[str]:
+        """기준일 이전(당일 제외)에 value 이상(higher=False이면 이하)이었던 마지막 날짜
+
+        None이면 기록된 기간 전체에서 value가 최고(최저)입니다.
+        """
+        operator = ">=" if higher else "<="
+        rows = self._query(
+            f"SELECT MAX(date) FROM metrics WHERE instrument = ? AND metric = ? "
+            f"AND date < ? AND value {operator} ?",
+            (instrument, metric, date or MAX_DATE, value),
+        )
+        return rows[0][0]
+
+    def rolling(
+        self, instrument: str, metric: str, days: int, date: str
+    ) -> Dict[str, Optional[float]]:
+        """기준일까지 최근 days일 통계 (평균, 표준편차, 최고, 최저, 기록 수, 기준일 값의 백분위)
+
+        표준편차는 저장소의 다른 통계와 같이 표본 표준편차(ddof=1)이며 기록이
+        2개 미만이면 None입니다.
+        """
+        start = shift_date(date, days)
+        rows = self._query(
+            "SELECT COUNT(value), AVG(value), AVG(value * value), MIN(value), MAX(value) "
+            "FROM metrics WHERE instrument = ? AND metric = ? AND date > ? AND date <= ?",
+            (instrument, metric, start, date),
+        )
+        count, mean, mean_square, minimum, maximum = rows[0]
+        result = {
+            "count": count,
+            "mean": mean,
+            "std": None,
+            "min": minimum,
+            "max": maximum,
+            "percentile": None,
+        }
+        if not count:
+            return result
+
+        if count > 1:
+            variance = (mean_square - mean * mean) * count / (count - 1)
+            result["std"] = math.sqrt(max(variance, 0.0))
+        current = self.value(instrument, metric, date)
+        if current is not None:
+            rows = self._query(
+                "SELECT COUNT(*) FROM metrics WHERE instrument = ? AND metric = ? "
+                "AND date > ? AND date <= ? AND value <= ?",
+                (instrument, metric, start, date, current),
+            )
+            result["percentile"] = rows[0][0] / count * 100
+        return result
+
+    def extreme_years(
+        self,
+        instrument: str,
+        metric: str,
+        value: float,
+        date: str,
+        years: Iterable[int],
+        higher: bool = True,
+    ) -> Optional[int]:
+        """value가 최고(최저)인 가장 긴 기간 (년, 기록이 그 기간을 덮는 경우만)
+
+        기간 시작 직후가 주말/휴장일이어도 기록이 덮는 것으로 보도록 첫 기록이
+        시작일 이후 HISTORY_COVERAGE_SLACK_DAYS일 이내이면 허용합니다.
+
+        예: years=(3, 1)에서 3을 반환하면 "최근 3년 중 최고"
+        """
+        first = self.first_date(instrument, metric)
+        if first is None:
+            return None
+
+        last = self.last_beyond(instrument, metric, value, date, higher)
+        for year in sorted(years, reverse=True):
+            start = shift_date(date, 365 * year)
+            covered = first <= shift_date(start, -HISTORY_COVERAGE_SLACK_DAYS)
+            if covered and (last is None or last < start):
+                return year
+        return None
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="일별 지표 히스토리 DB")
+    parser.add_argument(
+        "--import-snapshots",
+        action="store_true",
+        help="reports/metrics/ 스냅샷을 DB로 가져오기",
+    )
+    parser.add_argument("--streak", metavar="INSTRUMENT", help="종목의 연속 상승/하락 조회")
+    parser.add_argument("--metric", default="change", help="조회할 지표 (기본값: change)")
+    args = parser.parse_args(argv)
+
+    db = HistoryDB()
+    if args.import_snapshots:
+        print(f"스냅샷 {db.import_snapshots()}일 가져오기 완료: {db.get_path()}")
+    if args.streak:
+        print(f"{args.streak} {args.metric}: {db.streak(args.streak, args.metric):+d}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
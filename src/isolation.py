@@ -0,0 +1,144 @@
+import contextvars
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class SourceTimeoutError(TimeoutError):
+    """수집기가 제한 시간 안에 끝나지 않은 경우"""
+
+
+class CollectCancelledError(SourceTimeoutError):
+    """제한 시간이 지나 취소된 수집기가 작업을 계속하려는 경우"""
+
+
+class EmptyResultError(RuntimeError):
+    """수집기가 결과 없이(None, 또는 빈 결과를 허용하지 않는 수집기의 빈 값) 끝난 경우"""
+
+
+# 현재 수집기의 취소 신호 (제한 시간이 지나면 설정됨)
+_cancel_event = contextvars.ContextVar("collect_cancel", default=None)
+
+
+def cancel_requested() -> bool:
+    """현재 수집기의 제한 시간이 지나 취소가 요청되었는지 여부"""
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def check_cancelled():
+    """취소가 요청된 수집기이면 CollectCancelledError 발생
+
+    수집기는 외부 요청이나 긴 작업 사이에 호출하여, 제한 시간이 지난 뒤에도
+    남은 요청을 계속 보내거나 브라우저 같은 자원을 붙잡고 있지 않도록 합니다.
+    수집기가 새 스레드에서 작업하는 경우 contextvars.copy_context()로 취소
+    신호를 전달해야 합니다.
+
+    Raises:
+        CollectCancelledError: 취소가 요청된 경우
+    """
+    if cancel_requested():
+        raise CollectCancelledError("제한 시간 초과로 수집 취소")
+
+
+def call_with_deadline(func: Callable[[], Any], timeout: Optional[float]) -> Any:
+    """제한 시간 안에 함수 실행
+
+    별도 데몬 스레드에서 실행하므로 시간 초과된 수집기가 남아 있어도
+    리포트 생성이나 프로세스 종료를 막지 않습니다. 시간이 초과되면 취소 신호를
+    설정하므로 check_cancelled()를 호출하는 수집기(외부 요청, 경제 지표
+    크롤러)는 다음 확인 지점에서 자원을 정리하고 종료합니다.
+
+    Raises:
+        SourceTimeoutError: 제한 시간 초과
+    """
+    if timeout is None:
+        return func()
+
+    result = {}
+    cancel = threading.Event()
+
+    def target():
+        _cancel_event.set(cancel)
+        try:
+            result["value"] = func()
+        except BaseException as e:
+            result["error"] = e
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run, args=(target,), name="collector", daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+
+    if thread.is_alive():
+        cancel.set()
+        raise SourceTimeoutError(f"제한 시간 {timeout:.0f}초 초과")
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """재시도 대기 시간 (지수 증가 + 지터, 상한 적용)"""
+    return min(maximum, base * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+def run_isolated(
+    func: Callable[[], Any],
+    timeout: Optional[float],
+    retries: int,
+    backoff: float,
+    max_backoff: float,
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    allow_empty: bool = False,
+) -> Any:
+    """수집 함수를 제한 시간/재시도 경계 안에서 실행
+
+    예외, 시간 초과, 결과 없음(None)을 실패로 보고 재시도합니다. 대부분의 수집기는
+    내부 오류 시 빈 값을 반환하므로 빈 목록이나 딕셔너리도 실패로 보며,
+    allow_empty=True인 수집기(예: 그날 예정된 경제 지표가 없을 수 있음)만 빈 결과를
+    정상 결과로 그대로 반환합니다.
+    재시도를 포함한 전체 실행이 timeout 안에 끝나야 하며, 남은 시간보다 긴 대기는
+    하지 않습니다.
+
+    Args:
+        func: 수집 함수
+        timeout: 재시도를 포함한 제한 시간 (초, None이면 제한 없이 현재 스레드에서 실행)
+        retries: 최대 재시도 횟수
+        backoff: 첫 재시도 대기 시간 (초)
+        max_backoff: 재시도 대기 시간 상한 (초)
+        on_retry: 재시도 직전 호출 (시도 번호, 실패 원인, 대기 시간)
+        allow_empty: 빈 결과(빈 목록/딕셔너리)를 정상 결과로 볼지 여부
+
+    Raises:
+        Exception: 마지막 실패 원인 (SourceTimeoutError, EmptyResultError 포함)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    attempt = 0
+
+    while True:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        try:
+            result = call_with_deadline(func, remaining)
+            if result is not None and (allow_empty or result):
+                return result
+            error = EmptyResultError("결과 없음" if result is None else "빈 결과")
+        except SourceTimeoutError:
+            raise
+        except Exception as e:
+            error = e
+
+        attempt += 1
+        if attempt > retries:
+            raise error
+
+        delay = backoff_delay(attempt, backoff, max_backoff)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            raise error
+
+        if on_retry:
+            on_retry(attempt, error, delay)
+        time.sleep(delay)
@@ -0,0 +1,399 @@
+"""
+로그 분석 도구
+
+월별 로그 파일(logs/market_report_YYYYMM.log, .jsonl)을 한 줄씩 읽어
+단계별 소요 시간 분위수(p50/p90/p99)와 실패율을 기간별로 집계합니다.
+기존 텍스트 로그와 JSON Lines 로그를 함께 읽을 수 있으며, 소요 시간이 기록되지 않은
+예전 텍스트 로그는 직전 단계가 끝난 시각과의 차이로 단계 소요 시간을 추정합니다.
+
+실행:
+    python -m src.log_analysis
+    python -m src.log_analysis logs/ --period week --stage collect.
+    python -m src.log_analysis --since 2025-01 --json
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from config.settings import LOGS_DIR
+from src.sections import SECTIONS
+
+# 실패로 보는 단계 상태 (빈 결과 "empty"는 정상 수집)
+FAILED_STATUSES = ("error", "stale")
+
+TEXT_LINE = re.compile(
+    r"^\[(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (?P<level>[A-Z]+) - (?P<message>.*)$"
+)
+STAGE_END = re.compile(
+    r"^단계 종료: (?P<stage>\S+) status=(?P<status>\S+) "
+    r"seconds=(?P<seconds>[\d.]+) rows=(?P<rows>\d+)"
+)
+LEGACY_COLLECT = re.compile(r"^(?P<label>.+?) 데이터 수집 (?P<result>완료|실패)(?::\s*(?P<details>.*))?$")
+LEGACY_PROCESS = re.compile(r"^처리 단계 '(?P<label>.+?) 분석' (?P<result>완료|실패)")
+DETAIL_SECONDS = re.compile(r"(?P<seconds>\d+\.\d+)s")
+
+# 섹션 라벨(로그 문구) → 섹션 이름
+LABELS = {section["label"]: name for name, section in SECTIONS.items()}
+
+
+def iter_log_files(paths: Iterable[str]) -> List[str]:
+    """분석할 로그 파일 목록 (디렉토리는 월별/회전 로그 파일을 모두 포함, 시간순)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += glob.glob(os.path.join(path, "market_report_*.log*"))
+            files += glob.glob(os.path.join(path, "market_report_*.jsonl*"))
+        elif os.path.exists(path):
+            files.append(path)
+
+    def sort_key(path: str):
+        # 회전된 파일(.log.1 등)은 숫자가 클수록 오래된 파일
+        name = os.path.basename(path)
+        suffix = name.rsplit(".", 1)[-1]
+        rotation = int(suffix) if suffix.isdigit() else 0
+        return (name.split(".", 1)[0], -rotation)
+
+    return sorted(set(files), key=sort_key)
+
+
+def parse_json_line(line: str) -> Optional[Dict[str, Any]]:
+    """JSON 로그 레코드를 이벤트로 변환"""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+
+    ts = datetime.fromisoformat(entry["ts"])
+    if entry.get("event") == "stage_end":
+        return {
+            "type": "stage",
+            "ts": ts,
+            "run_id": entry.get("run_id"),
+            "stage": entry["stage"],
+            "status": entry.get("status"),
+            "seconds": entry.get("duration"),
+        }
+    return {
+        "type": "log",
+        "ts": ts,
+        "run_id": entry.get("run_id"),
+        "stage": entry.get("stage"),
+        "level": entry.get("level"),
+        "message": entry.get("message", ""),
+    }
+
+
+class TextLogParser:
+    """텍스트 로그를 이벤트로 변환
+
+    단계 종료 레코드가 있는 실행은 그 값을 사용하고, 예전 로그는
+    "<라벨> 데이터 수집 완료/실패", "처리 단계 '<라벨> 분석' 완료/실패" 문구와
+    직전 단계가 끝난 시각과의 차이로 단계를 복원합니다.
+    """
+
+    def __init__(self, name: str = "text"):
+        """
+        Args:
+            name: 실행 ID 접두사 (파일 이름, 텍스트 로그에는 실행 ID가 없음)
+        """
+        self.name = name
+        self.stage_started: Optional[datetime] = None  # 예전 로그의 현재 단계 시작 추정 시각
+        self.structured = False
+        self.run = 0
+
+    @property
+    def run_id(self) -> str:
+        return f"{self.name}#{self.run}"
+
+    def parse(self, line: str) -> Optional[Dict[str, Any]]:
+        match = TEXT_LINE.match(line)
+        if not match:
+            return None  # traceback 등 여러 줄 메시지의 나머지 줄
+
+        ts = datetime.strptime(match["ts"], "%Y-%m-%d %H:%M:%S")
+        level, message = match["level"], match["message"]
+
+        if message.startswith("데이터 수집 시작"):
+            self.run += 1
+            self.structured = False
+            self.stage_started = ts
+            return {"type": "run_start", "ts": ts, "run_id": self.run_id}
+        if message.startswith("데이터 처리 시작"):
+            self.stage_started = ts
+
+        run_id = self.run_id
+        stage_end = STAGE_END.match(message)
+        if stage_end:
+            self.structured = True
+            return {
+                "type": "stage",
+                "ts": ts,
+                "run_id": run_id,
+                "stage": stage_end["stage"],
+                "status": stage_end["status"],
+                "seconds": float(stage_end["seconds"]),
+            }
+
+        if not self.structured:
+            event = self._legacy_stage(message, ts, run_id)
+            if event:
+                self.stage_started = ts
+                return event
+
+        return {
+            "type": "log",
+            "ts": ts,
+            "run_id": run_id,
+            "stage": None,
+            "level": level,
+            "message": message,
+        }
+
+    def _legacy_stage(
+        self,
+        message: str,
+        ts: datetime,
+        run_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """예전 형식의 수집/처리 완료 문구를 단계 이벤트로 변환"""
+        stage = status = seconds = None
+
+        collect = LEGACY_COLLECT.match(message)
+        process = LEGACY_PROCESS.match(message)
+        if collect and collect["label"] in LABELS:
+            stage = f"collect.{LABELS[collect['label']]}"
+            status = "ok" if collect["result"] == "완료" else "error"
+            detail = DETAIL_SECONDS.search(collect["details"] or "")
+            seconds = float(detail["seconds"]) if detail else None
+        elif process and process["label"] in LABELS:
+            stage = f"process.{LABELS[process['label']]}"
+            status = "ok" if process["result"] == "완료" else "error"
+        elif message.startswith("차트 생성 완료") or message.startswith("일부 차트 생성 실패"):
+            stage = "charts.render"
+            status = "ok" if message.startswith("차트") else "error"
+        else:
+            return None
+
+        if seconds is None and self.stage_started is not None:
+            seconds = (ts - self.stage_started).total_seconds()
+
+        return {
+            "type": "stage",
+            "ts": ts,
+            "run_id": run_id,
+            "stage": stage,
+            "status": status,
+            "seconds": seconds,
+        }
+
+
+def iter_events(files: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """로그 파일을 한 줄씩 읽어 이벤트 생성 (파일 전체를 메모리에 올리지 않음)"""
+    for path in files:
+        parser = TextLogParser(os.path.basename(path))
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+                if line.startswith("{"):
+                    event = parse_json_line(line)
+                else:
+                    event = parser.parse(line)
+                if event:
+                    yield event
+
+
+def parse_since(value: str) -> datetime:
+    """YYYY-MM 또는 YYYY-MM-DD 형식의 시작 시점"""
+    if len(value) == 7:
+        value = f"{value}-01"
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def period_key(ts: datetime, period: str) -> str:
+    """집계 기간 이름"""
+    if period == "day":
+        return ts.strftime("%Y-%m-%d")
+    if period == "week":
+        year, week, _ = ts.isocalendar()
+        return f"{year}-W{week:02d}"
+    return ts.strftime("%Y-%m")
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """선형 보간 분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class StageStats:
+    """단계별 소요 시간/실패/에러 로그 집계"""
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self.runs = 0
+        self.failures = 0
+        self.errors = 0
+
+    def add(self, event: Dict[str, Any]):
+        self.runs += 1
+        if event["status"] in FAILED_STATUSES:
+            self.failures += 1
+        if event["seconds"] is not None:
+            self.durations.append(float(event["seconds"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "failure_rate": self.failures / self.runs if self.runs else 0.0,
+            "errors": self.errors,
+            "p50": percentile(self.durations, 50),
+            "p90": percentile(self.durations, 90),
+            "p99": percentile(self.durations, 99),
+            "max": max(self.durations) if self.durations else None,
+        }
+
+
+def analyze(
+    files: Iterable[str],
+    period: str = "month",
+    stage_prefix: str = "",
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """단계별/기간별 소요 시간 분위수와 실패율 집계
+
+    Args:
+        files: 로그 파일 목록
+        period: 기간 단위 ("month", "week", "day")
+        stage_prefix: 집계할 단계 이름 접두사 (예: "collect.")
+        since: 이 시점(YYYY-MM 또는 YYYY-MM-DD) 이후 로그만 집계
+    """
+    since_ts = parse_since(since) if since else None
+    overall: Dict[str, StageStats] = defaultdict(StageStats)
+    by_period: Dict[str, Dict[str, StageStats]] = defaultdict(lambda: defaultdict(StageStats))
+    runs = set()
+    # 텍스트 로그의 에러는 다음에 끝나는 단계에 귀속
+    pending_errors: Dict[str, int] = defaultdict(int)
+
+    for event in iter_events(files):
+        if since_ts and event["ts"] < since_ts:
+            continue
+        runs.add(event["run_id"])
+
+        if event["type"] == "log":
+            if event["level"] == "ERROR":
+                if event["stage"]:
+                    if event["stage"].startswith(stage_prefix):
+                        overall[event["stage"]].errors += 1
+                        by_period[period_key(event["ts"], period)][event["stage"]].errors += 1
+                else:
+                    pending_errors[event["run_id"]] += 1
+            continue
+
+        if event["type"] != "stage":
+            continue
+
+        errors = pending_errors.pop(event["run_id"], 0)
+        if not event["stage"].startswith(stage_prefix):
+            continue
+
+        key = period_key(event["ts"], period)
+        for stats in (overall[event["stage"]], by_period[key][event["stage"]]):
+            stats.add(event)
+            stats.errors += errors
+
+    return {
+        "runs": len(runs),
+        "stages": {name: stats.to_dict() for name, stats in sorted(overall.items())},
+        "periods": {
+            key: {name: stats.to_dict() for name, stats in sorted(stages.items())}
+            for key, stages in sorted(by_period.items())
+        },
+    }
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def print_report(result: Dict[str, Any], slow: float, flaky: float):
+    """단계별 표와 기간별 추이 출력 (느린/불안정한 소스 표시)"""
+    print(f"분석한 실행 수: {result['runs']}")
+    print(
+        f"\n{'단계':<28}{'실행':>6}{'실패율':>8}{'에러':>6}"
+        f"{'p50(s)':>9}{'p90(s)':>9}{'p99(s)':>9}  표시"
+    )
+    stages = sorted(
+        result["stages"].items(), key=lambda item: -(item[1]["p90"] or 0)
+    )
+    for name, stats in stages:
+        flags = []
+        if stats["p90"] is not None and stats["p90"] >= slow:
+            flags.append("느림")
+        if stats["failure_rate"] >= flaky:
+            flags.append("불안정")
+        print(
+            f"{name:<28}{stats['runs']:>6}{stats['failure_rate']:>8.0%}{stats['errors']:>6}"
+            f"{_seconds(stats['p50']):>9}{_seconds(stats['p90']):>9}{_seconds(stats['p99']):>9}"
+            f"  {' '.join(flags)}"
+        )
+
+    periods = list(result["periods"])
+    print("\n기간별 추이 (p90 초 / 실패율)")
+    print(f"{'단계':<28}" + "".join(f"{key:>14}" for key in periods))
+    for name, _ in stages:
+        cells = []
+        for key in periods:
+            stats = result["periods"][key].get(name)
+            cell = (
+                f"{_seconds(stats['p90'])}/{stats['failure_rate']:.0%}" if stats else "-"
+            )
+            cells.append(f"{cell:>14}")
+        print(f"{name:<28}" + "".join(cells))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="로그 분석: 단계별 소요 시간 분위수와 실패율")
+    parser.add_argument("paths", nargs="*", default=[LOGS_DIR], help="로그 파일 또는 디렉토리")
+    parser.add_argument(
+        "--period", choices=("month", "week", "day"), default="month", help="집계 기간 단위"
+    )
+    parser.add_argument("--stage", default="", help="단계 이름 접두사 (예: collect.)")
+    parser.add_argument("--since", help="이 날짜 이후만 집계 (YYYY-MM 또는 YYYY-MM-DD)")
+    parser.add_argument(
+        "--slow", type=float, default=5.0, help="느린 단계로 표시할 p90 기준 (초)"
+    )
+    parser.add_argument(
+        "--flaky", type=float, default=0.1, help="불안정한 단계로 표시할 실패율 기준"
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    files = iter_log_files(args.paths)
+    if not files:
+        print("분석할 로그 파일이 없습니다.", file=sys.stderr)
+        return
+
+    result = analyze(files, args.period, args.stage, args.since)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    print_report(result, args.slow, args.flaky)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,282 @@
+import atexit
+import copy
 import logging
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Optional
-import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
+from config.settings import LOGS_DIR, LOG_FORMAT
+
+
+def count_rows(data: Any) -> int:
+    """수집 결과의 행 수 계산
+
+    DataFrame은 행 수, 스칼라 값만 가진 dict는 1행, 중첩 컬렉션은 하위 항목의
+    행 수 합계로 셉니다.
+    """
+    if data is None:
+        return 0
+
+    shape = getattr(data, "shape", None)
+    if shape:
+        return int(shape[0])
+
+    if isinstance(data, dict):
+        items = list(data.values())
+    elif isinstance(data, (list, tuple)):
+        items = list(data)
+    else:
+        return 1
+
+    nested = [
+        count_rows(item)
+        for item in items
+        if isinstance(item, (dict, list, tuple)) or getattr(item, "shape", None)
+    ]
+    if nested:
+        return sum(nested)
+    return 1 if isinstance(data, dict) else len(items)
+
+
+class RunMetrics:
+    """실행 단위의 단계별 소요 시간과 I/O 지표 집계
+
+    단계(stage)는 "collect.us_market", "process.forex"처럼 이름으로 구분하며,
+    단계 안에서 기록한 행 수/바이트/캐시 적중/재시도 횟수는 현재 단계에 합산됩니다.
+    """
+
+    COUNTERS = ("rows", "bytes", "cache_hits", "retries", "hedges")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, **run_info):
+        """새 실행 시작 (이전 집계 초기화)
+
+        Args:
+            run_info: 요약에 함께 기록할 실행 정보 (날짜, 섹션 등)
+        """
+        self.run_info = dict(run_info)
+        self.run_id = os.urandom(6).hex()
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.current: Optional[str] = None
+
+    def get_stage(self, name: str) -> Dict[str, Any]:
+        """단계 기록 반환 (없으면 생성)"""
+        with self._lock:
+            if name not in self.stages:
+                self.stages[name] = {
+                    "seconds": 0.0,
+                    "status": None,
+                    **{counter: 0 for counter in self.COUNTERS},
+                }
+            return self.stages[name]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        """단계 소요 시간 측정
+
+        예외가 발생하면 status를 "error"로, 그 외에는 단계 안에서 지정한 값이
+        없을 때 "ok"로 기록합니다.
+        """
+        record = self.get_stage(name)
+        previous, self.current = self.current, name
+        started = time.perf_counter()
+        try:
+            yield record
+        except Exception:
+            record["status"] = "error"
+            raise
+        finally:
+            record["seconds"] += time.perf_counter() - started
+            record["status"] = record["status"] or "ok"
+            self.current = previous
+
+    def add(self, counter: str, amount: int = 1, stage: Optional[str] = None):
+        """현재(또는 지정한) 단계의 카운터 증가"""
+        record = self.get_stage(stage or self.current or "run")
+        with self._lock:
+            record[counter] += amount
+
+    def describe(self, name: str) -> str:
+        """로그 메시지용 단계 요약 문자열"""
+        record = self.stages.get(name)
+        if not record:
+            return ""
+        parts = [f"{record['seconds']:.2f}s"]
+        parts += [
+            f"{counter}={record[counter]}"
+            for counter in self.COUNTERS
+            if record[counter]
+        ]
+        return ", ".join(parts)
+
+    def summary(self, status: str = "ok", **extra) -> Dict[str, Any]:
+        """실행 요약 생성"""
+        totals = {
+            counter: sum(record[counter] for record in self.stages.values())
+            for counter in self.COUNTERS
+        }
+        return {
+            "run_id": self.run_id,
+            **self.run_info,
+            **extra,
+            "status": status,
+            "started_at": self.started_at,
+            "total_seconds": round(time.perf_counter() - self._started, 3),
+            "totals": totals,
+            "stages": {
+                name: {**record, "seconds": round(record["seconds"], 3)}
+                for name, record in self.stages.items()
+            },
+        }
+
+    def write_summary(self, path: str, status: str = "ok", **extra) -> str:
+        """실행 요약을 JSON 파일로 저장
+
+        Returns:
+            str: 저장 경로
+        """
+        import json
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                self.summary(status, **extra), f, ensure_ascii=False, indent=2
+            )
+        return path
+
+
+# JSON 로그 레코드에 포함하는 구조화 필드
+LOG_FIELDS = ("event", "status", "source", "duration", "rows")
+
+
+class RecordQueueHandler(QueueHandler):
+    """로그 레코드를 큐에 넣기만 하는 핸들러
+
+    메시지 문자열과 예외 traceback만 미리 만들어 두고, 포맷팅과 파일/콘솔 출력은
+    QueueListener 스레드에서 처리합니다. 프로세스 간 큐로 전달할 수 있도록
+    pickle 할 수 없는 args/exc_info는 제거합니다.
+    실행 ID와 현재 단계는 로그를 남기는 시점의 값으로 기록합니다.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, queue: Any, metrics: "RunMetrics"):
+        super().__init__(queue)
+        self.metrics = metrics
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.run_id = self.metrics.run_id
+        if getattr(record, "stage", None) is None:
+            record.stage = self.metrics.current
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+
+class JsonLogFormatter(logging.Formatter):
+    """JSON Lines 로그 포맷 (한 줄에 레코드 하나)
+
+    모든 레코드에 시각, 레벨, 실행 ID, 단계, 메시지를 기록하고 단계 종료
+    레코드에는 소스, 상태, 소요 시간(초), 행 수를 함께 기록합니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        import json
+
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "run_id": getattr(record, "run_id", None),
+            "stage": getattr(record, "stage", None),
+            "message": record.getMessage(),
+        }
+        for field in LOG_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def get_log_filename(log_format: str = LOG_FORMAT) -> str:
+    """월별 로그 파일 이름 (JSON 형식은 .jsonl)"""
+    extension = "jsonl" if log_format == "json" else "log"
+    return f"market_report_{datetime.now().strftime('%Y%m')}.{extension}"
 
 
 class MarketReportLogger:
-    """시장 리포트 생성 관련 로깅을 처리하는 클래스"""
+    """시장 리포트 생성 관련 로깅을 처리하는 클래스
+
+    로그를 남기는 스레드는 레코드를 큐에 넣기만 하고, 백그라운드 리스너 스레드
+    하나가 포맷팅과 파일/콘솔 출력을 담당합니다. 큐는 multiprocessing.Queue이며,
+    워커 프로세스(차트 렌더링 등)는 init_worker_logging을 프로세스 풀 initializer로
+    지정하면 fork/spawn 방식과 관계없이 같은 리스너로 로그를 보냅니다.
+    """
 
     def __init__(self, log_directory: Optional[str] = None):
         """
         Args:
-            log_directory: 로그 파일을 저장할 디렉토리 (기본값: project_root/logs)
+            log_directory: 로그 파일을 저장할 디렉토리 (기본값: settings.LOGS_DIR)
+
+        핸들러와 로그 파일은 첫 로그 기록 시점에 생성되므로 모듈 import만으로는
+        파일을 열지 않습니다.
         """
+        self.log_directory = log_directory or LOGS_DIR
+        self._logger: Optional[logging.Logger] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+        self._atexit_registered = False
+        self._setup_lock = threading.Lock()
+        self.metrics = RunMetrics()
+
+    @property
+    def logger(self) -> logging.Logger:
+        """첫 사용 시 핸들러를 설정한 로거 반환"""
+        if self._logger is None:
+            with self._setup_lock:
+                if self._logger is None:
+                    self._logger = self._setup_logger()
+        return self._logger
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        """리스너가 출력하는 파일/콘솔 핸들러"""
+        self.logger
+        return self._listener.handlers if self._listener else ()
+
+    def _setup_logger(self) -> logging.Logger:
+        """큐 핸들러와 파일/콘솔 출력 리스너 설정"""
         # 로그 디렉토리 설정
-        self.log_directory = log_directory or os.path.join(project_root, "logs")
         os.makedirs(self.log_directory, exist_ok=True)
 
         # 로거 생성
-        self.logger = logging.getLogger("MarketReport")
-        self.logger.setLevel(logging.DEBUG)
+        logger = logging.getLogger("MarketReport")
+        logger.setLevel(logging.DEBUG)
 
-        # 이미 핸들러가 설정되어 있다면 초기화
-        if self.logger.handlers:
-            self.logger.handlers.clear()
+        # 이전 설정(로그 디렉토리 변경 등)에서 추가한 핸들러만 정리
+        # 다른 코드가 추가한 핸들러는 그대로 둠
+        self.close()
 
         # 파일 핸들러 설정 (일별 로그 파일)
-        log_file = os.path.join(
-            self.log_directory, f"market_report_{datetime.now().strftime('%Y%m')}.log"
-        )
+        log_file = os.path.join(self.log_directory, get_log_filename())
         file_handler = RotatingFileHandler(
             log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"  # 10MB
         )
@@ -47,12 +290,72 @@ class MarketReportLogger:
         formatter = logging.Formatter(
             "[%(asctime)s] %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(
+            JsonLogFormatter() if LOG_FORMAT == "json" else formatter
+        )
         console_handler.setFormatter(formatter)
 
-        # 핸들러 추가
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # 로그를 남기는 스레드는 큐에 넣기만 하고, 출력은 리스너 스레드가 처리
+        # (multiprocessing은 import 비용이 있어 첫 로그 기록 시점에 로드)
+        import multiprocessing
+
+        log_queue = multiprocessing.Queue(-1)
+        self._queue_handler = RecordQueueHandler(log_queue, self.metrics)
+        self._listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        logger.addHandler(self._queue_handler)
+
+        # 종료 시 큐에 남은 로그를 모두 기록
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+        return logger
+
+    def worker_initargs(self) -> Tuple[Any, str, Optional[str]]:
+        """워커 프로세스 로깅 설정 인자 (init_worker_logging의 initargs)
+
+        Returns:
+            Tuple[Any, str, Optional[str]]: (로그 큐, 실행 ID, 현재 단계)
+        """
+        self.logger
+        return self._queue_handler.queue, self.metrics.run_id, self.metrics.current
+
+    def attach_queue(
+        self, log_queue: Any, run_id: str, stage: Optional[str] = None
+    ):
+        """부모 프로세스의 로그 큐로 레코드를 보내도록 설정 (워커 프로세스 전용)
+
+        워커에서는 리스너와 파일 핸들러를 만들지 않으므로, spawn 방식에서 로그
+        파일을 따로 열거나 fork 방식에서 복사된 핸들러로 중복 기록하지 않습니다.
+        """
+        with self._setup_lock:
+            logger = logging.getLogger("MarketReport")
+            logger.setLevel(logging.DEBUG)
+            if self._queue_handler is not None:
+                logger.removeHandler(self._queue_handler)
+            # fork로 복사된 리스너는 부모 프로세스 소유이므로 중지하지 않고 버림
+            self._listener = None
+
+            self.metrics.run_id = run_id
+            self.metrics.current = stage
+            self._queue_handler = RecordQueueHandler(log_queue, self.metrics)
+            logger.addHandler(self._queue_handler)
+            self._logger = logger
+
+    def close(self):
+        """큐에 남은 로그를 기록하고 리스너와 핸들러 정리"""
+        if self._queue_handler is not None:
+            logging.getLogger("MarketReport").removeHandler(self._queue_handler)
+            self._queue_handler = None
+
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
 
     def info(self, message: str):
         """정보 레벨 로그 기록"""
@@ -73,6 +376,36 @@ class MarketReportLogger:
         """디버그 레벨 로그 기록"""
         self.logger.debug(message)
 
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        """단계별 소요 시간/I/O 지표 측정 컨텍스트 (RunMetrics.stage)
+
+        단계가 끝나면 소요 시간과 행 수를 담은 단계 종료 레코드를 DEBUG로 남깁니다.
+        """
+        try:
+            with self.metrics.stage(name) as record:
+                yield record
+        finally:
+            self.log_stage_end(name)
+
+    def log_stage_end(self, name: str):
+        """단계 종료 레코드 (로그 분석 도구가 단계별 지연 시간/실패율 집계에 사용)"""
+        record = self.metrics.stages.get(name)
+        if not record:
+            return
+        self.logger.debug(
+            f"단계 종료: {name} status={record['status']} "
+            f"seconds={record['seconds']:.3f} rows={record['rows']}",
+            extra={
+                "stage": name,
+                "event": "stage_end",
+                "source": name.split(".", 1)[-1],
+                "status": record["status"],
+                "duration": round(record["seconds"], 3),
+                "rows": record["rows"],
+            },
+        )
+
     def log_data_collection(self, data_type: str, status: bool, details: str = ""):
         """데이터 수집 과정 로깅"""
         if status:
@@ -95,10 +428,21 @@ class MarketReportLogger:
             self.error(f"처리 단계 '{step_name}' 실패: {details}")
 
 
-# 싱글톤 인스턴스 생성
+# 싱글톤 인스턴스 생성 (핸들러는 첫 사용 시 설정)
 logger = MarketReportLogger()
 
 
+def init_worker_logging(log_queue: Any, run_id: str, stage: Optional[str] = None):
+    """프로세스 풀 initializer: 워커 로그를 부모 프로세스 리스너로 전달
+
+    예:
+        ProcessPoolExecutor(
+            initializer=init_worker_logging, initargs=logger.worker_initargs()
+        )
+    """
+    logger.attach_queue(log_queue, run_id, stage)
+
+
 if __name__ == "__main__":
     # 로거 테스트
     print("Testing logger...")
@@ -124,7 +468,7 @@ if __name__ == "__main__":
             "로그 파일 위치:",
             os.path.join(
                 logger.log_directory,
-                f"market_report_{datetime.now().strftime('%Y%m')}.log",
+                get_log_filename(),
             ),
         )
 
@@ -1,32 +1,125 @@
 import os
+import re
 from datetime import datetime
-from typing import Dict, Any, Optional
-import sys
-
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 
+from config import templates
 from config.templates import (
+    TEMPLATE_VERSION,
     REPORT_TEMPLATE,
     MARKET_SECTION_TEMPLATE,
+    MARKET_CHART_TEMPLATE,
+    COMPOSITE_CHART_TEMPLATE,
     TREASURY_SECTION_TEMPLATE,
     NEWS_TEMPLATE,
     CALENDAR_TEMPLATE,
     BUFFETT_INDICATOR_TEMPLATE,
 )
-from config.settings import get_report_filepath, get_image_filepath, DATE_FORMAT
+from config.settings import (
+    get_report_filepath,
+    get_image_filepath,
+    get_composite_image_filepath,
+    DATE_FORMAT,
+    CHART_LAYOUT,
+)
+from src.render_cache import RenderCache, stable_hash
+from src.report_writer import write_atomic
+
+# 렌더러(json, html 등), 리포트 모델(dataclasses)과 로거는 import 비용이 있어
+# 사용하는 시점에 import 합니다.
+if TYPE_CHECKING:
+    from src.report_model import ReportDocument
+
+# 템플릿 문자열 전체의 해시 (템플릿을 고치면 렌더링 캐시가 자동으로 무효화됨)
+TEMPLATE_FINGERPRINT = stable_hash(
+    TEMPLATE_VERSION,
+    {
+        name: value
+        for name, value in vars(templates).items()
+        if name.endswith("_TEMPLATE") and isinstance(value, str)
+    },
+)
+
+
+def parse_section_titles(template: str) -> Dict[str, str]:
+    """템플릿의 섹션 자리와 바로 앞 "## N. 제목" 제목을 순서대로 추출"""
+    titles = {}
+    for literal, field, _, _ in Formatter().parse(template):
+        headings = re.findall(r"^##\s+(?:\d+\.\s*)?(.+?)\s*$", literal or "", re.M)
+        if field and headings:
+            titles[field] = headings[-1]
+    return titles
+
+
+# 리포트 섹션 자리별 제목 (REPORT_TEMPLATE 순서)
+SECTION_TITLES = parse_section_titles(REPORT_TEMPLATE)
 
 
 class MarkdownBuilder:
-    """마크다운 형식의 리포트를 생성하는 클래스"""
+    """리포트 문서를 구성하고 마크다운/HTML/JSON 형식으로 저장하는 클래스"""
 
-    def __init__(self, date: Optional[str] = None):
+    def __init__(
+        self, date: Optional[str] = None, render_cache: Optional[RenderCache] = None
+    ):
         """
         Args:
             date: 리포트 날짜 (기본값: 오늘)
+            render_cache: 섹션 렌더링 캐시 (기본값: 파일에 저장하지 않는 메모리 캐시)
         """
         self.date = date or datetime.now().strftime(DATE_FORMAT)
+        self.render_cache = (
+            render_cache if render_cache is not None else RenderCache(self.date)
+        )
+
+    def render_section(
+        self,
+        section: str,
+        build: Callable[[Any, str], str],
+        data: Any,
+        summary: str,
+    ) -> str:
+        """섹션 렌더링 (입력 데이터/요약문/템플릿이 같으면 캐시된 결과 사용)
+
+        차트 참조 경로가 날짜와 차트 레이아웃에 따라 달라지므로 캐시 키에
+        함께 포함합니다.
+        """
+        try:
+            key = stable_hash(
+                section, data, summary, TEMPLATE_FINGERPRINT, self.date, CHART_LAYOUT
+            )
+        except TypeError as e:
+            from src.logger import logger
+
+            logger.warning(f"{section} 섹션 캐시 키 생성 실패, 캐시 없이 렌더링: {str(e)}")
+            return build(data, summary)
+        return self.render_cache.render(section, key, lambda: build(data, summary))
+
+    def build_market_chart(self, market_name: str) -> str:
+        """지수별 차트 이미지 참조 생성 (통합 차트 모드에서는 생략)"""
+        if CHART_LAYOUT == "composite":
+            return ""
+        return MARKET_CHART_TEMPLATE.format(
+            market_name=market_name,
+            image_path=get_image_filepath(market_name, self.date),
+        )
+
+    def build_chart_overview(self) -> str:
+        """통합 차트 이미지 참조 생성 (리포트 상단에 한 번만 포함)
+
+        통합 차트를 그리지 못했으면(모든 지수 조회 실패 등) 깨진 이미지 링크 대신 생략합니다.
+        """
+        image_path = self.composite_chart_path()
+        if image_path is None:
+            return ""
+        return COMPOSITE_CHART_TEMPLATE.format(image_path=image_path)
+
+    def composite_chart_path(self) -> Optional[str]:
+        """생성된 통합 차트 경로 (통합 차트 모드가 아니거나 파일이 없으면 None)"""
+        if CHART_LAYOUT != "composite":
+            return None
+        image_path = get_composite_image_filepath(self.date)
+        return image_path if os.path.exists(image_path) else None
 
     def build_us_market_section(
         self, data: Dict[str, Dict[str, Any]], summary: str
@@ -34,14 +127,13 @@ class MarkdownBuilder:
         """미국 시장 섹션 생성"""
         sections = []
         for market_name, market_data in data.items():
-            image_path = get_image_filepath(market_name, self.date)
             section = MARKET_SECTION_TEMPLATE.format(
                 market_name=market_name,
                 close=market_data["close"],
                 change=market_data["change"],
                 volume=market_data["volume"],
                 year_high_ratio=market_data["year_high_ratio"],
-                image_path=image_path,
+                chart=self.build_market_chart(market_name),
             )
             sections.append(section)
 
@@ -54,14 +146,13 @@ class MarkdownBuilder:
         """한국 시장 섹션 생성"""
         sections = []
         for market_name, market_data in data.items():
-            image_path = get_image_filepath(market_name, self.date)
             section = MARKET_SECTION_TEMPLATE.format(
                 market_name=market_name,
                 close=market_data["close"],
                 change=market_data["change"],
                 volume=market_data["volume"],
                 year_high_ratio=market_data["year_high_ratio"],
-                image_path=image_path,
+                chart=self.build_market_chart(market_name),
             )
             sections.append(section)
 
@@ -140,7 +231,7 @@ class MarkdownBuilder:
         # DataProcessor에서 이미 포맷팅된 요약문을 사용
         return summary  # 다른 섹션들과 동일한 방식으로 처리
 
-    def build_report(
+    def build_document(
         self,
         us_market_data: Dict[str, Dict[str, Any]],
         us_market_summary: str,
@@ -156,43 +247,166 @@ class MarkdownBuilder:
         calendar_summary: str,
         options_data: Optional[Dict[str, Dict[str, Any]]] = None,
         options_summary: Optional[str] = None,
-    ) -> str:
-        """전체 리포트 생성"""
-        report = REPORT_TEMPLATE.format(
-            date=self.date,
-            us_market_summary=self.build_us_market_section(
-                us_market_data, us_market_summary
+        news_data: Optional[Dict[str, Any]] = None,
+        calendar_data: Optional[Any] = None,
+    ) -> "ReportDocument":
+        """출력 형식과 무관한 리포트 문서 생성
+
+        섹션은 렌더러가 순회할 때 하나씩 생성되므로(SectionStream) 리포트 전체를
+        메모리에 모으지 않습니다. 입력이 바뀐 섹션만 다시 렌더링하고 나머지는
+        렌더링 캐시에서 가져옵니다. 섹션 순서와 제목은 REPORT_TEMPLATE을 따릅니다.
+        """
+        from src.report_model import ReportDocument, ReportSection, SectionStream
+
+        options_summary = options_summary or "옵션 시장 데이터를 가져올 수 없습니다."
+        builders = {
+            "us_market_summary": (
+                "us_market",
+                us_market_summary,
+                us_market_data,
+                lambda: self.render_section(
+                    "us_market",
+                    self.build_us_market_section,
+                    us_market_data,
+                    us_market_summary,
+                ),
+            ),
+            "options_summary": (
+                "options",
+                options_summary,
+                options_data,
+                lambda: self.render_section(
+                    "options",
+                    self.build_options_section,
+                    options_data or {},
+                    options_summary,
+                ),
             ),
-            options_summary=self.build_options_section(
-                options_data or {},
-                options_summary or "옵션 시장 데이터를 가져올 수 없습니다.",
+            "us_treasury_summary": (
+                "us_treasury",
+                us_treasury_summary,
+                us_treasury_data,
+                lambda: self.render_section(
+                    "us_treasury",
+                    self.build_us_treasury_section,
+                    us_treasury_data,
+                    us_treasury_summary,
+                ),
             ),
-            us_treasury_summary=self.build_us_treasury_section(
-                us_treasury_data, us_treasury_summary
+            "kr_market_summary": (
+                "kr_market",
+                kr_market_summary,
+                kr_market_data,
+                lambda: self.render_section(
+                    "kr_market",
+                    self.build_kr_market_section,
+                    kr_market_data,
+                    kr_market_summary,
+                ),
             ),
-            kr_market_summary=self.build_kr_market_section(
-                kr_market_data, kr_market_summary
+            "forex_summary": (
+                "forex",
+                forex_summary,
+                forex_data,
+                lambda: self.render_section(
+                    "forex", self.build_forex_section, forex_data, forex_summary
+                ),
             ),
-            forex_summary=self.build_forex_section(forex_data, forex_summary),
-            buffett_indicator_summary=self.build_buffett_indicator_section(
-                buffett_indicator_data, buffett_indicator_summary
+            "buffett_indicator_summary": (
+                "buffett_indicator",
+                buffett_indicator_summary,
+                buffett_indicator_data,
+                lambda: self.render_section(
+                    "buffett_indicator",
+                    self.build_buffett_indicator_section,
+                    buffett_indicator_data,
+                    buffett_indicator_summary,
+                ),
+            ),
+            "news_summary": (
+                "news",
+                news_summary,
+                news_data,
+                lambda: self.render_section(
+                    "news", self.build_news_section, news_data or {}, news_summary
+                ),
+            ),
+            "economic_calendar": (
+                "calendar",
+                calendar_summary,
+                calendar_data,
+                lambda: self.render_section(
+                    "calendar",
+                    self.build_calendar_section,
+                    calendar_data or {},
+                    calendar_summary,
+                ),
+            ),
+        }
+
+        def iter_sections() -> Iterator[ReportSection]:
+            for field, title in SECTION_TITLES.items():
+                key, summary, data, build = builders[field]
+                yield ReportSection(key, field, title, summary, build(), data)
+
+        return ReportDocument(
+            date=self.date,
+            chart_overview=self.build_chart_overview(),
+            sections=SectionStream(iter_sections),
+            charts=self.chart_paths(
+                [*(us_market_data or {}), *(kr_market_data or {})]
             ),
-            news_summary=news_summary,
-            economic_calendar=calendar_summary,
         )
 
-        return report
+    def chart_paths(self, market_names: List[str]) -> Dict[str, str]:
+        """리포트에서 참조하는 차트 이미지 경로"""
+        if CHART_LAYOUT == "composite":
+            image_path = self.composite_chart_path()
+            return {"overview": image_path} if image_path else {}
+        return {name: get_image_filepath(name, self.date) for name in market_names}
 
-    def save_report(self, report_content: str) -> str:
-        """생성된 리포트를 파일로 저장"""
-        report_path = get_report_filepath(self.date)
+    def iter_report(self, *args, **kwargs) -> Iterator[str]:
+        """마크다운 리포트를 조각 단위로 생성 (인자는 build_document와 동일)"""
+        from src.renderers import MarkdownRenderer
+
+        return MarkdownRenderer().render(self.build_document(*args, **kwargs))
 
-        # 디렉토리가 없으면 생성
-        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    def build_report(self, *args, **kwargs) -> str:
+        """전체 마크다운 리포트 생성 (인자는 build_document와 동일)"""
+        return "".join(self.iter_report(*args, **kwargs))
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+    def write_document(self, document: "ReportDocument", fmt: str = "md") -> str:
+        """리포트 문서를 지정한 형식으로 렌더링하면서 파일에 기록
 
+        섹션을 생성하는 대로 렌더링하여 임시 파일에 기록하고, 모두 쓴 뒤
+        원자적으로 교체하므로 중간에 실패하면 기존 리포트가 그대로 남습니다.
+
+        Args:
+            document: build_document로 생성한 리포트 문서
+            fmt: 출력 형식 ("md", "html", "json")
+
+        Returns:
+            str: 저장된 리포트 파일 경로
+        """
+        from src.renderers import get_renderer
+
+        renderer = get_renderer(fmt)
+        report_path = get_report_filepath(self.date, renderer.extension)
+        write_atomic(report_path, renderer.render(document))
+        return report_path
+
+    def write_report(self, *args, **kwargs) -> str:
+        """마크다운 리포트를 생성하여 저장 (인자는 build_document와 동일)
+
+        Returns:
+            str: 저장된 리포트 파일 경로
+        """
+        return self.write_document(self.build_document(*args, **kwargs))
+
+    def save_report(self, report_content: str) -> str:
+        """생성된 리포트를 파일로 저장 (임시 파일에 쓴 뒤 원자적으로 교체)"""
+        report_path = get_report_filepath(self.date)
+        write_atomic(report_path, [report_content])
         return report_path
 
 
@@ -237,7 +451,7 @@ def create_report(
         str: 저장된 리포트 파일 경로
     """
     builder = MarkdownBuilder(date)
-    report_content = builder.build_report(
+    return builder.write_report(
         us_market_data or {},
         us_market_summary or "미국 시장 데이터를 가져올 수 없습니다.",
         us_treasury_data or {},
@@ -253,7 +467,6 @@ def create_report(
         options_data or {},
         options_summary or "옵션 시장 데이터를 가져올 수 없습니다.",
     )
-    return builder.save_report(report_content)
 
 
 if __name__ == "__main__":
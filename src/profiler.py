@@ -0,0 +1,226 @@
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.logger import logger
+
+# 접힌 스택(collapsed stack) 출력 설정
+MAX_STACK_DEPTH = 40
+MIN_STACK_MICROSECONDS = 1000  # 이보다 짧은 경로는 생략 (호출 그래프 폭발 방지)
+TOP_FUNCTIONS = 25
+
+
+def _format_function(func: Tuple[str, int, str]) -> str:
+    """pstats 함수 키를 "모듈:함수" 형태로 변환"""
+    filename, line, name = func
+    if filename == "~":
+        return name  # 내장 함수
+    if filename.startswith("<"):
+        return f"{filename.strip('<>')}:{name}"  # frozen 모듈 등
+    module = os.path.splitext(os.path.basename(filename))[0]
+    return f"{module}:{name}:{line}"
+
+
+def _format_bytes(size: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def collapse_stacks(stats: pstats.Stats, prefix: str = "") -> List[Tuple[str, int]]:
+    """cProfile 호출 그래프를 접힌 스택(flamegraph 입력 형식)으로 변환
+
+    cProfile은 호출자-피호출자 간선별 누적 시간만 기록하므로, 각 간선의 시간
+    비율만큼 피호출 함수의 자체 시간을 나누어 스택 경로에 배분합니다.
+
+    Returns:
+        List[Tuple[str, int]]: (세미콜론으로 연결한 스택 경로, 마이크로초)
+    """
+    entries = stats.stats
+    children: Dict[Any, Dict[Any, float]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, {})[func] = edge[3]
+
+    roots = [
+        func
+        for func, (_, _, _, _, callers) in entries.items()
+        if not any(caller in entries for caller in callers)
+    ]
+
+    stacks: Dict[str, int] = {}
+
+    def walk(func, path: List[str], share: float, visiting: set):
+        total_time = entries[func][3]
+        if total_time <= 0 or share * 1e6 < MIN_STACK_MICROSECONDS:
+            return
+        scale = min(share / total_time, 1.0)
+        path = path + [_format_function(func)]
+
+        self_us = int(entries[func][2] * scale * 1e6)
+        if self_us >= MIN_STACK_MICROSECONDS:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + self_us
+
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for child, edge_time in children.get(func, {}).items():
+            if child not in visiting:
+                walk(child, path, edge_time * scale, visiting | {child})
+
+    base = [prefix] if prefix else []
+    for root in roots:
+        walk(root, base, entries[root][3], {root})
+
+    return sorted(stacks.items(), key=lambda item: item[0])
+
+
+class StageProfiler:
+    """파이프라인 단계별 CPU/메모리 프로파일러
+
+    단계마다 cProfile 통계 파일(<단계>.prof)을 저장하고 tracemalloc으로 최대/증감
+    메모리를 측정합니다. finish()는 전체 통계를 합친 merged.prof, 단계별 요약
+    (profile_summary.txt), flamegraph.pl/speedscope 입력용 접힌 스택
+    (stacks.collapsed)을 생성합니다.
+    """
+
+    def __init__(self, output_dir: str):
+        """
+        Args:
+            output_dir: 프로파일 결과 저장 디렉토리
+        """
+        self.output_dir = output_dir
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._stats_files: Dict[str, str] = {}
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[Dict[str, Any]]:
+        """단계 하나를 프로파일링
+
+        같은 이름의 단계가 여러 번 실행되면 시간/메모리는 합산하고 최대값은 갱신합니다.
+        """
+        result = self.results.setdefault(
+            name,
+            {
+                "wall_seconds": 0.0,
+                "cpu_seconds": 0.0,
+                "alloc_peak_bytes": 0,
+                "alloc_delta_bytes": 0,
+            },
+        )
+        profiler = cProfile.Profile()
+
+        tracemalloc.reset_peak()
+        mem_before, _ = tracemalloc.get_traced_memory()
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+
+        profiler.enable()
+        try:
+            yield result
+        finally:
+            profiler.disable()
+            mem_after, mem_peak = tracemalloc.get_traced_memory()
+
+            result["wall_seconds"] += time.perf_counter() - wall_started
+            result["cpu_seconds"] += time.process_time() - cpu_started
+            result["alloc_peak_bytes"] = max(
+                result["alloc_peak_bytes"], mem_peak - mem_before
+            )
+            result["alloc_delta_bytes"] += mem_after - mem_before
+
+            self._dump(name, profiler)
+
+    def _dump(self, name: str, profiler: cProfile.Profile):
+        """단계 통계 파일 저장 (같은 단계는 기존 통계에 합산)"""
+        path = os.path.join(self.output_dir, f"{name}.prof")
+        try:
+            stats = pstats.Stats(profiler)
+            if name in self._stats_files:
+                stats.add(self._stats_files[name])
+            stats.dump_stats(path)
+            self._stats_files[name] = path
+        except Exception as e:
+            logger.warning(f"프로파일 저장 실패 ({name}): {str(e)}")
+
+    def finish(self) -> Optional[str]:
+        """병합 통계와 요약 파일 생성
+
+        Returns:
+            Optional[str]: 요약 파일 경로 (프로파일된 단계가 없으면 None)
+        """
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        if not self._stats_files:
+            return None
+
+        stacks: Dict[str, int] = {}
+        merged = None
+        for name, path in self._stats_files.items():
+            stats = pstats.Stats(path)
+            for stack, value in collapse_stacks(stats, prefix=name):
+                stacks[stack] = stacks.get(stack, 0) + value
+            if merged is None:
+                merged = pstats.Stats(path)
+            else:
+                merged.add(path)
+
+        merged.dump_stats(os.path.join(self.output_dir, "merged.prof"))
+
+        with open(
+            os.path.join(self.output_dir, "stacks.collapsed"), "w", encoding="utf-8"
+        ) as f:
+            for stack, value in sorted(stacks.items()):
+                f.write(f"{stack} {value}\n")
+
+        summary_path = os.path.join(self.output_dir, "profile_summary.txt")
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(self._format_summary(merged, stacks))
+
+        return summary_path
+
+    def _format_summary(self, merged: pstats.Stats, stacks: Dict[str, int]) -> str:
+        """단계별 표, 누적 시간 상위 함수, 상위 스택 경로를 텍스트로 정리"""
+        lines = [
+            "=== 단계별 프로파일 ===",
+            f"{'단계':<28}{'wall(s)':>10}{'cpu(s)':>10}{'peak':>12}{'delta':>12}",
+        ]
+        for name, result in self.results.items():
+            lines.append(
+                f"{name:<28}"
+                f"{result['wall_seconds']:>10.3f}"
+                f"{result['cpu_seconds']:>10.3f}"
+                f"{_format_bytes(result['alloc_peak_bytes']):>12}"
+                f"{_format_bytes(result['alloc_delta_bytes']):>12}"
+            )
+
+        lines += ["", f"=== 누적 시간 상위 {TOP_FUNCTIONS}개 함수 (전체 단계) ==="]
+        ranked = sorted(
+            merged.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[:TOP_FUNCTIONS]
+        for func, (_, calls, self_time, total_time, _) in ranked:
+            lines.append(
+                f"{total_time:>9.3f}s {self_time:>9.3f}s {calls:>8} "
+                f"{_format_function(func)}"
+            )
+
+        lines += ["", f"=== 자체 시간 상위 {TOP_FUNCTIONS}개 스택 ==="]
+        ranked_stacks = sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+        for stack, value in ranked_stacks[:TOP_FUNCTIONS]:
+            lines.append(f"{value / 1e6:>9.3f}s {stack}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,151 @@
+import datetime as dt
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import get_render_cache_filepath
+
+# 로거는 import 비용이 있어 (markdown_builder 시작 시간) 사용하는 시점에 import 합니다.
+
+
+def _encode(value: Any) -> Any:
+    """JSON으로 직렬화되지 않는 값을 안정적인 표현으로 변환
+
+    Raises:
+        TypeError: 안정적인 표현이 없는 값 (repr은 객체 주소 등을 포함할 수 있음)
+    """
+    # pandas/numpy는 시작 시간에 영향이 커서 실제로 필요할 때만 로드
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        frame_hash = pd.util.hash_pandas_object(value, index=True)
+        columns = (
+            list(map(str, value.columns))
+            if isinstance(value, pd.DataFrame)
+            else [str(value.name)]
+        )
+        return {
+            "frame": hashlib.sha256(frame_hash.values.tobytes()).hexdigest(),
+            "columns": columns,
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (dt.date, dt.datetime, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(stable_hash, value))
+    raise TypeError(f"캐시 키로 사용할 수 없는 타입: {type(value).__name__}")
+
+
+def stable_hash(*parts: Any) -> str:
+    """입력 값의 안정적인 SHA-256 해시 (딕셔너리 키 순서와 무관)"""
+    payload = json.dumps(parts, sort_keys=True, default=_encode, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """섹션별 렌더링 결과 캐시
+
+    섹션 입력 데이터, 요약문, 템플릿 버전의 해시를 키로 렌더링 결과를
+    저장합니다. 같은 날짜의 리포트를 다시 만들 때 입력이 바뀌지 않은 섹션은
+    다시 렌더링하지 않고 저장된 결과를 그대로 사용합니다. 섹션마다 마지막
+    결과 하나만 보관하며, 날짜별 데이터 디렉토리에 저장되어 프로세스를 다시
+    시작해도 유지됩니다.
+
+    파일 저장은 persist=True일 때만 합니다. 기본값은 메모리 캐시이므로
+    벤치마크나 모듈 테스트에서 만든 MarkdownBuilder는 데이터 디렉토리에
+    아무것도 남기지 않습니다.
+    """
+
+    def __init__(self, date: str, path: Optional[str] = None, persist: bool = False):
+        """
+        Args:
+            date: 리포트 날짜
+            path: 캐시 파일 경로 (기본값: settings.get_render_cache_filepath(date))
+            persist: 캐시 파일 로드/저장 여부 (False이면 프로세스 안에서만 유지)
+        """
+        self.date = date
+        self.path = path
+        self.persist = persist
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def get_path(self) -> str:
+        return self.path or get_render_cache_filepath(self.date)
+
+    def load(self):
+        """저장된 캐시 로드 (파일이 없거나 손상되면 빈 캐시로 시작)"""
+        self._loaded = True
+        path = self.get_path()
+        if not self.persist or not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            with self._lock:
+                for section, entry in saved.items():
+                    self.entries.setdefault(section, entry)
+        except Exception as e:
+            from src.logger import logger
+
+            logger.warning(f"렌더링 캐시 로드 실패: {str(e)}")
+
+    def save(self) -> Optional[str]:
+        """변경된 캐시 저장 (임시 파일에 쓴 뒤 교체, persist=False이면 저장하지 않음)"""
+        if not self.persist or not self._dirty:
+            return None
+
+        path = self.get_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self._lock:
+                payload = dict(self.entries)
+                self._dirty = False
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            from src.logger import logger
+
+            logger.warning(f"렌더링 캐시 저장 실패: {str(e)}")
+            return None
+
+    def render(self, section: str, key: str, render: Callable[[], str]) -> str:
+        """캐시된 결과가 있으면 반환하고, 없으면 렌더링 후 저장
+
+        Args:
+            section: 섹션 이름 (예: "us_market")
+            key: 섹션 입력의 해시 (stable_hash)
+            render: 캐시가 없을 때 호출할 렌더링 함수
+        """
+        if not self._loaded:
+            self.load()
+
+        with self._lock:
+            entry = self.entries.get(section)
+            hit = bool(entry) and entry.get("key") == key
+            if hit:
+                self.stats["hits"] += 1
+        if hit:
+            from src.logger import logger
+
+            logger.metrics.add("cache_hits")
+            return entry["text"]
+
+        text = render()
+        with self._lock:
+            self.stats["misses"] += 1
+            self.entries[section] = {"key": key, "text": text}
+            self._dirty = True
+        return text
@@ -0,0 +1,263 @@
+import datetime as dt
+import html
+import json
+import math
+import re
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Type
+
+from config.templates import REPORT_TEMPLATE, TEMPLATE_VERSION
+from src.report_model import ReportDocument
+
+# JSON 출력 스키마 버전 (필드 구성을 바꾸면 올림)
+JSON_SCHEMA_VERSION = 1
+
+# 본문에서 사용하는 마크다운 인라인 문법: 이미지, 링크, 굵은 글씨
+INLINE_PATTERN = re.compile(
+    r"!\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]+)\)"
+    r"|\[(?P<text>[^\]]+)\]\((?P<href>[^)\s]+)\)"
+    r"|\*\*(?P<strong>.+?)\*\*"
+)
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+LIST_PATTERN = re.compile(r"^\s*[-*]\s+(.*)$")
+
+HTML_STYLE = """
+body { font-family: sans-serif; max-width: 860px; margin: 2em auto; line-height: 1.6; }
+img { max-width: 100%; }
+section { margin-bottom: 2em; }
+"""
+
+
+class ReportRenderer:
+    """리포트 렌더러 기본 클래스
+
+    render는 리포트를 문자열 조각 단위로 생성하므로 write_atomic으로 바로
+    파일에 기록할 수 있습니다.
+    """
+
+    name = ""
+    extension = ""
+
+    def render(self, document: ReportDocument) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render_text(self, document: ReportDocument) -> str:
+        """리포트 전체를 하나의 문자열로 생성"""
+        return "".join(self.render(document))
+
+
+class MarkdownRenderer(ReportRenderer):
+    """REPORT_TEMPLATE 기반 마크다운 렌더러 (기존 리포트와 동일한 출력)"""
+
+    name = "md"
+    extension = "md"
+
+    def render(self, document: ReportDocument) -> Iterator[str]:
+        # 섹션은 템플릿 순서대로 정렬되어 있으므로 자리에 도달할 때마다 하나씩 생성
+        header = {"date": document.date, "chart_overview": document.chart_overview}
+        sections = iter(document.sections)
+        for literal, field, spec, _ in Formatter().parse(REPORT_TEMPLATE):
+            if literal:
+                yield literal
+            if field is None:
+                continue
+            if field in header:
+                value = header[field]
+            else:
+                section = next(sections)
+                if section.field != field:
+                    raise ValueError(
+                        f"섹션 순서가 템플릿과 다릅니다: {section.field} (기대값: {field})"
+                    )
+                value = section.content
+            yield format(value, spec or "")
+
+
+class HtmlRenderer(ReportRenderer):
+    """블로그 게시용 HTML 렌더러
+
+    섹션 본문은 리포트에서 쓰는 마크다운 문법(제목, 목록, 이미지, 링크,
+    굵은 글씨, 문단)만 변환합니다.
+    """
+
+    name = "html"
+    extension = "html"
+
+    def render(self, document: ReportDocument) -> Iterator[str]:
+        title = f"{document.date} 시장 동향 리포트"
+        yield (
+            '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{html.escape(title)}</title>\n"
+            f"<style>{HTML_STYLE}</style>\n</head>\n<body>\n"
+            f"<h1>{html.escape(title)}</h1>\n"
+        )
+        if document.chart_overview:
+            yield markdown_to_html(document.chart_overview)
+
+        for number, section in enumerate(document.sections, start=1):
+            yield (
+                f'<section id="{section.key}">\n'
+                f"<h2>{number}. {html.escape(section.title)}</h2>\n"
+            )
+            yield markdown_to_html(section.content)
+            yield "</section>\n"
+
+        yield "</body>\n</html>\n"
+
+
+class JsonRenderer(ReportRenderer):
+    """대시보드용 JSON 렌더러 (섹션별 요약문, 본문, 원본 데이터 포함)"""
+
+    name = "json"
+    extension = "json"
+
+    def render(self, document: ReportDocument) -> Iterator[str]:
+        # json.dumps(payload, indent=2)와 같은 출력을 섹션 단위로 생성
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2, allow_nan=False)
+        header = {
+            "schema_version": JSON_SCHEMA_VERSION,
+            "template_version": TEMPLATE_VERSION,
+            "date": document.date,
+            "charts": document.charts,
+        }
+        yield "{"
+        for name, value in header.items():
+            yield f"\n  {encoder.encode(name)}: {indent_json(encoder.encode(value), 1)},"
+
+        yield '\n  "sections": ['
+        separator = "\n"
+        for section in document.sections:
+            entry = {
+                "key": section.key,
+                "title": section.title,
+                "summary": section.summary,
+                "content": section.content,
+                "data": to_jsonable(section.data),
+            }
+            yield f"{separator}    {indent_json(encoder.encode(entry), 2)}"
+            separator = ",\n"
+        yield "\n  ]" if separator != "\n" else "]"
+        yield "\n}\n"
+
+
+def indent_json(text: str, level: int) -> str:
+    """indent=2로 인코딩한 JSON을 level단계 안쪽에 놓이도록 들여쓰기
+
+    JSON 문자열 안의 줄바꿈은 이스케이프되므로 실제 줄바꿈은 모두 구조상의
+    줄바꿈입니다.
+    """
+    return text.replace("\n", "\n" + "  " * level)
+
+
+RENDERERS: Dict[str, Type[ReportRenderer]] = {
+    renderer.name: renderer
+    for renderer in (MarkdownRenderer, HtmlRenderer, JsonRenderer)
+}
+
+
+def get_renderer(name: str) -> ReportRenderer:
+    """출력 형식 이름으로 렌더러 생성
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    if name not in RENDERERS:
+        raise ValueError(
+            f"지원하지 않는 출력 형식: {name} (사용 가능: {', '.join(RENDERERS)})"
+        )
+    return RENDERERS[name]()
+
+
+def to_jsonable(value: Any) -> Any:
+    """JSON으로 직렬화 가능한 값으로 변환 (NaN/무한대는 None)"""
+    # pandas/numpy는 시작 시간에 영향이 커서 실제로 필요할 때만 로드
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, pd.DataFrame):
+        frame = value.reset_index() if not isinstance(value.index, pd.RangeIndex) else value
+        return to_jsonable(frame.to_dict(orient="records"))
+    if isinstance(value, pd.Series):
+        return to_jsonable(value.to_dict())
+    if isinstance(value, np.ndarray):
+        return to_jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (dt.date, dt.datetime, pd.Timestamp)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    return str(value)
+
+
+def render_inline(text: str) -> str:
+    """마크다운 인라인 문법을 HTML로 변환 (나머지 텍스트는 이스케이프)"""
+    parts = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        parts.append(html.escape(text[position : match.start()], quote=False))
+        if match.group("src") is not None:
+            parts.append(
+                f'<img src="{html.escape(match.group("src"))}" '
+                f'alt="{html.escape(match.group("alt"))}">'
+            )
+        elif match.group("href") is not None:
+            parts.append(
+                f'<a href="{html.escape(match.group("href"))}">'
+                f"{html.escape(match.group('text'), quote=False)}</a>"
+            )
+        else:
+            parts.append(
+                f"<strong>{html.escape(match.group('strong'), quote=False)}</strong>"
+            )
+        position = match.end()
+    parts.append(html.escape(text[position:], quote=False))
+    return "".join(parts)
+
+
+def markdown_to_html(text: str) -> str:
+    """리포트 본문에서 쓰는 마크다운 블록 문법을 HTML로 변환"""
+    lines: List[str] = []
+    paragraph: List[str] = []
+    in_list = False
+
+    def close_blocks():
+        nonlocal in_list
+        if paragraph:
+            lines.append(f"<p>{render_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+        if in_list:
+            lines.append("</ul>")
+            in_list = False
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        heading = HEADING_PATTERN.match(line)
+        item = LIST_PATTERN.match(line)
+
+        if not line:
+            close_blocks()
+        elif heading:
+            close_blocks()
+            level = len(heading.group(1))
+            lines.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>")
+        elif item:
+            if paragraph:
+                close_blocks()
+            if not in_list:
+                lines.append("<ul>")
+                in_list = True
+            lines.append(f"<li>{render_inline(item.group(1))}</li>")
+        else:
+            if in_list:
+                close_blocks()
+            paragraph.append(line)
+
+    close_blocks()
+    return "\n".join(lines) + "\n" if lines else ""
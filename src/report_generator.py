@@ -1,150 +1,403 @@
-from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
-import sys
 import os
-
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, Iterable, Iterator, Set
 
 from src.data_processor import DataProcessor
 from src.markdown_builder import MarkdownBuilder
-from src.logger import logger
-from utils.us_market import get_all_us_market_data
-from utils.kr_market import get_all_kr_market_data
-from utils.us_treasury import get_all_treasury_data
-from utils.forex import get_all_forex_data
-from utils.news import get_all_news
-from utils.calendar import EconomicCalendar
-from utils.chart_generator import generate_all_charts
-from utils.buffett_indicator import BuffettIndicator
-from utils.option_data import get_market_option_data
-from utils.option_analysis import analyze_market_options
-from config.settings import DATE_FORMAT
+from src.render_cache import RenderCache
+from src.history_db import HistoryDB, series_buffer
+from src.renderers import get_renderer
+from src.snapshot import write_snapshot
+from src.data_store import DataStore
+from src.run_record import RunRecord
+from src.sections import (
+    SECTIONS,
+    REPORT_SECTIONS,
+    UNAVAILABLE_MESSAGES,
+    STALE_MESSAGE,
+    resolve_sections,
+)
+from src.isolation import run_isolated, SourceTimeoutError, EmptyResultError
+from src.logger import logger, count_rows
+from utils.latency import latency_tracker
+from config.settings import (
+    DATE_FORMAT,
+    CHART_WORKERS,
+    CHART_LAYOUT,
+    COLLECT_TIMEOUT,
+    COLLECT_TIMEOUTS,
+    COLLECT_RETRIES,
+    COLLECT_BACKOFF,
+    COLLECT_MAX_BACKOFF,
+    FALLBACK_MAX_AGE_DAYS,
+    REPORT_FORMATS,
+    get_image_filepath,
+    get_composite_image_filepath,
+    get_run_summary_filepath,
+    get_profile_dirpath,
+)
+
+# 수집기(yfinance, pykrx, selenium, fredapi 등)와 차트 모듈은 import 비용이 크므로
+# 해당 단계가 실제로 실행될 때 import 합니다.
 
 
 class ReportGenerator:
     """시장 리포트 생성을 총괄하는 클래스"""
 
-    def __init__(self, date: Optional[str] = None):
+    def __init__(
+        self,
+        date: Optional[str] = None,
+        sections: Optional[Iterable[str]] = None,
+        workers: Optional[int] = CHART_WORKERS,
+        charts: bool = True,
+        cache_only: bool = False,
+        profile: bool = False,
+        record: bool = False,
+        replay: Optional[str] = None,
+        refresh: bool = False,
+        formats: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            date: 리포트 날짜 (기본값: 오늘, KST)
+            sections: 실행할 섹션 이름 (None이면 전체, 의존 섹션은 자동 포함)
+            workers: 차트 데이터 조회/렌더링 워커 수
+            charts: 차트 생성 여부
+            cache_only: 네트워크 수집 없이 저장된 데이터만 사용
+            profile: 단계별 cProfile/tracemalloc 프로파일링 여부
+            record: 수집 데이터를 녹화본(records/<날짜>_record.pkl.gz)으로 저장
+            replay: 재생할 녹화본 (날짜 또는 파일 경로). 지정하면 수집기를 실행하지 않음
+            refresh: 중단된 실행의 체크포인트를 무시하고 모든 섹션을 새로 수집
+            formats: 리포트 출력 형식 목록 (기본값: settings.REPORT_FORMATS, 첫 번째가 반환 경로)
+        """
+        self.replay_record = RunRecord.load(replay) if replay else None
+        if date is None and self.replay_record is not None:
+            date = self.replay_record.date
         self.date = date or datetime.now(timezone(timedelta(hours=9))).strftime(
             DATE_FORMAT
         )
-        self.processor = DataProcessor()
-        self.builder = MarkdownBuilder(self.date)
-        self.calendar = EconomicCalendar()
-        self.buffett_indicator = BuffettIndicator()
+        self.sections = resolve_sections(sections, charts=charts)
+        # 사용자가 직접 지정한 섹션은 체크포인트가 있어도 항상 새로 수집
+        self.requested = set(sections or ())
+        self.workers = workers
+        self.cache_only = cache_only
+        self.profile = profile
+        self.profiler = None
+        self.record = record
+        self.refresh = refresh
+        self.formats = list(formats or REPORT_FORMATS)
+        for fmt in self.formats:
+            get_renderer(fmt)  # 지원하지 않는 형식은 수집 전에 ValueError
+        self.stale = {}  # 대체 데이터를 사용한 섹션 {섹션 이름: 데이터 수집 날짜}
+        self.resumable = set()  # 중단된 이전 실행에서 수집을 마친 섹션
+        self.run_state = {"status": "running", "sections": {}}
+        self.store = DataStore(self.date)
+        self.history = HistoryDB()
+        self.processor = DataProcessor(self.date, self.history)
+        self.builder = MarkdownBuilder(
+            self.date, RenderCache(self.date, persist=True)
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        """단계 지표 측정 (프로파일 모드에서는 CPU/메모리 프로파일 포함)"""
+        with logger.stage(name) as record:
+            if self.profiler is None:
+                yield record
+                return
+
+            result = None
+            try:
+                with self.profiler.profile(name) as result:
+                    yield record
+            finally:
+                if result:
+                    record["cpu_seconds"] = round(result["cpu_seconds"], 3)
+                    record["alloc_peak_bytes"] = result["alloc_peak_bytes"]
+
+    @property
+    def offline(self) -> bool:
+        """수집기 없이 저장/녹화된 데이터만 사용하는지 여부"""
+        return self.cache_only or self.replay_record is not None
+
+    def load_saved(self, name: str) -> Optional[Any]:
+        """저장된 섹션 데이터 (재생 모드에서는 녹화본, 그 외에는 날짜별 저장소)"""
+        if self.replay_record is not None:
+            return self.replay_record.get(name)
+        return self.store.load(name)
+
+    def find_resumable(self) -> Set[str]:
+        """이어서 수집할 때 체크포인트를 사용할 섹션
+
+        같은 날짜의 마지막 실행이 중단되었거나 일부 섹션이 실패한 경우에만 그
+        실행에서 수집을 마친 섹션을 돌려줍니다. 마지막 실행이 모두 성공했다면
+        다시 실행할 때 전체를 새로 수집합니다. 사용자가 직접 지정한 섹션은
+        제외합니다.
+        """
+        if self.offline or self.refresh:
+            return set()
+
+        state = self.store.load_run_state()
+        if not state or state.get("status") == "complete":
+            return set()
+        completed = {
+            name
+            for name, status in state.get("sections", {}).items()
+            if status == "ok"
+        }
+        return completed - self.requested
+
+    def load_checkpoint(self, name: str) -> Optional[Any]:
+        """중단된 이전 실행에서 수집을 마친 섹션 데이터 (이어서 수집할 섹션이 아니면 None)"""
+        if name not in self.resumable:
+            return None
+        return self.store.load(name)
+
+    def mark_section(self, name: str, status: str):
+        """섹션 수집 결과를 실행 상태에 기록 (섹션마다 바로 저장하여 중단에 대비)"""
+        if self.offline:
+            return
+        self.run_state["sections"][name] = status
+        self.store.save_run_state(self.run_state)
+
+    def collect_section(self, name: str) -> Any:
+        """섹션 수집기를 제한 시간/재시도 경계 안에서 실행
+
+        Raises:
+            Exception: 재시도 후에도 실패한 경우 마지막 실패 원인
+        """
+        label = SECTIONS[name]["label"]
+
+        def on_retry(attempt: int, error: Exception, delay: float):
+            logger.metrics.add("retries")
+            logger.warning(
+                f"{label} 수집 재시도 {attempt}/{COLLECT_RETRIES} "
+                f"({delay:.1f}초 후): {str(error)}"
+            )
+
+        # 프로파일 모드에서는 수집이 현재 스레드의 프로파일에 잡히도록 제한 시간 없이 실행
+        timeout = None if self.profiler else COLLECT_TIMEOUTS.get(name, COLLECT_TIMEOUT)
+        return run_isolated(
+            SECTIONS[name]["collect"],
+            timeout,
+            COLLECT_RETRIES,
+            COLLECT_BACKOFF,
+            COLLECT_MAX_BACKOFF,
+            on_retry,
+            allow_empty=SECTIONS[name]["allow_empty"],
+        )
+
+    def load_fallback(self, name: str) -> Optional[Any]:
+        """수집에 실패한 섹션의 최근 정상 데이터 (이전 날짜 저장소)"""
+        found = self.store.find_previous(name, FALLBACK_MAX_AGE_DAYS)
+        if found is None:
+            return None
+
+        date, data = found
+        self.stale[name] = date
+        return data
 
     def collect_data(self) -> Dict[str, Any]:
-        """모든 필요한 데이터 수집"""
-        logger.info(f"데이터 수집 시작: {self.date}")
+        """선택된 섹션의 데이터 수집
+
+        섹션별 수집 결과는 완료되는 즉시 날짜별 저장소(data/<날짜>/)에 체크포인트로
+        저장되고, 섹션별 성공/실패는 실행 상태로 기록됩니다. 이전 실행이 중단되었거나
+        일부 섹션이 실패했다면 다시 실행할 때 수집을 마친 섹션은 체크포인트를
+        사용하고 실패했거나 수집하지 못한 섹션만 수집합니다. 사용자가 직접 지정한
+        섹션과 이전 실행이 모두 성공한 경우는 항상 새로 수집합니다
+        (refresh=True이면 체크포인트를 사용하지 않음).
+
+        각 수집기는 섹션별 제한 시간과 재시도 경계 안에서 실행되며, 최종적으로
+        실패한 섹션은 이전 날짜의 정상 데이터로 대체하고 리포트에 표시합니다.
+        대부분의 수집기는 내부 오류 시 빈 값을 반환하므로 빈 결과를 허용하는
+        섹션(allow_empty, 예: 경제 지표)이 아니면 빈 결과도 실패로 처리합니다.
+        대체 데이터는 체크포인트로 저장하지 않으므로 다시 실행하면 재수집합니다.
+
+        선택되지 않은 리포트 섹션은 저장소에 남아 있는 데이터를 사용합니다.
+        녹화 모드에서는 리포트에 사용된 전체 데이터를 녹화본으로 저장합니다.
+        """
+        logger.info(f"데이터 수집 시작: {self.date} ({', '.join(self.sections)})")
         data = {}
+        failed = []
+        self.resumable = self.find_resumable()
+
+        for name in self.sections:
+            label = SECTIONS[name]["label"]
+            stage_name = f"collect.{name}"
+            checkpoint = self.load_checkpoint(name)
+
+            try:
+                with self.stage(stage_name) as stage:
+                    if self.offline:
+                        data[name] = self.load_saved(name)
+                    elif checkpoint is not None:
+                        data[name] = checkpoint
+                    else:
+                        data[name] = self.collect_section(name)
+                        self.store.save(name, data[name])
+                    stage["rows"] += count_rows(data[name])
+                    stage["status"] = "ok" if data[name] else "empty"
+            except Exception as e:
+                if isinstance(e, (SourceTimeoutError, EmptyResultError)):
+                    logger.error(f"{label} 데이터 수집 실패: {str(e)}")
+                else:
+                    logger.error(f"{label} 데이터 수집 중 에러 발생", exc_info=e)
+
+                data[name] = self.load_fallback(name)
+                if data[name] is None:
+                    failed.append(name)
+                    self.mark_section(name, "failed")
+                else:
+                    logger.metrics.get_stage(stage_name)["status"] = "stale"
+                    logger.warning(f"{label} {self.stale[name]} 수집 데이터로 대체")
+                    self.mark_section(name, "stale")
+                continue
+
+            self.mark_section(name, "ok")
+            if checkpoint is not None:
+                logger.metrics.add("cache_hits", stage=stage_name)
+                logger.info(f"{label} 체크포인트 사용 (재수집 생략)")
+                continue
+
+            if self.offline:
+                if data[name] is None:
+                    logger.warning(f"{label} 저장 데이터 없음")
+                else:
+                    logger.metrics.add("cache_hits", stage=stage_name)
+                continue
+
+            # 빈 결과를 허용하는 섹션(예: 예정된 경제 지표 없음)은 정상 수집으로 기록
+            details = logger.metrics.describe(stage_name)
+            if not data[name]:
+                details = f"빈 결과, {details}"
+            logger.log_data_collection(label, True, details)
+
+        if not self.offline:
+            sections = self.run_state["sections"]
+            complete = all(status == "ok" for status in sections.values())
+            self.run_state["status"] = "complete" if complete else "incomplete"
+            self.store.save_run_state(self.run_state)
+
+        if failed:
+            logger.warning(
+                f"데이터 없이 생성되는 섹션: {', '.join(failed)} "
+                "(다시 실행하면 완료된 섹션은 체크포인트에서 불러옵니다)"
+            )
 
-        try:
-            # 한국 시장 데이터 수집
-            data["kr_market"] = get_all_kr_market_data()
-            logger.log_data_collection("한국 시장", bool(data["kr_market"]))
-
-            # 미국 시장 데이터 수집
-            data["us_market"] = get_all_us_market_data()
-            logger.log_data_collection("미국 시장", bool(data["us_market"]))
-
-            # 미국 국채 데이터 수집
-            data["us_treasury"] = get_all_treasury_data()
-            logger.log_data_collection("미국 국채", bool(data["us_treasury"]))
-
-            # 환율 데이터 수집
-            data["forex"] = get_all_forex_data()
-            logger.log_data_collection("환율", bool(data["forex"]))
-
-            # 뉴스 데이터 수집
-            data["news"] = get_all_news()
-            logger.log_data_collection("뉴스", bool(data["news"]))
-
-            # 경제 지표 데이터 수집
-            events = self.calendar.get_important_events()
-            if events:
-                data["calendar"] = events
-                logger.log_data_collection("경제 지표", True)
-            else:
-                data["calendar"] = []
-                logger.log_data_collection("경제 지표", False, "No events found")
-
-            # Buffett Indicator 데이터 수집
-            data["buffett_indicator"] = self.buffett_indicator.get_current_status()
-            logger.log_data_collection("버핏 지표", bool(data["buffett_indicator"]))
-
-            # 옵션 데이터 수집
-            market_options = get_market_option_data(expiry_type="monthly", periods=3)
-            if market_options:
-                data["options"] = analyze_market_options(market_options)
-                logger.log_data_collection("옵션 시장", True)
-            else:
-                data["options"] = {}
-                logger.log_data_collection("옵션 시장", False, "No options data found")
+        # 이번에 수집하지 않은 섹션은 이전 실행에서 저장한 데이터로 채움
+        for name in REPORT_SECTIONS:
+            if name not in data:
+                data[name] = self.load_saved(name)
+                if data[name] is not None:
+                    logger.metrics.add("cache_hits", stage=f"collect.{name}")
+                    logger.info(f"{SECTIONS[name]['label']} 저장 데이터 사용")
 
-        except Exception as e:
-            logger.error("데이터 수집 중 에러 발생", exc_info=e)
-            raise
+        if self.record:
+            self.save_record(data)
 
         return data
 
-    def process_data(self, data: Dict[str, Any]) -> Dict[str, str]:
-        """수집된 데이터 처리"""
-        logger.info("데이터 처리 시작")
-        processed = {}
-
+    def save_record(self, data: Dict[str, Any]):
+        """수집 데이터 녹화본 저장 (실패해도 리포트 생성은 계속)"""
         try:
-            processed["us_market_summary"] = self.processor.process_us_market_data(
-                data["us_market"]
-            )
-            logger.log_process_step("미국 시장 분석", True)
+            sections = {name: value for name, value in data.items() if value is not None}
+            path = RunRecord(self.date, sections).save()
+            logger.info(f"수집 데이터 녹화 완료: {path}")
+        except Exception as e:
+            logger.warning(f"수집 데이터 녹화 실패: {str(e)}")
 
-            processed["kr_market_summary"] = self.processor.process_kr_market_data(
-                data["kr_market"]
-            )
-            logger.log_process_step("한국 시장 분석", True)
+    def record_history(self, data: Dict[str, Any]) -> int:
+        """수집 지표와 수집기가 조회한 일별 시계열을 히스토리 DB에 저장
 
-            processed["us_treasury_summary"] = self.processor.process_us_treasury_data(
-                data["us_treasury"]
-            )
-            logger.log_process_step("미국 국채 분석", True)
+        대체 데이터 섹션은 제외하며, 저장에 실패해도 리포트 생성은 계속합니다.
+        """
+        try:
+            sections = {
+                name: data.get(name)
+                for name in REPORT_SECTIONS
+                if name not in self.stale
+            }
+            rows = self.history.record_series(series_buffer.drain())
+            return rows + self.history.record(self.date, sections)
+        except Exception as e:
+            logger.warning(f"지표 히스토리 저장 실패: {str(e)}")
+            return 0
 
-            processed["forex_summary"] = self.processor.process_forex_data(
-                data["forex"]
+    def save_snapshot(self, data: Dict[str, Any]) -> Optional[str]:
+        """수집/분석 지표 스냅샷 저장 (실패해도 리포트 생성은 계속)"""
+        try:
+            sections = {name: data.get(name) for name in REPORT_SECTIONS}
+            path = write_snapshot(
+                self.date, sections, stale=self.stale, run_id=logger.metrics.run_id
             )
-            logger.log_process_step("환율 분석", True)
-
-            processed["news_summary"] = self.processor.process_news_data(data["news"])
-            logger.log_process_step("뉴스 분석", True)
+            logger.info(f"지표 스냅샷 저장: {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"지표 스냅샷 저장 실패: {str(e)}")
+            return None
+
+    def charts_exist(self, chart_data: Dict[str, Any]) -> bool:
+        """녹화 데이터에 해당하는 차트 이미지가 이미 있는지 확인"""
+        if CHART_LAYOUT == "composite":
+            paths = [get_composite_image_filepath(self.date)]
+        else:
+            paths = [
+                get_image_filepath(market_name, self.date) for market_name in chart_data
+            ]
+        return all(os.path.exists(path) for path in paths)
+
+    def generate_charts(self, data: Dict[str, Any]) -> bool:
+        """수집한 OHLCV 데이터로 차트 생성 (재조회 없음)"""
+        if "charts" not in self.sections:
+            return True
+
+        if not data.get("charts"):
+            logger.warning("차트 데이터 없음")
+            return False
+
+        # 재생 시 이미 생성된 차트가 있으면 렌더링 모듈을 불러오지 않고 재사용
+        if self.replay_record is not None and self.charts_exist(data["charts"]):
+            logger.metrics.add("cache_hits")
+            logger.info("기존 차트 이미지 재사용")
+            return True
+
+        from utils.chart_generator import generate_all_charts
+
+        # 프로파일 모드에서는 렌더링이 현재 프로세스의 프로파일에 잡히도록 순차 처리
+        workers = 1 if self.profiler else self.workers
+        return generate_all_charts(self.date, workers, data["charts"])
 
-            processed["calendar_summary"] = self.processor.process_economic_calendar(
-                data["calendar"]
-            )
-            logger.log_process_step("경제 지표 분석", True)
+    def process_data(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """수집된 데이터 처리"""
+        logger.info("데이터 처리 시작")
+        processed = {}
 
-            # Buffett Indicator 요약 생성
-            if data["buffett_indicator"]:
-                processed["buffett_indicator_summary"] = (
-                    self.processor.process_buffett_indicator_data(
-                        data["buffett_indicator"]
+        try:
+            for name in REPORT_SECTIONS:
+                section = SECTIONS[name]
+                section_data = data.get(name)
+
+                if section_data is None:
+                    processed[f"{name}_summary"] = UNAVAILABLE_MESSAGES[name]
+                    if name in self.sections:
+                        logger.log_process_step(f"{section['label']} 분석", False)
+                    continue
+
+                with self.stage(f"process.{name}"):
+                    summary = getattr(self.processor, section["process"])(section_data)
+                if name in self.stale:
+                    summary = (
+                        STALE_MESSAGE.format(label=section["label"], date=self.stale[name])
+                        + "\n\n"
+                        + summary
                     )
+                processed[f"{name}_summary"] = summary
+                logger.log_process_step(
+                    f"{section['label']} 분석",
+                    bool(section_data),
+                    logger.metrics.describe(f"process.{name}"),
                 )
-                logger.log_process_step("버핏 지표 분석", True)
-            else:
-                processed["buffett_indicator_summary"] = (
-                    "버핏 지표 데이터를 가져올 수 없습니다."
-                )
-                logger.log_process_step("버핏 지표 분석", False)
-
-            # 옵션 시장 분석 처리
-            if data["options"]:
-                processed["options_summary"] = self.processor.process_options_data(
-                    data["options"]
-                )
-                logger.log_process_step("옵션 시장 분석", True)
-            else:
-                processed["options_summary"] = "옵션 시장 데이터를 가져올 수 없습니다."
-                logger.log_process_step("옵션 시장 분석", False)
 
         except Exception as e:
             logger.error("데이터 처리 중 에러 발생", exc_info=e)
@@ -153,43 +406,86 @@ class ReportGenerator:
         return processed
 
     def generate_report(self) -> str:
-        """최종 리포트 생성"""
+        """최종 리포트 생성
+
+        실행이 끝나면 성공/실패와 관계없이 단계별 소요 시간과 I/O 지표를
+        리포트 옆에 JSON 실행 요약으로 저장합니다.
+        """
+        logger.metrics.reset(
+            date=self.date,
+            sections=self.sections,
+            cache_only=self.cache_only,
+            replay=self.replay_record is not None,
+            refresh=self.refresh,
+        )
+        saved_path = None
+        status = "error"
+        if self.profile:
+            from src.profiler import StageProfiler
+
+            self.profiler = StageProfiler(get_profile_dirpath(self.date))
+
         try:
             # 데이터 수집
             data = self.collect_data()
             logger.info("데이터 수집 완료")
 
             # 차트 생성
-            if generate_all_charts(self.date):
-                logger.info("차트 생성 완료")
-            else:
-                logger.warning("일부 차트 생성 실패")
+            if "charts" in self.sections:
+                with self.stage("charts.render"):
+                    charts_ok = self.generate_charts(data)
+                if charts_ok:
+                    logger.info("차트 생성 완료")
+                else:
+                    logger.warning("일부 차트 생성 실패")
+
+            # 지표 히스토리 저장 (오늘 값을 포함한 연속/최고·최저 문맥에 사용)
+            with self.stage("history") as stage:
+                stage["rows"] += self.record_history(data)
 
             # 데이터 처리
             processed_data = self.process_data(data)
             logger.info("데이터 처리 완료")
 
-            # 리포트 생성
-            report_content = self.builder.build_report(
-                us_market_data=data["us_market"],
-                us_market_summary=processed_data["us_market_summary"],
-                us_treasury_data=data["us_treasury"],
-                us_treasury_summary=processed_data["us_treasury_summary"],
-                kr_market_data=data["kr_market"],
-                kr_market_summary=processed_data["kr_market_summary"],
-                forex_data=data["forex"],
-                forex_summary=processed_data["forex_summary"],
-                buffett_indicator_data=data["buffett_indicator"],
-                buffett_indicator_summary=processed_data["buffett_indicator_summary"],
-                news_summary=processed_data["news_summary"],
-                calendar_summary=processed_data["calendar_summary"],
-                options_data=data["options"],
-                options_summary=processed_data["options_summary"],
-            )
+            # 리포트 문서 구성 (섹션은 형식별 렌더링 단계에서 하나씩 생성)
+            with self.stage("build"):
+                document = self.builder.build_document(
+                    us_market_data=data["us_market"] or {},
+                    us_market_summary=processed_data["us_market_summary"],
+                    us_treasury_data=data["us_treasury"] or {},
+                    us_treasury_summary=processed_data["us_treasury_summary"],
+                    kr_market_data=data["kr_market"] or {},
+                    kr_market_summary=processed_data["kr_market_summary"],
+                    forex_data=data["forex"] or {},
+                    forex_summary=processed_data["forex_summary"],
+                    buffett_indicator_data=data["buffett_indicator"] or {},
+                    buffett_indicator_summary=processed_data[
+                        "buffett_indicator_summary"
+                    ],
+                    news_summary=processed_data["news_summary"],
+                    calendar_summary=processed_data["calendar_summary"],
+                    options_data=data["options"],
+                    options_summary=processed_data["options_summary"],
+                    news_data=data["news"],
+                    calendar_data=data["calendar"],
+                )
 
-            # 리포트 저장
-            saved_path = self.builder.save_report(report_content)
+            # 형식별 렌더링 및 저장 (임시 파일에 기록 후 교체)
+            saved_paths = []
+            for fmt in self.formats:
+                with self.stage(f"render.{fmt}") as stage:
+                    path = self.builder.write_document(document, fmt)
+                    stage["bytes"] += os.path.getsize(path)
+                saved_paths.append(path)
+            saved_path = saved_paths[0]
+            self.builder.render_cache.save()
+
+            with self.stage("snapshot") as stage:
+                snapshot_path = self.save_snapshot(data)
+                if snapshot_path:
+                    stage["bytes"] += os.path.getsize(snapshot_path)
             logger.log_report_generation(True, saved_path)
+            status = "ok"
 
             return saved_path
 
@@ -198,10 +494,68 @@ class ReportGenerator:
             logger.log_report_generation(False)
             raise
 
+        finally:
+            latency_tracker.save()
+            # 롤링 통계는 수집기가 사용하므로 저장할 때 import
+            from utils.rolling_stats import rolling_store
+
+            rolling_store.save()
+            self.history.close()
+            self.write_run_summary(status, saved_path)
+            if self.profiler:
+                self.finish_profile()
 
-def generate_daily_report(date: Optional[str] = None) -> str:
+    def finish_profile(self):
+        """프로파일 요약 생성"""
+        try:
+            summary_path = self.profiler.finish()
+            logger.info(f"프로파일 결과 저장: {summary_path}")
+        except Exception as e:
+            logger.warning(f"프로파일 요약 생성 실패: {str(e)}")
+        finally:
+            self.profiler = None
+
+    def write_run_summary(self, status: str, report_path: Optional[str] = None):
+        """실행 요약(JSON) 저장 (실패해도 리포트 생성에는 영향 없음)"""
+        try:
+            summary_path = logger.metrics.write_summary(
+                get_run_summary_filepath(self.date),
+                status,
+                report_path=report_path,
+                stale=self.stale,
+                latency=latency_tracker.summary(),
+                render_cache=self.builder.render_cache.stats,
+            )
+            logger.info(f"실행 요약 저장: {summary_path}")
+        except Exception as e:
+            logger.warning(f"실행 요약 저장 실패: {str(e)}")
+
+
+def generate_daily_report(
+    date: Optional[str] = None,
+    sections: Optional[Iterable[str]] = None,
+    workers: Optional[int] = CHART_WORKERS,
+    charts: bool = True,
+    cache_only: bool = False,
+    profile: bool = False,
+    record: bool = False,
+    replay: Optional[str] = None,
+    refresh: bool = False,
+    formats: Optional[Iterable[str]] = None,
+) -> str:
     """일일 시장 리포트 생성 헬퍼 함수"""
-    generator = ReportGenerator(date)
+    generator = ReportGenerator(
+        date,
+        sections,
+        workers,
+        charts,
+        cache_only,
+        profile,
+        record,
+        replay,
+        refresh,
+        formats,
+    )
     return generator.generate_report()
 
 
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+@dataclass
+class ReportSection:
+    """리포트의 한 섹션
+
+    Attributes:
+        key: 섹션 이름 (예: "us_market")
+        field: REPORT_TEMPLATE에서 섹션이 들어갈 자리 (예: "us_market_summary")
+        title: 섹션 제목 (REPORT_TEMPLATE의 "## N. 제목"에서 추출)
+        summary: DataProcessor가 생성한 요약문
+        content: 요약문과 상세 정보를 포함한 마크다운 본문
+        data: 섹션 원본 데이터 (JSON 출력용, 없으면 None)
+    """
+
+    key: str
+    field: str
+    title: str
+    summary: str
+    content: str
+    data: Any = None
+
+
+class SectionStream:
+    """순회할 때마다 섹션을 하나씩 생성하는 지연 섹션 목록
+
+    렌더러가 섹션을 하나 출력한 뒤 다음 섹션을 요청하므로 리포트 전체 섹션을
+    메모리에 모으지 않습니다. 출력 형식마다 처음부터 다시 순회할 수 있습니다.
+    """
+
+    def __init__(self, factory: Callable[[], Iterator[ReportSection]]):
+        """
+        Args:
+            factory: 섹션을 템플릿 순서대로 생성하는 이터레이터를 반환하는 함수
+        """
+        self.factory = factory
+
+    def __iter__(self) -> Iterator[ReportSection]:
+        return self.factory()
+
+
+@dataclass
+class ReportDocument:
+    """출력 형식과 무관한 리포트 중간 표현
+
+    수집/처리된 데이터로 한 번 만들어 두면 각 렌더러(Markdown, HTML, JSON)가
+    추가 수집 없이 원하는 형식으로 출력합니다.
+
+    Attributes:
+        date: 리포트 날짜
+        chart_overview: 상단 통합 차트 참조 (마크다운, 통합 차트 모드가 아니면 빈 문자열)
+        sections: 템플릿 순서대로 정렬된 섹션 (리스트 또는 SectionStream)
+        charts: 차트 이름별 이미지 경로
+    """
+
+    date: str
+    chart_overview: str = ""
+    sections: Iterable[ReportSection] = field(default_factory=list)
+    charts: Dict[str, str] = field(default_factory=dict)
+
+    def get_section(self, key: str) -> Optional[ReportSection]:
+        """섹션 이름으로 섹션 찾기"""
+        return next((section for section in self.sections if section.key == key), None)
+
+    def field_values(self) -> Dict[str, str]:
+        """REPORT_TEMPLATE 자리별 마크다운 값 (모든 섹션을 한 번에 생성)"""
+        values = {section.field: section.content for section in self.sections}
+        values["date"] = self.date
+        values["chart_overview"] = self.chart_overview
+        return values
@@ -0,0 +1,89 @@
+import os
+from typing import Iterable
+
+
+class AtomicReportWriter:
+    """리포트를 임시 파일에 순차적으로 쓴 뒤 원자적으로 교체하는 파일 작성기
+
+    섹션이 완성되는 대로 임시 파일에 기록하므로 리포트 전체를 메모리에 모을
+    필요가 없습니다. 모든 내용을 쓴 뒤 fsync하고 os.replace로 교체하므로
+    작성 중 중단되더라도 reports/에는 이전 리포트나 완성된 리포트만 남습니다.
+
+    예:
+        with AtomicReportWriter(path) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        """
+        Args:
+            path: 최종 저장 경로
+            encoding: 파일 인코딩
+        """
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.encoding = encoding
+        self.bytes = 0
+        self._file = None
+
+    def __enter__(self) -> "AtomicReportWriter":
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.tmp_path, "w", encoding=self.encoding)
+        return self
+
+    def write(self, text: str):
+        """내용 추가 (임시 파일에 바로 기록)"""
+        self._file.write(text)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._file.close()
+        except BaseException:
+            self._discard()
+            raise
+
+        if exc_type is not None:
+            self._discard()
+            return False
+
+        self.bytes = os.path.getsize(self.tmp_path)
+        os.replace(self.tmp_path, self.path)
+        fsync_directory(os.path.dirname(self.path))
+        return False
+
+    def _discard(self):
+        """작성 중이던 임시 파일 삭제"""
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+def fsync_directory(directory: str):
+    """디렉토리 항목 변경(파일 교체)을 디스크에 반영 (지원하지 않는 OS에서는 무시)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: str, chunks: Iterable[str], encoding: str = "utf-8") -> int:
+    """문자열 조각을 순서대로 기록하고 원자적으로 교체
+
+    Returns:
+        int: 기록한 바이트 수
+    """
+    with AtomicReportWriter(path, encoding) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.bytes
@@ -0,0 +1,88 @@
+import gzip
+import os
+import pickle
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from config.settings import DATE_FORMAT, get_record_filepath
+
+RECORD_VERSION = 1
+
+
+class RunRecord:
+    """한 번의 실행에서 수집한 데이터 녹화본
+
+    모든 섹션의 수집 결과를 하나의 gzip 압축 pickle 파일로 저장합니다.
+    재생 시에는 수집기를 import 하지 않고 녹화본의 데이터를 그대로 사용하므로
+    네트워크 없이 같은 수치로 과거 리포트를 다시 만들 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        date: str,
+        sections: Optional[Dict[str, Any]] = None,
+        recorded_at: Optional[str] = None,
+    ):
+        """
+        Args:
+            date: 리포트 날짜
+            sections: {섹션 이름: 수집 데이터}
+            recorded_at: 녹화 시각 (기본값: 현재 시각)
+        """
+        self.date = date
+        self.sections = dict(sections or {})
+        self.recorded_at = recorded_at or datetime.now().isoformat(timespec="seconds")
+
+    def get(self, name: str) -> Optional[Any]:
+        """섹션 데이터 반환 (녹화되지 않았으면 None)"""
+        return self.sections.get(name)
+
+    def save(self, path: Optional[str] = None) -> str:
+        """녹화본 저장 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            str: 저장 경로
+        """
+        path = path or get_record_filepath(self.date)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        payload = {
+            "version": RECORD_VERSION,
+            "date": self.date,
+            "recorded_at": self.recorded_at,
+            "sections": self.sections,
+        }
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, source: str) -> "RunRecord":
+        """녹화본 로드
+
+        Args:
+            source: 리포트 날짜(YYYY-MM-DD) 또는 녹화 파일 경로
+
+        Raises:
+            FileNotFoundError: 녹화 파일이 없는 경우
+            ValueError: 지원하지 않는 녹화 형식인 경우
+        """
+        path = source
+        try:
+            datetime.strptime(source, DATE_FORMAT)
+            path = get_record_filepath(source)
+        except ValueError:
+            pass
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"녹화 파일을 찾을 수 없습니다: {path}")
+
+        with gzip.open(path, "rb") as f:
+            payload = pickle.load(f)
+
+        if payload.get("version") != RECORD_VERSION:
+            raise ValueError(f"지원하지 않는 녹화 형식: {payload.get('version')}")
+
+        return cls(payload["date"], payload["sections"], payload["recorded_at"])
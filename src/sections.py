@@ -0,0 +1,202 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+# 리포트 섹션 정의
+#
+# 각 섹션은 수집 함수, 요약 생성 함수(DataProcessor 메서드 이름), 의존 섹션,
+# 빈 결과 허용 여부로 구성됩니다. 수집 함수는 호출 시점에 수집기 모듈을 import
+# 하므로 선택되지 않은 섹션의 라이브러리(yfinance, pykrx, selenium, fredapi 등)는
+# 로드되지 않습니다. 대부분의 수집기는 모든 요청이 실패하면 빈 값을 반환하므로
+# allow_empty가 False인 섹션의 빈 결과는 수집 실패(재시도, 이전 데이터 대체)로
+# 처리합니다.
+
+
+def collect_kr_market() -> Dict[str, Any]:
+    """한국 시장 데이터 수집"""
+    from utils.kr_market import get_all_kr_market_data
+
+    return get_all_kr_market_data()
+
+
+def collect_us_market() -> Dict[str, Any]:
+    """미국 시장 데이터 수집"""
+    from utils.us_market import get_all_us_market_data
+
+    return get_all_us_market_data()
+
+
+def collect_us_treasury() -> Dict[str, Any]:
+    """미국 국채 데이터 수집"""
+    from utils.us_treasury import get_all_treasury_data
+
+    return get_all_treasury_data()
+
+
+def collect_forex() -> Dict[str, Any]:
+    """환율 데이터 수집"""
+    from utils.forex import get_all_forex_data
+
+    return get_all_forex_data()
+
+
+def collect_news() -> Dict[str, Any]:
+    """뉴스 데이터 수집"""
+    from utils.news import get_all_news
+
+    return get_all_news()
+
+
+def collect_calendar() -> List[Dict[str, Any]]:
+    """경제 지표 일정 수집"""
+    from utils.calendar import EconomicCalendar
+
+    return EconomicCalendar().get_important_events() or []
+
+
+def collect_buffett_indicator() -> Optional[Dict[str, Any]]:
+    """버핏 지표 수집"""
+    from utils.buffett_indicator import BuffettIndicator
+
+    return BuffettIndicator().get_current_status()
+
+
+def collect_options() -> Dict[str, Any]:
+    """옵션 데이터 수집 및 분석"""
+    from utils.option_data import get_market_option_data
+    from utils.option_analysis import analyze_market_options
+
+    market_options = get_market_option_data(expiry_type="monthly", periods=3)
+    if not market_options:
+        return {}
+    return analyze_market_options(market_options)
+
+
+def collect_charts() -> Dict[str, Any]:
+    """차트용 OHLCV 데이터 수집"""
+    from utils.chart_generator import collect_chart_data
+
+    return collect_chart_data()
+
+
+SECTIONS: Dict[str, Dict[str, Any]] = {
+    "kr_market": {
+        "label": "한국 시장",
+        "collect": collect_kr_market,
+        "process": "process_kr_market_data",
+        "requires": ["charts"],
+        "allow_empty": False,
+    },
+    "us_market": {
+        "label": "미국 시장",
+        "collect": collect_us_market,
+        "process": "process_us_market_data",
+        "requires": ["charts"],
+        "allow_empty": False,
+    },
+    "us_treasury": {
+        "label": "미국 국채",
+        "collect": collect_us_treasury,
+        "process": "process_us_treasury_data",
+        "requires": [],
+        "allow_empty": False,
+    },
+    "forex": {
+        "label": "환율",
+        "collect": collect_forex,
+        "process": "process_forex_data",
+        "requires": [],
+        "allow_empty": False,
+    },
+    "news": {
+        "label": "뉴스",
+        "collect": collect_news,
+        "process": "process_news_data",
+        "requires": [],
+        "allow_empty": False,
+    },
+    "calendar": {
+        "label": "경제 지표",
+        "collect": collect_calendar,
+        "process": "process_economic_calendar",
+        "requires": [],
+        # 예정된 주요 지표가 없는 날은 빈 목록이 정상 결과
+        "allow_empty": True,
+    },
+    "buffett_indicator": {
+        "label": "버핏 지표",
+        "collect": collect_buffett_indicator,
+        "process": "process_buffett_indicator_data",
+        "requires": [],
+        "allow_empty": False,
+    },
+    "options": {
+        "label": "옵션 시장",
+        "collect": collect_options,
+        "process": "process_options_data",
+        "requires": [],
+        "allow_empty": False,
+    },
+    # 리포트 본문 섹션은 아니지만 시장 섹션의 차트 이미지에 필요한 데이터
+    "charts": {
+        "label": "차트",
+        "collect": collect_charts,
+        "process": None,
+        "requires": [],
+        "allow_empty": False,
+    },
+}
+
+# 리포트에 포함되는 섹션 (수집 순서)
+REPORT_SECTIONS = [name for name, section in SECTIONS.items() if section["process"]]
+
+# 데이터가 없을 때 표시할 요약 문구
+UNAVAILABLE_MESSAGES = {
+    "kr_market": "한국 시장 데이터를 가져올 수 없습니다.",
+    "us_market": "미국 시장 데이터를 가져올 수 없습니다.",
+    "us_treasury": "미국 국채 데이터를 가져올 수 없습니다.",
+    "forex": "환율 데이터를 가져올 수 없습니다.",
+    "news": "뉴스 데이터를 가져올 수 없습니다.",
+    "calendar": "경제 지표 데이터를 가져올 수 없습니다.",
+    "buffett_indicator": "버핏 지표 데이터를 가져올 수 없습니다.",
+    "options": "옵션 시장 데이터를 가져올 수 없습니다.",
+}
+
+# 수집 실패로 이전 데이터를 대신 사용할 때 요약 앞에 표시할 문구
+STALE_MESSAGE = "> ⚠️ 최신 {label} 데이터를 가져오지 못해 {date} 수집 데이터를 표시합니다."
+
+
+def resolve_sections(
+    names: Optional[Iterable[str]] = None, charts: bool = True
+) -> List[str]:
+    """요청된 섹션과 의존 섹션을 실행 순서대로 반환
+
+    Args:
+        names: 실행할 섹션 이름 (None이면 리포트 전체 섹션)
+        charts: 차트 생성 여부 (False면 charts 섹션 제외)
+
+    Returns:
+        List[str]: SECTIONS 정의 순서로 정렬된 섹션 이름 목록
+
+    Raises:
+        ValueError: 알 수 없는 섹션 이름이 포함된 경우
+    """
+    requested = list(REPORT_SECTIONS if names is None else names)
+    unknown = [name for name in requested if name not in SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 섹션: {', '.join(unknown)} "
+            f"(사용 가능: {', '.join(SECTIONS)})"
+        )
+
+    selected = set()
+    pending = list(requested)
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        selected.add(name)
+        pending.extend(SECTIONS[name]["requires"])
+
+    if not charts:
+        selected.discard("charts")
+
+    return [name for name in SECTIONS if name in selected]
@@ -0,0 +1,221 @@
+import glob
+import json
+import math
+import os
+from datetime import date as date_type
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import DATE_FORMAT, get_snapshot_dirpath, get_snapshot_filepath
+from src.logger import logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용 (출력 형식은 동일)
+    orjson = None
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# 수치 지표가 없는 텍스트 위주 섹션 (스냅샷에서 제외)
+TEXT_SECTIONS = ("news", "calendar")
+
+# 지표 키 구분자 (예: "us_market.S&P 500.close")
+KEY_SEPARATOR = "."
+
+
+def flatten_metrics(
+    data: Any, prefix: str = ""
+) -> Tuple[Dict[str, Optional[float]], Dict[str, str]]:
+    """섹션 데이터를 평탄화하여 수치 지표와 문자열 라벨로 분리
+
+    중첩된 딕셔너리/리스트는 키를 "."로 이어 붙이고, 리스트는 순번을 키로
+    사용합니다. 시계열(DataFrame/Series)은 일별 스냅샷 대상이 아니므로 제외하며,
+    NaN/무한대는 None으로 기록합니다.
+
+    Returns:
+        Tuple[Dict[str, Optional[float]], Dict[str, str]]: (수치 지표, 라벨)
+    """
+    metrics: Dict[str, Optional[float]] = {}
+    labels: Dict[str, str] = {}
+
+    def visit(value: Any, key: str):
+        if isinstance(value, dict):
+            for name, item in value.items():
+                visit(item, f"{key}{KEY_SEPARATOR}{name}" if key else str(name))
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                visit(item, f"{key}{KEY_SEPARATOR}{index}")
+        elif getattr(value, "ndim", 0) > 0:
+            # DataFrame/Series/ndarray (pandas/numpy를 import하지 않고 판별)
+            return
+        else:
+            if type(value).__module__ == "numpy":
+                value = value.item()
+            if isinstance(value, bool):
+                metrics[key] = float(value)
+            elif isinstance(value, (int, float)):
+                number = float(value)
+                metrics[key] = number if math.isfinite(number) else None
+            elif isinstance(value, (datetime, date_type)):
+                labels[key] = value.isoformat()
+            elif isinstance(value, str):
+                labels[key] = value
+
+    visit(data, prefix)
+    return metrics, labels
+
+
+def build_snapshot(
+    date: str,
+    sections: Dict[str, Any],
+    stale: Optional[Dict[str, str]] = None,
+    run_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """수집/분석 결과 전체의 지표 스냅샷 생성
+
+    Args:
+        date: 리포트 날짜
+        sections: {섹션 이름: 수집 데이터} (TEXT_SECTIONS는 제외)
+        stale: 대체 데이터를 사용한 섹션 {섹션 이름: 데이터 수집 날짜}
+        run_id: 실행 ID
+    """
+    metrics: Dict[str, Optional[float]] = {}
+    labels: Dict[str, str] = {}
+    for name, data in sections.items():
+        if data is None or name in TEXT_SECTIONS:
+            continue
+        section_metrics, section_labels = flatten_metrics(data, name)
+        metrics.update(section_metrics)
+        labels.update(section_labels)
+
+    return {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "date": date,
+        "run_id": run_id,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "stale": dict(stale or {}),
+        "metrics": metrics,
+        "labels": labels,
+    }
+
+
+def dumps(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def loads(content: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def write_snapshot(
+    date: str,
+    sections: Dict[str, Any],
+    stale: Optional[Dict[str, str]] = None,
+    run_id: Optional[str] = None,
+    path: Optional[str] = None,
+) -> str:
+    """지표 스냅샷 저장 (임시 파일에 쓴 뒤 교체)
+
+    Returns:
+        str: 저장 경로
+    """
+    path = path or get_snapshot_filepath(date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    content = dumps(build_snapshot(date, sections, stale, run_id))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """스냅샷 파일 로드 (읽을 수 없거나 지원하지 않는 스키마이면 None)"""
+    try:
+        with open(path, "rb") as f:
+            payload = loads(f.read())
+    except Exception as e:
+        logger.warning(f"지표 스냅샷 로드 실패 ({path}): {str(e)}")
+        return None
+
+    if payload.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+        logger.warning(
+            f"지원하지 않는 지표 스냅샷 형식 ({path}): {payload.get('schema_version')}"
+        )
+        return None
+    return payload
+
+
+def list_snapshots(directory: Optional[str] = None) -> List[Tuple[str, str]]:
+    """저장된 스냅샷 (날짜, 경로) 목록 (날짜 오름차순)"""
+    snapshots = []
+    for path in glob.glob(os.path.join(directory or get_snapshot_dirpath(), "*.json")):
+        date = os.path.basename(path).split("_", 1)[0]
+        try:
+            datetime.strptime(date, DATE_FORMAT)
+        except ValueError:
+            continue
+        snapshots.append((date, path))
+    return sorted(snapshots)
+
+
+def load_snapshots(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    metrics: Optional[Iterable[str]] = None,
+    directory: Optional[str] = None,
+) -> "pd.DataFrame":
+    """기간 내 스냅샷의 수치 지표를 날짜별 DataFrame으로 로드
+
+    예:
+        history = load_snapshots(start="2025-01-01", metrics=["buffett_indicator.zscore"])
+        history["buffett_indicator.zscore"].plot()
+
+    Args:
+        start: 시작 날짜 (포함, 기본값: 처음)
+        end: 종료 날짜 (포함, 기본값: 마지막)
+        metrics: 불러올 지표 키 (기본값: 전체, 접두어 "us_market."처럼 "."으로 끝나면 해당 섹션 전체)
+        directory: 스냅샷 디렉토리 (기본값: settings.get_snapshot_dirpath())
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스, 지표 키 컬럼 (없는 값은 NaN)
+    """
+    # pandas는 시작 시간에 영향이 커서 실제로 필요할 때만 로드
+    import pandas as pd
+
+    wanted = list(metrics) if metrics else None
+    if wanted is not None:
+        exact = {name for name in wanted if not name.endswith(KEY_SEPARATOR)}
+        prefixes = tuple(name for name in wanted if name.endswith(KEY_SEPARATOR))
+    rows, index = [], []
+
+    for date, path in list_snapshots(directory):
+        if (start and date < start) or (end and date > end):
+            continue
+        payload = read_snapshot(path)
+        if payload is None:
+            continue
+
+        values = payload["metrics"]
+        if wanted is not None:
+            values = {
+                key: value
+                for key, value in values.items()
+                if key in exact or key.startswith(prefixes)
+            }
+        rows.append(values)
+        index.append(date)
+
+    frame = pd.DataFrame.from_records(rows, index=pd.to_datetime(index))
+    frame.index.name = "date"
+    return frame.astype("float64")
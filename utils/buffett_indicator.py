@@ -2,16 +2,11 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
-from fredapi import Fred
-import sys
-import os
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
-
-from config.settings import FEDAPI_KEY
 from src.logger import logger
+from utils.rate_limiter import yahoo_call
+from utils.latency import timed_call
+from utils.http_session import get_session, get_fred
 
 
 class BuffettIndicator:
@@ -21,16 +16,19 @@ class BuffettIndicator:
         """
         self.start_date = datetime(1980, 1, 1)
         self.end_date = datetime.now()
-        self.fred = Fred(api_key=FEDAPI_KEY)
+        self.fred = get_fred()
 
     def get_wilshire_data(self) -> Optional[pd.DataFrame]:
         """Wilshire 5000 Total Market Index 데이터 수집"""
         try:
             ticker = "^W5000"
-            wilshire = yf.download(
+            wilshire = yahoo_call(
+                yf.download,
                 ticker,
                 start=self.start_date.strftime("%Y-%m-%d"),
                 end=self.end_date.strftime("%Y-%m-%d"),
+                session=get_session(),
+                hedge=False,  # yf.download은 전역 결과 저장소를 공유하여 동시 호출 불가
             )
 
             if wilshire.empty:
@@ -52,7 +50,9 @@ class BuffettIndicator:
         """미국 GDP 데이터 수집"""
         try:
             # FRED에서 GDP 데이터 수집 (Quarterly)
-            gdp = self.fred.get_series(
+            gdp = timed_call(
+                "fred.get_series",
+                self.fred.get_series,
                 "GDP",
                 observation_start=self.start_date.strftime("%Y-%m-%d"),
                 observation_end=self.end_date.strftime("%Y-%m-%d"),
@@ -188,10 +188,13 @@ class BuffettIndicator:
                 return None
 
             # S&P 500 데이터 가져오기 (시장 수익률 대용)
-            spy_data = yf.download(
+            spy_data = yahoo_call(
+                yf.download,
                 "^GSPC",
                 start=self.start_date.strftime("%Y-%m-%d"),
                 end=self.end_date.strftime("%Y-%m-%d"),
+                session=get_session(),
+                hedge=False,
             )
 
             # Close 가격을 Series로 변환하여 데이터프레임에 추가
@@ -11,6 +11,9 @@ from zoneinfo import ZoneInfo
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 
+from config.settings import REQUEST_TIMEOUT
+from src.isolation import CollectCancelledError, check_cancelled
+
 
 class EconomicCalendar:
     def __init__(self):
@@ -66,6 +69,7 @@ class EconomicCalendar:
 
             service = Service(ChromeDriverManager().install())
             driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(REQUEST_TIMEOUT)
 
             stealth(
                 driver,
@@ -155,12 +159,20 @@ class EconomicCalendar:
             return None
 
     def get_important_events(self) -> List[Dict[str, Any]]:
-        """경제 지표 수집"""
+        """경제 지표 수집
+
+        수집 제한 시간이 지나면(src.isolation.check_cancelled) 다음 확인 지점에서
+        중단하고 크롬 드라이버를 종료합니다.
+
+        Raises:
+            CollectCancelledError: 수집 제한 시간이 지나 취소된 경우
+        """
         driver = None
         events = []
 
         try:
             driver = self.setup_driver()
+            check_cancelled()
             driver.get(self.base_url)
 
             # 기본 설정 및 필터 적용
@@ -178,6 +190,7 @@ class EconomicCalendar:
                 print("No cookie button or already accepted")
 
             # 날짜 범위 설정
+            check_cancelled()
             self.set_date_range(driver)
 
             # 이벤트 수집
@@ -189,6 +202,7 @@ class EconomicCalendar:
             ]
 
             for selector in selectors:
+                check_cancelled()
                 try:
                     found_events = WebDriverWait(driver, 10).until(
                         EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
@@ -198,6 +212,7 @@ class EconomicCalendar:
                     )
 
                     for event in found_events:
+                        check_cancelled()
                         try:
                             driver.execute_script(
                                 "arguments[0].scrollIntoView(true);", event
@@ -218,15 +233,22 @@ class EconomicCalendar:
                             print(f"Error processing event: {str(e)}")
                             continue
 
+                except CollectCancelledError:
+                    raise
                 except Exception as e:
                     print(f"Error with selector {selector}: {str(e)}")
                     continue
 
             return events
 
+        except CollectCancelledError:
+            print("Economic calendar collection cancelled (deadline exceeded)")
+            raise
+
         except Exception as e:
+            # 수집 실패는 예외로 전달 (빈 목록은 "예정된 지표 없음"이라는 정상 결과)
             print(f"Error collecting economic calendar: {str(e)}")
-            return []
+            raise
 
         finally:
             if driver:
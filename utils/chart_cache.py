@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, Optional
+import pandas as pd
+
+from config.settings import (
+    CHART_CACHE_DIR,
+    CHART_CACHE_MAX_AGE_DAYS,
+    CHART_CACHE_MAX_BYTES,
+)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def chart_cache_key(hist: pd.DataFrame, params: Dict[str, Any]) -> str:
+    """
+    차트 입력 데이터와 스타일 파라미터로 캐시 키를 생성합니다.
+
+    Args:
+        hist (pd.DataFrame): 차트에 사용되는 OHLCV 데이터
+        params (Dict[str, Any]): 차트 모양을 결정하는 파라미터 (제목, 크기, 스타일 등)
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    digest = hashlib.sha256()
+
+    # 인덱스(날짜)와 OHLCV 값만 해시 (부가 컬럼 변화는 차트에 영향 없음)
+    columns = [col for col in OHLCV_COLUMNS if col in hist.columns]
+    frame_hash = pd.util.hash_pandas_object(hist[columns], index=True)
+    digest.update(frame_hash.values.tobytes())
+    digest.update(",".join(columns).encode("utf-8"))
+
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_cache_path(key: str, extension: str = "png") -> str:
+    """캐시 키에 해당하는 저장 경로 반환"""
+    return os.path.join(CHART_CACHE_DIR, f"{key}.{extension}")
+
+
+def get_cached_chart(key: str, extension: str = "png") -> Optional[str]:
+    """캐시된 차트가 있으면 경로 반환 (정리 기준이 되는 사용 시각 갱신)"""
+    path = get_cache_path(key, extension)
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def prune_cache(
+    max_age_days: Optional[float] = CHART_CACHE_MAX_AGE_DAYS,
+    max_bytes: Optional[int] = CHART_CACHE_MAX_BYTES,
+) -> int:
+    """
+    오래 사용하지 않은 캐시 차트를 삭제합니다.
+
+    마지막 사용 후 max_age_days가 지난 파일을 먼저 지우고, 남은 파일의 전체
+    크기가 max_bytes를 넘으면 사용한 지 오래된 것부터 삭제합니다. 날짜별
+    디렉토리의 하드링크는 별도 파일로 남으므로 이미 생성된 리포트에는 영향이
+    없습니다.
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    try:
+        entries = [
+            entry for entry in os.scandir(CHART_CACHE_DIR) if entry.is_file()
+        ]
+    except FileNotFoundError:
+        return 0
+
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort()  # 사용한 지 오래된 순
+
+    expire_before = (
+        time.time() - max_age_days * 86400 if max_age_days is not None else None
+    )
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for mtime, size, path in files:
+        expired = expire_before is not None and mtime < expire_before
+        oversized = max_bytes is not None and total > max_bytes
+        if not (expired or oversized):
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def link_chart(cached_path: str, save_path: str) -> str:
+    """
+    캐시된 차트를 날짜별 디렉토리에 하드링크합니다.
+
+    하드링크를 지원하지 않는 파일시스템에서는 복사로 대체합니다.
+
+    Returns:
+        str: 저장 경로
+    """
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+    if os.path.exists(save_path):
+        if os.path.samefile(cached_path, save_path):
+            return save_path
+        os.remove(save_path)
+
+    try:
+        os.link(cached_path, save_path)
+    except OSError:
+        shutil.copy2(cached_path, save_path)
+
+    return save_path
@@ -1,38 +1,65 @@
+import contextvars
 import os
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta, timezone
 import yfinance as yf
-from typing import Optional
-import sys
+from typing import Optional, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
 import mplfinance as mpf
 import matplotlib.font_manager as fm
 from pykrx import stock
 
-# 한글 폰트 설정
+# 한글 폰트 경로
 if os.name == "nt":  # Windows
     font_path = "C:/Windows/Fonts/malgun.ttf"
 else:  # Linux
     font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
 
-font_name = fm.FontProperties(fname=font_path).get_name()
-plt.rcParams["font.family"] = font_name
-
-# mplfinance 스타일에 폰트 적용
-s = mpf.make_mpf_style(base_mpf_style="yahoo", rc={"font.family": font_name})
-
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
-
+from src.logger import init_worker_logging, logger
+from utils.chart_renderer import get_chart_template, get_composite_template
+from utils.image_output import finalize_image
+from utils.rate_limiter import yahoo_call
+from utils.latency import timed_call
+from utils.http_session import get_session
+from utils.chart_cache import (
+    chart_cache_key,
+    get_cache_path,
+    get_cached_chart,
+    link_chart,
+    prune_cache,
+)
 from config.settings import (
     US_INDICES,
     KRX_INDICES,
     LOOKBACK_DAYS,
+    CHART_WORKERS,
+    CHART_CACHE_ENABLED,
+    CHART_RENDERER,
+    CHART_FORMAT,
+    CHART_DPI,
+    CHART_QUANTIZE_COLORS,
+    CHART_WEBP_QUALITY,
+    CHART_LAYOUT,
     get_image_filepath,
+    get_composite_image_filepath,
     DATE_FORMAT,
 )
 
+# 차트 모양을 결정하는 mplfinance 파라미터 (캐시 키에도 사용)
+CHART_PLOT_PARAMS = {
+    "type": "candle",
+    "figsize": (10, 6),
+    "volume": True,
+    "panel_ratios": (5, 1),  # 가격:거래량 패널 비율
+    "ylabel": "가격",
+    "ylabel_lower": "거래량",
+}
+
+# 프로세스별 mplfinance 스타일과 폰트 이름 (setup_chart_style에서 1회 생성)
+_chart_style = None
+_font_name = None
+
 MARKET_NAMES_KR = {
     "S&P 500": "S&P 500 지수",
     "NASDAQ": "나스닥 지수",
@@ -42,6 +69,31 @@ MARKET_NAMES_KR = {
 }
 
 
+def setup_chart_style():
+    """한글 폰트와 mplfinance 스타일을 설정 (프로세스당 1회)"""
+    global _chart_style, _font_name
+    if _chart_style is None:
+        if os.path.exists(font_path):
+            _font_name = fm.FontProperties(fname=font_path).get_name()
+        else:
+            # 한글 폰트가 없는 환경에서는 기본 폰트 사용
+            print(f"한글 폰트를 찾을 수 없음: {font_path}")
+            _font_name = plt.rcParams["font.family"][0]
+        plt.rcParams["font.family"] = _font_name
+
+        # mplfinance 스타일에 폰트 적용
+        _chart_style = mpf.make_mpf_style(
+            base_mpf_style="yahoo", rc={"font.family": _font_name}
+        )
+    return _chart_style
+
+
+def init_render_worker(log_queue, run_id: str, stage: Optional[str]):
+    """렌더링 워커 초기화 (로그를 부모 프로세스로 전달, 차트 스타일 설정)"""
+    init_worker_logging(log_queue, run_id, stage)
+    setup_chart_style()
+
+
 def get_market_end_time(market_name: str) -> datetime:
     """시장별 장 마감 시간 반환"""
     now = datetime.now(timezone(timedelta(hours=9)))  # KST
@@ -90,7 +142,13 @@ def get_krx_data(
         end_date_str = end_date.strftime("%Y%m%d")
 
         # KRX에서 데이터 조회
-        df = stock.get_index_ohlcv_by_date(start_date_str, end_date_str, ticker)
+        df = timed_call(
+            "krx.ohlcv",
+            stock.get_index_ohlcv_by_date,
+            start_date_str,
+            end_date_str,
+            ticker,
+        )
 
         if df.empty:
             print(f"데이터를 찾을 수 없음: {ticker}")
@@ -103,6 +161,114 @@ def get_krx_data(
         return None
 
 
+def get_chart_data(
+    ticker: str, market_name: str, lookback_days: int = LOOKBACK_DAYS
+) -> Tuple[Optional[pd.DataFrame], datetime]:
+    """차트용 OHLCV 데이터 조회
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], datetime]: (OHLCV 데이터, 기준 종료 시점)
+    """
+    # 시장별 적절한 종료 시점 설정
+    end_date = get_market_end_time(market_name)
+    start_date = end_date - timedelta(days=min(lookback_days, 30))
+
+    # 데이터 수집
+    if market_name in ["KOSPI", "KOSDAQ"]:
+        # KRX 데이터 사용
+        hist = get_krx_data(ticker, start_date, end_date)
+    else:
+        # 미국 시장은 기존 yfinance 사용
+        if not ticker.startswith("^"):
+            ticker = f"^{ticker}"
+        yf_ticker = yf.Ticker(ticker, session=get_session())
+        hist = yahoo_call(
+            yf_ticker.history,
+            start=start_date.strftime("%Y-%m-%d"),
+            end=(end_date + timedelta(days=1)).strftime("%Y-%m-%d"),
+            interval="1d",
+        )
+
+    return hist, end_date
+
+
+def render_price_chart(
+    hist: pd.DataFrame, market_name: str, save_path: str
+) -> Optional[str]:
+    """수집된 OHLCV 데이터로 캔들 차트를 그려 저장
+
+    프로세스 풀의 워커에서도 호출되므로 데이터 조회 없이 렌더링만 수행합니다.
+    """
+    try:
+        style = setup_chart_style()
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+        # 한글 제목 사용
+        kr_name = MARKET_NAMES_KR.get(market_name, market_name)
+
+        # 차트 생성 후 임시 파일에서 교체하여 불완전한 이미지가 남지 않도록 함
+        # 항상 PNG로 렌더링한 뒤 설정된 형식(WebP/양자화 PNG)으로 변환
+        root, _ = os.path.splitext(save_path)
+        tmp_path = f"{root}.{os.getpid()}.tmp.png"
+        title = f"{kr_name} 가격 추이"
+
+        if CHART_RENDERER == "fast":
+            # 재사용 템플릿에 데이터만 교체하여 Agg 캔버스로 저장
+            template = get_chart_template(
+                figsize=CHART_PLOT_PARAMS["figsize"],
+                panel_ratios=CHART_PLOT_PARAMS["panel_ratios"],
+                dpi=CHART_DPI,
+                ylabel=CHART_PLOT_PARAMS["ylabel"],
+                ylabel_lower=CHART_PLOT_PARAMS["ylabel_lower"],
+                font_name=_font_name,
+            )
+            template.render(hist, title, tmp_path)
+        else:
+            mpf.plot(
+                hist,
+                title=title,
+                savefig=dict(fname=tmp_path, dpi=CHART_DPI),
+                style=style,
+                **CHART_PLOT_PARAMS,
+            )
+            plt.close("all")
+
+        return finalize_image(tmp_path, save_path)
+
+    except Exception as e:
+        print(f"차트 생성 중 오류 발생 ({market_name}): {str(e)}")
+        return None
+
+
+def render_composite_chart(
+    frames: Dict[str, pd.DataFrame], save_path: str
+) -> Optional[str]:
+    """모든 지수를 하나의 다중 패널 이미지로 렌더링
+
+    지수별 패널은 템플릿 렌더러로 그리며, 리포트에서는 이 이미지 한 장만 참조합니다.
+    """
+    try:
+        setup_chart_style()
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+        titles = {
+            MARKET_NAMES_KR.get(market_name, market_name): hist
+            for market_name, hist in frames.items()
+        }
+        root, _ = os.path.splitext(save_path)
+        tmp_path = f"{root}.{os.getpid()}.tmp.png"
+
+        template = get_composite_template(
+            len(titles), dpi=CHART_DPI, font_name=_font_name
+        )
+        template.render(titles, tmp_path)
+        return finalize_image(tmp_path, save_path)
+
+    except Exception as e:
+        print(f"통합 차트 생성 중 오류 발생: {str(e)}")
+        return None
+
+
 def generate_price_chart(
     ticker: str,
     market_name: str,
@@ -111,24 +277,7 @@ def generate_price_chart(
 ) -> Optional[str]:
     """차트 생성"""
     try:
-        # 시장별 적절한 종료 시점 설정
-        end_date = get_market_end_time(market_name)
-        start_date = end_date - timedelta(days=min(lookback_days, 30))
-
-        # 데이터 수집
-        if market_name in ["KOSPI", "KOSDAQ"]:
-            # KRX 데이터 사용
-            hist = get_krx_data(ticker, start_date, end_date)
-        else:
-            # 미국 시장은 기존 yfinance 사용
-            if not ticker.startswith("^"):
-                ticker = f"^{ticker}"
-            yf_ticker = yf.Ticker(ticker)
-            hist = yf_ticker.history(
-                start=start_date.strftime("%Y-%m-%d"),
-                end=(end_date + timedelta(days=1)).strftime("%Y-%m-%d"),
-                interval="1d",
-            )
+        hist, end_date = get_chart_data(ticker, market_name, lookback_days)
 
         if hist is None or hist.empty:
             print(f"데이터를 찾을 수 없음: {market_name}")
@@ -136,48 +285,222 @@ def generate_price_chart(
 
         # 저장 경로 설정
         save_path = get_image_filepath(market_name, end_date.strftime(DATE_FORMAT))
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        return _render_jobs([(hist, market_name, save_path)], max_workers=1)[0]
 
-        # 한글 제목 사용
-        kr_name = MARKET_NAMES_KR.get(market_name, market_name)
+    except Exception as e:
+        print(f"차트 생성 중 오류 발생 ({market_name}): {str(e)}")
+        return None
 
-        # 차트 생성 및 저장
-        mpf.plot(
-            hist,
-            type="candle",
-            title=f"{kr_name} 가격 추이",
-            savefig=save_path,
-            style=s,
-            figsize=(10, 6),
-            volume=True,
-            panel_ratios=(5, 1),  # 가격:거래량 패널 비율
-            ylabel="가격",
-            ylabel_lower="거래량",
-        )
 
-        plt.close()
-        return save_path
+def collect_chart_data(
+    max_workers: Optional[int] = CHART_WORKERS,
+) -> Dict[str, Tuple[pd.DataFrame, str]]:
+    """모든 시장 지수의 차트용 OHLCV 데이터를 병렬로 조회
+
+    Args:
+        max_workers: 조회 스레드 수 (기본값: settings.CHART_WORKERS, None이면 CPU 수)
 
+    Returns:
+        Dict[str, Tuple[pd.DataFrame, str]]: {시장 이름: (OHLCV 데이터, 기준 날짜)}
+            조회에 실패한 시장은 제외됩니다.
+    """
+    markets = {**KRX_INDICES, **US_INDICES}
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(markets)))
+
+    def fetch(item):
+        market_name, ticker = item
+        try:
+            hist, end_date = get_chart_data(ticker, market_name)
+        except Exception as e:
+            print(f"차트 데이터 조회 중 오류 발생 ({market_name}): {str(e)}")
+            return market_name, None
+
+        if hist is None or hist.empty:
+            print(f"데이터를 찾을 수 없음: {market_name}")
+            return market_name, None
+
+        return market_name, (hist, end_date.strftime(DATE_FORMAT))
+
+    # 데이터 조회는 I/O 작업이므로 스레드 풀 사용
+    # (수집 제한 시간의 취소 신호가 조회 스레드에도 전달되도록 작업마다 컨텍스트 복사)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, fetch, item)
+            for item in markets.items()
+        ]
+        results = [future.result() for future in futures]
+
+    return {market_name: result for market_name, result in results if result}
+
+
+def _chart_key(hist: pd.DataFrame, market_name: str) -> str:
+    """차트 입력 데이터와 스타일로 캐시 키 생성"""
+    params = {
+        "market_name": market_name,
+        "title": MARKET_NAMES_KR.get(market_name, market_name),
+        "base_style": "yahoo",
+        "renderer": CHART_RENDERER,
+        "font": os.path.basename(font_path),
+        "format": CHART_FORMAT,
+        "dpi": CHART_DPI,
+        "quantize_colors": CHART_QUANTIZE_COLORS,
+        "webp_quality": CHART_WEBP_QUALITY,
+        **CHART_PLOT_PARAMS,
+    }
+    return chart_cache_key(hist, params)
+
+
+def _render_in_pool(
+    jobs: List[Tuple[pd.DataFrame, str, str]], max_workers: int
+) -> List[Optional[str]]:
+    """렌더링 작업을 프로세스 풀에서 수행 (작업이 하나뿐이면 직접 수행)"""
+    if max_workers == 1 or len(jobs) == 1:
+        return [render_price_chart(*job) for job in jobs]
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(jobs)),
+            initializer=init_render_worker,
+            initargs=logger.worker_initargs(),
+        ) as executor:
+            return list(executor.map(render_price_chart, *zip(*jobs)))
     except Exception as e:
-        print(f"차트 생성 중 오류 발생 ({market_name}): {str(e)}")
+        # 프로세스 풀을 사용할 수 없는 환경에서는 순차 렌더링
+        print(f"병렬 차트 생성 실패, 순차 처리로 전환: {str(e)}")
+        logger.metrics.add("retries")
+        return [render_price_chart(*job) for job in jobs]
+
+
+def _render_jobs(
+    jobs: List[Tuple[pd.DataFrame, str, str]], max_workers: int
+) -> List[Optional[str]]:
+    """
+    차트 렌더링 작업 처리
+
+    입력 데이터와 스타일이 같은 차트가 캐시에 있으면 렌더링하지 않고
+    날짜별 경로에 하드링크합니다. 새로 그린 차트는 캐시에 저장된 뒤 링크됩니다.
+    캐시 링크/복사에 실패한 차트는 날짜별 경로에 직접 다시 그립니다.
+
+    Returns:
+        List[Optional[str]]: 작업 순서대로 저장 경로 (실패 시 None)
+    """
+    if not CHART_CACHE_ENABLED:
+        return _render_in_pool(jobs, max_workers)
+
+    results: List[Optional[str]] = [None] * len(jobs)
+    pending = []
+    failed = []  # 캐시 링크에 실패한 작업
+    for i, (hist, market_name, save_path) in enumerate(jobs):
+        key = _chart_key(hist, market_name)
+        cached_path = get_cached_chart(key, CHART_FORMAT)
+        if cached_path:
+            logger.metrics.add("cache_hits")
+            results[i] = _link_cached_chart(cached_path, save_path)
+            if results[i] is None:
+                failed.append(i)
+        else:
+            cache_path = get_cache_path(key, CHART_FORMAT)
+            pending.append((i, (hist, market_name, cache_path)))
+
+    if pending:
+        rendered = _render_in_pool([job for _, job in pending], max_workers)
+        for (i, _), cached_path in zip(pending, rendered):
+            if cached_path:
+                results[i] = _link_cached_chart(cached_path, jobs[i][2])
+                if results[i] is None:
+                    failed.append(i)
+
+    # 링크하지 못한 차트는 캐시 없이 날짜별 경로에 직접 렌더링
+    if failed:
+        rendered = _render_in_pool([jobs[i] for i in failed], max_workers)
+        for i, save_path in zip(failed, rendered):
+            results[i] = save_path
+
+    return results
+
+
+def _link_cached_chart(cached_path: str, save_path: str) -> Optional[str]:
+    """캐시 차트를 저장 경로에 링크 (실패 시 None)"""
+    try:
+        return link_chart(cached_path, save_path)
+    except OSError as e:
+        print(f"캐시 차트 링크 실패, 다시 렌더링 ({save_path}): {str(e)}")
         return None
 
 
-def generate_all_charts(date: Optional[str] = None) -> bool:
-    """모든 시장 지수의 차트를 생성"""
-    success = True
+def _generate_composite_chart(
+    jobs: List[Tuple[pd.DataFrame, str, str]], date: str
+) -> bool:
+    """조회된 지수 데이터로 통합 차트 생성 (캐시 적용, 일부 지수가 없어도 생성)"""
+    frames = {market_name: hist for hist, market_name, _ in jobs}
+    save_path = get_composite_image_filepath(date)
+
+    if not CHART_CACHE_ENABLED:
+        return render_composite_chart(frames, save_path) is not None
 
-    # 한국 시장 차트 먼저 생성
-    for market_name, ticker in KRX_INDICES.items():
-        if not generate_price_chart(ticker, market_name, date):
-            success = False
+    # 지수별 데이터를 하나로 묶어 캐시 키 생성
+    key = _chart_key(pd.concat(frames, names=["market"]), "composite")
+    cached_path = get_cached_chart(key, CHART_FORMAT)
+    if cached_path:
+        logger.metrics.add("cache_hits")
+    else:
+        cached_path = render_composite_chart(
+            frames, get_cache_path(key, CHART_FORMAT)
+        )
+        if not cached_path:
+            return False
+
+    if _link_cached_chart(cached_path, save_path) is None:
+        return render_composite_chart(frames, save_path) is not None
+    return True
 
-    # 미국 시장 차트 생성
-    for market_name, ticker in US_INDICES.items():
-        if not generate_price_chart(ticker, market_name, date):
-            success = False
 
-    return success
+def generate_all_charts(
+    date: Optional[str] = None,
+    max_workers: Optional[int] = CHART_WORKERS,
+    chart_data: Optional[Dict[str, Tuple[pd.DataFrame, str]]] = None,
+) -> bool:
+    """모든 시장 지수의 차트를 생성
+
+    데이터는 메인 프로세스에서 한 번만 조회하고, CPU 작업인 렌더링은
+    프로세스 풀에 분배합니다. 폰트/스타일 설정은 워커당 1회만 수행되며,
+    입력 데이터가 바뀌지 않은 차트는 캐시에서 재사용합니다.
+    CHART_LAYOUT이 "composite"이면 조회된 지수를 한 장의 이미지로 생성합니다.
+
+    지수별 차트와 통합 차트 모두 리포트가 참조하는 date 디렉토리에 저장합니다.
+
+    Args:
+        date: 리포트 날짜 (None이면 가장 최근 시장 기준 날짜)
+        max_workers: 렌더링 프로세스 수 (기본값: settings.CHART_WORKERS, None이면 CPU 수)
+        chart_data: collect_chart_data()의 반환값 (None이면 직접 조회)
+    """
+    markets = {**KRX_INDICES, **US_INDICES}
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(markets)))
+
+    if chart_data is None:
+        chart_data = collect_chart_data(workers)
+    if not chart_data:
+        return False
+
+    success = all(market_name in chart_data for market_name in markets)
+    date = date or max(chart_date for _, chart_date in chart_data.values())
+    jobs = [
+        (hist, market_name, get_image_filepath(market_name, date))
+        for market_name, (hist, _) in chart_data.items()
+    ]
+
+    if CHART_LAYOUT == "composite":
+        # 일부 지수 조회에 실패해도 조회된 지수만으로 통합 차트 생성
+        generated = _generate_composite_chart(jobs, date)
+    else:
+        generated = all(_render_jobs(jobs, workers))
+
+    if CHART_CACHE_ENABLED:
+        try:
+            prune_cache()
+        except OSError as e:
+            print(f"차트 캐시 정리 실패: {str(e)}")
+    return success and generated
 
 
 if __name__ == "__main__":
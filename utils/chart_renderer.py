@@ -0,0 +1,302 @@
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.ticker import FixedLocator, FuncFormatter
+
+# mplfinance yahoo 스타일과 동일한 색상
+UP_COLOR = "#00b060"
+DOWN_COLOR = "#fe3032"
+WICK_COLOR = "#606060"
+VOLUME_UP_COLOR = "#4dc790"
+VOLUME_DOWN_COLOR = "#fd6b6c"
+FACE_COLOR = "#fafafa"
+GRID_COLOR = "#d0d0d0"
+ALPHA = 0.9
+
+BODY_WIDTH = 0.6
+MAX_XTICKS = 8
+
+# 프로세스별 레이아웃 템플릿 캐시
+_templates: Dict[Tuple, object] = {}
+
+
+class CandlePanel:
+    """가격/거래량 축 한 쌍과 데이터 교체용 아티스트"""
+
+    def __init__(
+        self,
+        ax_price,
+        ax_volume,
+        ylabel: str = "가격",
+        ylabel_lower: str = "거래량",
+        font_name: Optional[str] = None,
+    ):
+        self.ax_price = ax_price
+        self.ax_volume = ax_volume
+
+        text_kwargs = {"family": font_name} if font_name else {}
+        for ax, label in ((ax_price, ylabel), (ax_volume, ylabel_lower)):
+            ax.set_facecolor(FACE_COLOR)
+            ax.grid(axis="y", color=GRID_COLOR, linestyle="-")
+            ax.set_axisbelow(True)
+            ax.yaxis.tick_right()
+            ax.yaxis.set_label_position("right")
+            if label:
+                ax.set_ylabel(label, **text_kwargs)
+            for spine in ax.spines.values():
+                spine.set_edgecolor("#f0f0f0")
+        ax_price.tick_params(labelbottom=False)
+
+        # 데이터만 교체할 아티스트
+        self.wicks = LineCollection([], colors=WICK_COLOR, linewidths=0.8)
+        self.bodies = PolyCollection([], alpha=ALPHA, linewidths=0.8)
+        self.volumes = PolyCollection([], alpha=ALPHA, linewidths=0)
+        ax_price.add_collection(self.wicks)
+        ax_price.add_collection(self.bodies)
+        ax_volume.add_collection(self.volumes)
+
+    def update(self, hist: pd.DataFrame, max_xticks: int = MAX_XTICKS):
+        """OHLCV 데이터로 캔들/거래량 아티스트와 축 범위 갱신"""
+        opens = hist["Open"].to_numpy(dtype=float)
+        highs = hist["High"].to_numpy(dtype=float)
+        lows = hist["Low"].to_numpy(dtype=float)
+        closes = hist["Close"].to_numpy(dtype=float)
+        volumes = hist["Volume"].to_numpy(dtype=float)
+
+        count = len(hist)
+        x = np.arange(count, dtype=float)
+        left = x - BODY_WIDTH / 2
+        right = x + BODY_WIDTH / 2
+
+        # 캔들 몸통/꼬리
+        up = closes >= opens
+        colors = np.where(up, UP_COLOR, DOWN_COLOR)
+        body_low = np.minimum(opens, closes)
+        body_high = np.maximum(opens, closes)
+        self.bodies.set_verts(_rectangles(left, right, body_low, body_high))
+        self.bodies.set_facecolor(colors)
+        self.bodies.set_edgecolor(colors)
+        self.wicks.set_segments(
+            np.stack([np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1)
+        )
+
+        # 거래량 (전일 종가 대비 상승/하락으로 색상 결정)
+        prev_closes = np.concatenate([[opens[0]], closes[:-1]]) if count else closes
+        volume_colors = np.where(
+            closes >= prev_closes, VOLUME_UP_COLOR, VOLUME_DOWN_COLOR
+        )
+        self.volumes.set_verts(_rectangles(left, right, np.zeros(count), volumes))
+        self.volumes.set_facecolor(volume_colors)
+
+        # 축 범위
+        if count:
+            price_pad = (highs.max() - lows.min()) * 0.05 or 1.0
+            self.ax_price.set_xlim(-1, count)
+            self.ax_price.set_ylim(lows.min() - price_pad, highs.max() + price_pad)
+            self.ax_volume.set_ylim(0, (volumes.max() or 1.0) * 1.1)
+
+        # 날짜 눈금
+        dates = pd.DatetimeIndex(hist.index)
+        step = max(1, int(np.ceil(count / max_xticks)))
+        ticks = list(range(0, count, step))
+        self.ax_volume.xaxis.set_major_locator(FixedLocator(ticks))
+        self.ax_volume.xaxis.set_major_formatter(
+            FuncFormatter(
+                lambda value, _: (
+                    dates[int(value)].strftime("%b %d")
+                    if 0 <= int(value) < count
+                    else ""
+                )
+            )
+        )
+
+
+class ChartTemplate:
+    """가격/거래량 패널로 구성된 재사용 가능한 차트 템플릿
+
+    Figure, 축, 스타일은 한 번만 생성하고, 차트마다 캔들/거래량 아티스트의
+    데이터만 교체한 뒤 Agg 캔버스로 직접 저장합니다.
+    """
+
+    def __init__(
+        self,
+        figsize: Tuple[float, float] = (10, 6),
+        panel_ratios: Tuple[int, int] = (5, 1),
+        dpi: int = 100,
+        ylabel: str = "가격",
+        ylabel_lower: str = "거래량",
+        font_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            figsize: Figure 크기 (인치)
+            panel_ratios: 가격:거래량 패널 높이 비율
+            dpi: 저장 해상도
+            ylabel: 가격 패널 라벨
+            ylabel_lower: 거래량 패널 라벨
+            font_name: 한글 폰트 이름
+        """
+        self.dpi = dpi
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor="white")
+        self.canvas = FigureCanvasAgg(self.figure)
+
+        grid = self.figure.add_gridspec(
+            2, 1, height_ratios=panel_ratios, hspace=0.08, left=0.06, right=0.92
+        )
+        ax_price = self.figure.add_subplot(grid[0])
+        ax_volume = self.figure.add_subplot(grid[1], sharex=ax_price)
+        self.panel = CandlePanel(ax_price, ax_volume, ylabel, ylabel_lower, font_name)
+
+        text_kwargs = {"family": font_name} if font_name else {}
+        self.title = self.figure.suptitle(
+            "", fontsize="x-large", fontweight="semibold", **text_kwargs
+        )
+
+    def render(self, hist: pd.DataFrame, title: str, save_path: str) -> str:
+        """OHLCV 데이터로 아티스트를 갱신하고 이미지 저장
+
+        Args:
+            hist: Open/High/Low/Close/Volume 컬럼을 가진 데이터
+            title: 차트 제목
+            save_path: 저장 경로
+
+        Returns:
+            str: 저장 경로
+        """
+        self.panel.update(hist)
+        self.title.set_text(title)
+        _print_figure(self.canvas, save_path, self.dpi)
+        return save_path
+
+
+class CompositeTemplate:
+    """여러 지수를 한 이미지에 배치하는 다중 패널 차트 템플릿"""
+
+    def __init__(
+        self,
+        count: int,
+        columns: int = 2,
+        panel_size: Tuple[float, float] = (6, 3.2),
+        panel_ratios: Tuple[int, int] = (4, 1),
+        dpi: int = 100,
+        font_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            count: 지수(패널) 수
+            columns: 열 수
+            panel_size: 패널 하나의 크기 (인치)
+            panel_ratios: 가격:거래량 높이 비율
+            dpi: 저장 해상도
+            font_name: 한글 폰트 이름
+        """
+        self.dpi = dpi
+        columns = max(1, min(columns, count))
+        rows = int(np.ceil(count / columns))
+        self.figure = Figure(
+            figsize=(panel_size[0] * columns, panel_size[1] * rows),
+            dpi=dpi,
+            facecolor="white",
+        )
+        self.canvas = FigureCanvasAgg(self.figure)
+
+        outer = self.figure.add_gridspec(
+            rows,
+            columns,
+            hspace=0.35,
+            wspace=0.15,
+            left=0.03,
+            right=0.95,
+            top=0.95,
+            bottom=0.05,
+        )
+        text_kwargs = {"family": font_name} if font_name else {}
+        self.panels = []
+        self.titles = []
+        for i in range(count):
+            inner = outer[i // columns, i % columns].subgridspec(
+                2, 1, height_ratios=panel_ratios, hspace=0.05
+            )
+            ax_price = self.figure.add_subplot(inner[0])
+            ax_volume = self.figure.add_subplot(inner[1], sharex=ax_price)
+            ax_volume.tick_params(labelsize="small")
+            self.panels.append(CandlePanel(ax_price, ax_volume, "", "", font_name))
+            self.titles.append(
+                ax_price.set_title("", fontweight="semibold", **text_kwargs)
+            )
+
+        # 남는 칸은 비워 둠
+        for i in range(count, rows * columns):
+            empty = self.figure.add_subplot(outer[i // columns, i % columns])
+            empty.set_axis_off()
+
+    def render(self, frames: Dict[str, pd.DataFrame], save_path: str) -> str:
+        """지수별 데이터로 각 패널을 갱신하고 이미지 저장
+
+        Args:
+            frames: {패널 제목: OHLCV 데이터}
+            save_path: 저장 경로
+
+        Returns:
+            str: 저장 경로
+        """
+        for (title, hist), panel, title_text in zip(
+            frames.items(), self.panels, self.titles
+        ):
+            panel.update(hist, max_xticks=5)
+            title_text.set_text(title)
+        _print_figure(self.canvas, save_path, self.dpi)
+        return save_path
+
+
+def _print_figure(canvas: FigureCanvasAgg, save_path: str, dpi: int):
+    """Agg 캔버스로 직접 저장"""
+    if save_path.lower().endswith(".png"):
+        canvas.print_png(save_path)
+    else:
+        canvas.print_figure(save_path, dpi=dpi)
+
+
+def _rectangles(
+    left: np.ndarray, right: np.ndarray, bottom: np.ndarray, top: np.ndarray
+) -> np.ndarray:
+    """사각형 꼭짓점 배열 생성 (N x 4 x 2)"""
+    return np.stack(
+        [
+            np.column_stack([left, bottom]),
+            np.column_stack([left, top]),
+            np.column_stack([right, top]),
+            np.column_stack([right, bottom]),
+        ],
+        axis=1,
+    )
+
+
+def get_chart_template(
+    figsize: Tuple[float, float] = (10, 6),
+    panel_ratios: Tuple[int, int] = (5, 1),
+    dpi: int = 100,
+    ylabel: str = "가격",
+    ylabel_lower: str = "거래량",
+    font_name: Optional[str] = None,
+) -> ChartTemplate:
+    """레이아웃별 템플릿을 프로세스당 한 번만 생성하여 반환"""
+    key = (tuple(figsize), tuple(panel_ratios), dpi, ylabel, ylabel_lower, font_name)
+    if key not in _templates:
+        _templates[key] = ChartTemplate(
+            figsize, panel_ratios, dpi, ylabel, ylabel_lower, font_name
+        )
+    return _templates[key]
+
+
+def get_composite_template(
+    count: int, dpi: int = 100, font_name: Optional[str] = None
+) -> CompositeTemplate:
+    """패널 수별 다중 패널 템플릿을 프로세스당 한 번만 생성하여 반환"""
+    key = ("composite", count, dpi, font_name)
+    if key not in _templates:
+        _templates[key] = CompositeTemplate(count, dpi=dpi, font_name=font_name)
+    return _templates[key]
@@ -2,28 +2,32 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-import sys
-import os
-
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
 
 from config.settings import CURRENCIES, LOOKBACK_DAYS
-
-
-def get_forex_data(
+from src.history_db import series_buffer
+from utils.rate_limiter import yahoo_call
+from utils.http_session import get_session
+from utils.market_metrics import (
+    build_panel,
+    compute_metrics,
+    daily_metrics,
+    normalize_ohlcv,
+    to_records,
+)
+
+
+def get_forex_history(
     currency_pair: str, lookback_days: int = LOOKBACK_DAYS
-) -> Optional[Dict[str, Any]]:
+) -> Optional[pd.DataFrame]:
     """
-    지정된 통화쌍의 환율 데이터를 수집합니다.
+    지정된 통화쌍의 환율 OHLCV를 조회합니다.
 
     Args:
         currency_pair (str): 통화쌍 (예: "USD/KRW")
         lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
 
     Returns:
-        Dict[str, Any]: 환율 데이터 딕셔너리 또는 에러 시 None
+        pd.DataFrame: 날짜 인덱스 OHLCV 또는 에러 시 None
     """
     try:
         # 통화쌍을 yfinance 형식으로 변환 (예: USD/KRW -> USDKRW=X)
@@ -31,40 +35,44 @@ def get_forex_data(
         ticker = f"{base_currency}{quote_currency}=X"
 
         # yfinance 티커 객체 생성
-        yf_ticker = yf.Ticker(ticker)
+        yf_ticker = yf.Ticker(ticker, session=get_session())
 
         # 시작일과 종료일 설정
         end_date = datetime.now()
         start_date = end_date - timedelta(days=lookback_days)
 
         # 과거 데이터 조회
-        hist = yf_ticker.history(start=start_date, end=end_date)
+        hist = yahoo_call(yf_ticker.history, start=start_date, end=end_date)
 
         if hist.empty:
             print(f"Warning: No data found for currency pair {currency_pair}")
             return None
 
-        # 최신 데이터와 전일 데이터
-        latest = hist.iloc[-1]
-        prev = hist.iloc[-2] if len(hist) > 1 else latest
+        return hist
 
-        # 52주 최고가, 최저가 계산
-        year_high = hist["High"].max()
-        year_low = hist["Low"].min()
+    except Exception as e:
+        print(f"Error fetching data for currency pair {currency_pair}: {str(e)}")
+        return None
 
-        # 전일 대비 변화율 계산
-        daily_change = ((latest["Close"] - prev["Close"]) / prev["Close"]) * 100
 
-        return {
-            "rate": latest["Close"],
-            "change": daily_change,
-            "year_high": year_high,
-            "year_low": year_low,
-        }
+def get_forex_data(
+    currency_pair: str, lookback_days: int = LOOKBACK_DAYS
+) -> Optional[Dict[str, Any]]:
+    """
+    지정된 통화쌍의 환율 데이터를 수집합니다.
+
+    Args:
+        currency_pair (str): 통화쌍 (예: "USD/KRW")
+        lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
 
-    except Exception as e:
-        print(f"Error fetching data for currency pair {currency_pair}: {str(e)}")
+    Returns:
+        Dict[str, Any]: 환율 데이터 딕셔너리 또는 에러 시 None
+    """
+    hist = get_forex_history(currency_pair, lookback_days)
+    if hist is None:
         return None
+    panel = build_panel({currency_pair: hist})
+    return to_records(compute_metrics(panel), "forex").get(currency_pair)
 
 
 def get_all_forex_data() -> Dict[str, Dict[str, Any]]:
@@ -74,16 +82,24 @@ def get_all_forex_data() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict[str, Dict[str, Any]]: 통화쌍을 키로 하고 데이터를 값으로 하는 딕셔너리
     """
-    forex_data = {}
+    histories = {}
 
     for currency_pair in CURRENCIES:
-        data = get_forex_data(currency_pair)
-        if data:
-            forex_data[currency_pair] = data
+        hist = get_forex_history(currency_pair)
+        if hist is not None:
+            histories[currency_pair] = hist
+            # 조회 기간 전체의 거래일별 환율/등락을 히스토리 DB 시계열로 기록
+            series_buffer.add(
+                currency_pair, daily_metrics(normalize_ohlcv(hist), "forex")
+            )
         else:
             print(f"Failed to fetch data for {currency_pair}")
 
-    return forex_data
+    if not histories:
+        return {}
+
+    # 전 통화쌍을 하나의 패널로 묶어 전일 대비, 52주 최고/최저를 한 번에 계산
+    return to_records(compute_metrics(build_panel(histories)), "forex")
 
 
 def format_forex_data(currency_pair: str, data: Dict[str, Any]) -> str:
@@ -0,0 +1,87 @@
+import threading
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+import requests
+from fredapi import Fred
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    FEDAPI_KEY,
+    REQUEST_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_RETRIES,
+    HTTP_BACKOFF,
+)
+from src.logger import logger
+
+_session: Optional[requests.Session] = None
+_fred: Optional[Fred] = None
+_lock = threading.Lock()
+
+
+def count_response_bytes(response: requests.Response, *args, **kwargs):
+    """응답 크기를 현재 단계의 bytes 지표에 기록 (requests 응답 훅)"""
+    logger.metrics.add("bytes", len(response.content))
+
+
+def create_session() -> requests.Session:
+    """연결 재사용(keep-alive), 제한된 연결 풀, 재시도 어댑터가 설정된 세션 생성
+
+    429 응답은 utils.rate_limiter가 처리하므로 재시도 대상에서 제외합니다.
+    """
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(count_response_bytes)
+    return session
+
+
+def get_session() -> requests.Session:
+    """모든 yfinance/FRED 호출이 공유하는 HTTP 세션 (첫 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+class SessionFred(Fred):
+    """공용 세션으로 요청하는 FRED 클라이언트
+
+    fredapi는 요청마다 urlopen으로 새 연결을 맺으므로, 내부 요청 함수를
+    공용 세션을 사용하도록 재정의합니다.
+    """
+
+    def _Fred__fetch_data(self, url: str) -> ET.Element:
+        url += "&api_key=" + self.api_key
+        response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+        root = ET.fromstring(response.content)
+        if response.status_code >= 400:
+            raise ValueError(root.get("message"))
+        return root
+
+
+def get_fred() -> Fred:
+    """공용 FRED 클라이언트 반환 (첫 호출 시 생성)"""
+    global _fred
+    if _fred is None:
+        with _lock:
+            if _fred is None:
+                _fred = SessionFred(api_key=FEDAPI_KEY)
+    return _fred
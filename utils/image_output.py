@@ -0,0 +1,67 @@
+import os
+from typing import Optional
+from PIL import Image
+
+from config.settings import CHART_QUANTIZE_COLORS, CHART_WEBP_QUALITY
+
+
+def save_compact_image(
+    src_path: str,
+    dst_path: str,
+    quantize_colors: Optional[int] = CHART_QUANTIZE_COLORS,
+    webp_quality: int = CHART_WEBP_QUALITY,
+) -> str:
+    """
+    렌더링된 PNG를 용량이 작은 형식으로 변환하여 저장합니다.
+
+    저장 형식은 dst_path의 확장자로 결정됩니다.
+      - .webp: 손실 WebP (quality 지정)
+      - .png: 팔레트 양자화(quantize_colors 지정 시) + optimize 압축
+
+    Args:
+        src_path (str): 원본 PNG 경로
+        dst_path (str): 저장 경로
+        quantize_colors (Optional[int]): PNG 팔레트 색상 수 (None이면 양자화하지 않음)
+        webp_quality (int): WebP 품질 (0~100)
+
+    Returns:
+        str: 저장 경로
+    """
+    extension = os.path.splitext(dst_path)[1].lower()
+
+    with Image.open(src_path) as image:
+        image = image.convert("RGB")
+
+        if extension == ".webp":
+            image.save(dst_path, format="WEBP", quality=webp_quality, method=6)
+        else:
+            if quantize_colors:
+                image = image.quantize(colors=quantize_colors)
+            image.save(dst_path, format="PNG", optimize=True)
+
+    return dst_path
+
+
+def finalize_image(tmp_png_path: str, save_path: str) -> str:
+    """
+    임시 PNG를 설정된 출력 형식으로 변환해 save_path로 원자적으로 이동합니다.
+
+    원본 PNG를 그대로 쓰는 경우(png, 양자화 없음)에는 파일 이동만 수행합니다.
+    """
+    extension = os.path.splitext(save_path)[1].lower()
+
+    if extension == ".png" and not CHART_QUANTIZE_COLORS:
+        os.replace(tmp_png_path, save_path)
+        return save_path
+
+    root, _ = os.path.splitext(tmp_png_path)
+    converted_path = f"{root}.out{extension}"
+    try:
+        save_compact_image(tmp_png_path, converted_path)
+        os.replace(converted_path, save_path)
+    finally:
+        for path in (tmp_png_path, converted_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    return save_path
@@ -0,0 +1,294 @@
+import contextvars
+import json
+import math
+import os
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import (
+    REQUEST_TIMEOUT,
+    HEDGE_QUANTILE,
+    HEDGE_DEFAULT_BUDGET,
+    HEDGE_MIN_BUDGET,
+    HEDGE_MIN_SAMPLES,
+    LATENCY_DECAY,
+    get_latency_history_filepath,
+)
+from src.isolation import check_cancelled
+from src.logger import logger
+
+# 지연 시간 히스토그램 구간 경계 (초): 10ms부터 1.25배씩 증가하여 약 2분까지
+BUCKET_BOUNDS = [round(0.01 * 1.25**i, 4) for i in range(43)]
+
+
+class LatencyHistogram:
+    """소스별 응답 시간 히스토그램 (로그 간격 구간)"""
+
+    def __init__(self, counts: Optional[List[float]] = None):
+        self.counts = list(counts or [0.0] * (len(BUCKET_BOUNDS) + 1))
+
+    @property
+    def total(self) -> float:
+        return sum(self.counts)
+
+    def add(self, seconds: float):
+        """응답 시간 기록"""
+        index = next(
+            (i for i, bound in enumerate(BUCKET_BOUNDS) if seconds <= bound),
+            len(BUCKET_BOUNDS),
+        )
+        self.counts[index] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 (해당 구간의 상한, 기록이 없으면 None)"""
+        total = self.total
+        if total <= 0:
+            return None
+
+        target = total * q
+        cumulative = 0.0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else math.inf
+        return math.inf
+
+    def decay(self, factor: float):
+        """이전 실행 기록의 가중치 감소 (최근 응답 시간에 맞춰 예산이 조정되도록)"""
+        self.counts = [count * factor for count in self.counts]
+
+
+class LatencyTracker:
+    """소스별 지연 시간 예산과 헤지(hedged) 요청
+
+    각 외부 호출에 소스 이름을 붙여 응답 시간을 히스토그램으로 기록합니다.
+    호출이 해당 소스의 p90 응답 시간(예산)을 넘기면 같은 요청을 한 번 더 보내고
+    먼저 성공한 응답을 사용합니다. 히스토그램은 실행이 끝날 때 저장되어 다음
+    실행의 예산으로 쓰이므로 소스별 예산이 기록에 따라 자동으로 조정됩니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 히스토그램 저장 경로 (기본값: settings.get_latency_history_filepath())
+        """
+        self.path = path
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def get_path(self) -> str:
+        return self.path or get_latency_history_filepath()
+
+    def load(self):
+        """저장된 히스토그램 로드 (이전 기록은 LATENCY_DECAY만큼 가중치 감소)"""
+        self._loaded = True
+        path = self.get_path()
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("bounds") != BUCKET_BOUNDS:
+                return
+            with self._lock:
+                for source, counts in saved["sources"].items():
+                    histogram = LatencyHistogram(counts)
+                    histogram.decay(LATENCY_DECAY)
+                    self.histograms.setdefault(source, histogram)
+        except Exception as e:
+            logger.warning(f"지연 시간 기록 로드 실패: {str(e)}")
+
+    def save(self) -> Optional[str]:
+        """히스토그램 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.histograms:
+            return None
+
+        path = self.get_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self._lock:
+                payload = {
+                    "bounds": BUCKET_BOUNDS,
+                    "sources": {
+                        source: [round(count, 3) for count in histogram.counts]
+                        for source, histogram in self.histograms.items()
+                    },
+                }
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            logger.warning(f"지연 시간 기록 저장 실패: {str(e)}")
+            return None
+
+    def _histogram(self, source: str) -> LatencyHistogram:
+        if not self._loaded:
+            self.load()
+        with self._lock:
+            return self.histograms.setdefault(source, LatencyHistogram())
+
+    def record(self, source: str, seconds: float):
+        """성공한 호출의 응답 시간 기록"""
+        histogram = self._histogram(source)
+        with self._lock:
+            histogram.add(seconds)
+
+    def budget(self, source: str) -> float:
+        """소스의 지연 시간 예산 (기록이 부족하면 기본값)"""
+        histogram = self._histogram(source)
+        if histogram.total < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_BUDGET
+        value = histogram.quantile(HEDGE_QUANTILE)
+        return min(max(value, HEDGE_MIN_BUDGET), REQUEST_TIMEOUT)
+
+    def _count(self, source: str, key: str):
+        with self._lock:
+            stats = self.stats.setdefault(
+                source,
+                {
+                    "calls": 0,
+                    "hedged": 0,
+                    "hedge_wins": 0,
+                    "hedge_skipped": 0,
+                    "timeouts": 0,
+                },
+            )
+            stats[key] += 1
+
+    def call(
+        self,
+        source: str,
+        func: Callable[..., Any],
+        *args,
+        hedge: bool = True,
+        limiter: Optional[Any] = None,
+        **kwargs,
+    ) -> Any:
+        """지연 시간 예산 안에서 호출 (예산 초과 시 헤지 요청)
+
+        limiter를 지정하면 각 시도가 요청 슬롯(limiter.acquire())을 얻은 뒤부터
+        예산과 제한 시간을 계산하므로 제한기 대기 시간은 응답 시간으로 기록되지
+        않고 헤지도 일으키지 않습니다. 제한기가 헤지를 허용하지 않는 동안
+        (limiter.can_hedge()가 False, 예: 429 대기 중이거나 동시성 한도 축소)에는
+        예산을 넘겨도 헤지 요청을 보내지 않습니다.
+
+        Args:
+            source: 소스 이름 (예: "yahoo.history", "fred.get_series")
+            func: 호출할 함수 (같은 인자로 두 번 호출해도 안전한 조회 함수)
+            hedge: 헤지 요청 허용 여부 (스레드 안전하지 않은 함수는 False)
+            limiter: 요청 제한기 (acquire/run/can_hedge 제공, 예: yahoo_limiter)
+
+        Raises:
+            TimeoutError: 요청 슬롯을 얻은 뒤 REQUEST_TIMEOUT 안에 응답이 없는 경우
+            CollectCancelledError: 수집기의 제한 시간이 지나 취소된 경우 (새 요청을 보내지 않음)
+            Exception: 모든 시도가 실패한 경우 마지막 예외
+        """
+        check_cancelled()
+        self._count(source, "calls")
+        budget = self.budget(source)
+        results = queue.Queue()
+
+        def attempt(hedged: bool):
+            slot = limiter.acquire() if limiter is not None else nullcontext()
+            try:
+                with slot:
+                    check_cancelled()  # 슬롯을 기다리는 동안 취소된 수집기는 요청하지 않음
+                    results.put(("start", None, hedged))
+                    started = time.perf_counter()
+                    if limiter is not None:
+                        value = limiter.run(func, *args, **kwargs)
+                    else:
+                        value = func(*args, **kwargs)
+            except Exception as e:
+                results.put(("error", e, hedged))
+                return
+            self.record(source, time.perf_counter() - started)
+            results.put(("ok", value, hedged))
+
+        def launch(hedged: bool):
+            # 수집기의 취소 신호(src.isolation)가 요청 스레드에도 전달되도록 컨텍스트 복사
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run,
+                args=(attempt, hedged),
+                name=f"request-{source}",
+                daemon=True,
+            ).start()
+
+        launch(False)
+        pending, hedged = 1, False
+        deadline = hedge_at = None  # 첫 시도가 요청 슬롯을 얻으면 설정
+
+        while True:
+            now = time.monotonic()
+            if deadline is None:
+                wait = None
+            elif hedged or not hedge:
+                wait = max(deadline - now, 0)
+            else:
+                wait = max(min(hedge_at, deadline) - now, 0)
+            try:
+                kind, value, from_hedge = results.get(timeout=wait)
+            except queue.Empty:
+                if hedge and not hedged and time.monotonic() < deadline:
+                    hedged = True
+                    if limiter is not None and not limiter.can_hedge():
+                        # 요청 제한 중: 헤지하면 제한이 풀리는 즉시 요청이 두 배가 됨
+                        self._count(source, "hedge_skipped")
+                        continue
+                    # 예산 초과: 같은 요청을 한 번 더 보내고 먼저 도착한 응답 사용
+                    pending += 1
+                    self._count(source, "hedged")
+                    logger.metrics.add("hedges")
+                    launch(True)
+                    continue
+                self._count(source, "timeouts")
+                raise TimeoutError(f"{source} 응답 시간 초과 ({REQUEST_TIMEOUT}초)")
+
+            if kind == "start":
+                if not from_hedge:
+                    started = time.monotonic()
+                    deadline = started + REQUEST_TIMEOUT
+                    hedge_at = started + budget
+                continue
+
+            pending -= 1
+            if kind == "ok":
+                if from_hedge:
+                    self._count(source, "hedge_wins")
+                return value
+            if pending == 0:
+                raise value
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """실행 요약용 소스별 호출 통계와 p50/p90 (초)"""
+        result = {}
+        for source, stats in sorted(self.stats.items()):
+            histogram = self.histograms.get(source)
+            result[source] = {
+                **stats,
+                "p50": histogram.quantile(0.5) if histogram else None,
+                "p90": histogram.quantile(HEDGE_QUANTILE) if histogram else None,
+            }
+        return result
+
+
+# 모든 외부 호출이 공유하는 프로세스 전역 지연 시간 기록
+latency_tracker = LatencyTracker()
+
+
+def timed_call(source: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """소스별 지연 시간 예산과 헤지 요청을 적용하여 호출
+
+    예:
+        gdp = timed_call("fred.get_series", fred.get_series, "GDP")
+    """
+    return latency_tracker.call(source, func, *args, **kwargs)
@@ -0,0 +1,266 @@
+"""
+종목 패널 지표 커널
+
+미국/한국 지수, 국채, 환율 수집기가 공통으로 쓰는 지표(종가, 전일 대비, 52주
+최고가/최저가, 거래량 비율, 이동평균, 변동성)를 한 곳에서 계산합니다.
+
+- normalize_ohlcv: 소스별 OHLCV 컬럼(yfinance 영문, pykrx 한글)을 수집 시점에 통일
+- compute_metrics: 여러 종목의 OHLCV 패널에서 모든 종목의 기본 지표를 배열 연산으로 계산
+  (윈도우 정의는 증분 엔진과 같은 rolling_stats.WINDOWS 사용)
+- derive_metrics: 기본 지표에서 등락률, 거래량 비율 등 파생 지표 계산
+  (패널 커널과 증분 엔진(InstrumentStats.metrics) 결과 모두에 적용)
+- to_records: 지표 표를 수집기별 반환 형식으로 변환
+- daily_metrics: 봉별 종가/등락 지표 (히스토리 DB의 거래일별 시계열)
+
+예:
+    panel = build_panel({"USD/KRW": usd_hist, "EUR/KRW": eur_hist})
+    records = to_records(compute_metrics(panel), "forex")
+"""
+
+import warnings
+from typing import Any, Dict, Iterator, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config.settings import DATE_FORMAT
+from src.history_db import DATE_KEY
+from utils.rolling_stats import BAR_COLUMNS, WINDOWS
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# pykrx 지수 OHLCV 컬럼 → 표준 컬럼
+KRX_OHLCV_COLUMNS = {
+    "시가": "Open",
+    "고가": "High",
+    "저가": "Low",
+    "종가": "Close",
+    "거래량": "Volume",
+}
+
+# 수집기별 반환 형식: {반환 키: 지표 표 컬럼}
+RECORD_COLUMNS = {
+    "market": {
+        "close": "close",
+        "volume": "volume",
+        "change": "change",
+        "volume_ma20": "volume_ma20",
+        "volume_ratio": "volume_ratio",
+        "year_high": "year_high",
+        "year_low": "year_low",
+        "year_high_ratio": "year_high_ratio",
+    },
+    "treasury": {
+        "yield_rate": "close",
+        "change": "change_abs",
+        "year_high": "year_high",
+        "year_low": "year_low",
+        "ma_90": "ma_90",
+        "ma_180": "ma_180",
+        "monthly_volatility": "std_20",
+        "long_term_volatility": "std_year",
+        "volatility_ratio": "volatility_ratio",
+        "fed_spread": "fed_spread",
+    },
+    "forex": {
+        "rate": "close",
+        "change": "change",
+        "year_high": "year_high",
+        "year_low": "year_low",
+    },
+}
+
+# 정수로 반환하는 지표 (거래량)
+INTEGER_RECORD_KEYS = ("volume",)
+
+# 봉별로 계산할 수 있는 지표 (daily_metrics, 반환 키는 RECORD_COLUMNS 기준)
+DAILY_COLUMNS = ("close", "change", "change_abs")
+
+
+def normalize_ohlcv(frame: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV 컬럼과 날짜 인덱스를 표준 형식으로 변환
+
+    pykrx의 한글 컬럼(시가/고가/저가/종가/거래량)은 영문 컬럼으로 바꾸고,
+    시간대가 있는 yfinance 인덱스는 거래소 현지 날짜로 맞춥니다.
+    """
+    frame = frame.rename(columns=KRX_OHLCV_COLUMNS)
+    frame = frame[[column for column in OHLCV_COLUMNS if column in frame.columns]]
+
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    frame = frame.set_axis(index.normalize(), axis=0)
+    return frame.astype("float64")
+
+
+def build_panel(frames: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """종목별 OHLCV를 하나의 패널로 결합
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스(전 종목 합집합), (필드, 종목) 2단 컬럼.
+            거래일이 다른 종목(예: 미국/한국)의 빈 날짜는 NaN
+    """
+    panel = pd.concat(
+        {name: normalize_ohlcv(frame) for name, frame in frames.items()}, axis=1
+    )
+    return panel.swaplevel(axis=1).sort_index()
+
+
+def compute_metrics(panel: pd.DataFrame) -> pd.DataFrame:
+    """패널의 모든 종목에 대한 기본/파생 지표 계산
+
+    종목별 반복 없이 (날짜 x 종목) 배열에 윈도우 마스크를 씌워 한 번에 계산합니다.
+    종가가 있는 날짜만 해당 종목의 봉으로 보므로 거래일이 다른 종목을 함께 넣어도
+    종목별로 계산한 결과와 같습니다.
+
+    Args:
+        panel: build_panel 형식의 패널
+
+    Returns:
+        pd.DataFrame: 종목 인덱스, 지표 컬럼 (종가가 하나도 없는 종목은 제외)
+    """
+    closes = panel["Close"]
+    names = closes.columns[closes.notna().any().to_numpy()]
+    values = {
+        field: (
+            panel[column].reindex(columns=names).to_numpy(dtype="float64")
+            if column in panel.columns.get_level_values(0)
+            else np.full((len(panel), len(names)), np.nan)
+        )
+        for field, column in BAR_COLUMNS.items()
+    }
+
+    close = values["close"]
+    valid = ~np.isnan(close)
+    rank = valid.cumsum(axis=0)  # 종목별 봉 순번 (1부터)
+    total = rank[-1]
+    columns = np.arange(len(names))
+    latest = len(close) - 1 - np.argmax(valid[::-1], axis=0)
+    previous = np.where(
+        total > 1, np.argmax(valid & (rank == total - 1), axis=0), latest
+    )
+    days = panel.index.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    metrics = {
+        DATE_KEY: panel.index[latest].strftime(DATE_FORMAT),
+        "close": close[latest, columns],
+        "prev_close": close[previous, columns],
+        "high": values["high"][latest, columns],
+        "low": values["low"][latest, columns],
+        "volume": values["volume"][latest, columns],
+    }
+
+    with warnings.catch_warnings():
+        # 윈도우가 모두 NaN인 종목의 경고 (결과는 아래에서 NaN 처리)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for name, (field, kind, size, unit, min_periods) in WINDOWS.items():
+            if unit == "bars":
+                mask = valid & (rank > total - size)
+            else:
+                # N일 전 당일 봉 포함 (InstrumentStats와 같은 윈도우)
+                mask = valid & (days[:, None] >= days[latest][None, :] - size)
+            window = np.where(mask, values[field], np.nan)
+            count = np.count_nonzero(~np.isnan(window), axis=0)
+
+            if kind == "max":
+                result = np.nanmax(window, axis=0)
+            elif kind == "min":
+                result = np.nanmin(window, axis=0)
+            elif kind == "mean":
+                result = np.nanmean(window, axis=0)
+            else:
+                result = np.nanstd(window, axis=0, ddof=1)
+            metrics[name] = np.where(count >= min_periods, result, np.nan)
+
+    return derive_metrics(pd.DataFrame(metrics, index=names))
+
+
+def derive_metrics(
+    table: Union[pd.DataFrame, Mapping[str, Dict[str, float]]]
+) -> pd.DataFrame:
+    """기본 지표에서 파생 지표 계산
+
+    Args:
+        table: 종목 인덱스 지표 표, 또는 {종목: InstrumentStats.metrics()} 딕셔너리
+
+    Returns:
+        pd.DataFrame: 파생 지표 컬럼이 추가된 표
+            (change: 등락률(%), change_abs: 등락폭, volume_ratio: 20일 평균 대비 거래량,
+            year_high_ratio: 52주 최고가 대비(%), volatility_ratio: 최근 1개월/전체 변동성)
+    """
+    if not isinstance(table, pd.DataFrame):
+        table = pd.DataFrame.from_dict(dict(table), orient="index")
+    dates = table.pop(DATE_KEY) if DATE_KEY in table.columns else None
+    table = table.astype("float64")
+
+    close, prev_close = table["close"], table["prev_close"]
+    volume_ma20, std_year = table["volume_ma20"], table["std_year"]
+
+    table["change"] = (close - prev_close) / prev_close * 100
+    table["change_abs"] = close - prev_close
+    table["volume_ratio"] = (table["volume"] / volume_ma20).where(volume_ma20 > 0, 0.0)
+    table["year_high_ratio"] = (close - table["year_high"]) / table["year_high"] * 100
+    table["volatility_ratio"] = (table["std_20"] / std_year).where(std_year > 0, 0.0)
+    if dates is not None:
+        table[DATE_KEY] = dates
+    return table
+
+
+def to_records(table: pd.DataFrame, kind: str) -> Dict[str, Dict[str, Any]]:
+    """지표 표를 수집기 반환 형식으로 변환
+
+    Args:
+        table: compute_metrics/derive_metrics 결과
+        kind: RECORD_COLUMNS 키 ("market", "treasury", "forex")
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 종목 이름을 키로 하는 딕셔너리 (표의 순서 유지,
+            표에 봉 날짜가 있으면 "trade_date" 포함)
+    """
+    columns = dict(RECORD_COLUMNS[kind])
+    if DATE_KEY in table.columns:
+        columns[DATE_KEY] = DATE_KEY
+    selected = table[list(columns.values())]
+
+    records = {}
+    for name, row in zip(selected.index, selected.itertuples(index=False, name=None)):
+        record = dict(zip(columns, row))
+        for key in INTEGER_RECORD_KEYS:
+            if key in record and record[key] == record[key]:
+                record[key] = int(record[key])
+        records[name] = record
+    return records
+
+
+def daily_metrics(
+    frame: pd.DataFrame, kind: str, prev_close: float = np.nan
+) -> Iterator[Tuple[str, Dict[str, float]]]:
+    """봉별 종가/등락 지표 (히스토리 DB 시계열, 반환 키는 to_records와 동일)
+
+    Args:
+        frame: normalize_ohlcv로 정규화된 OHLCV
+        kind: RECORD_COLUMNS 키 ("market", "treasury", "forex")
+        prev_close: 첫 봉 이전 종가 (증분 조회에서 첫 봉의 등락 계산, 없으면 NaN)
+
+    Yields:
+        Tuple[str, Dict[str, float]]: (거래일, {반환 키: 값}) (계산할 수 없는 값은 NaN)
+    """
+    close = frame["Close"].astype("float64")
+    previous = close.shift(1)
+    if len(previous):
+        previous.iloc[0] = prev_close
+    table = pd.DataFrame(
+        {
+            "close": close,
+            "change": (close - previous) / previous * 100,
+            "change_abs": close - previous,
+        }
+    )
+    columns = {
+        key: column
+        for key, column in RECORD_COLUMNS[kind].items()
+        if column in DAILY_COLUMNS
+    }
+    selected = table[list(columns.values())]
+    for index, *values in selected.itertuples(name=None):
+        yield index.strftime(DATE_FORMAT), dict(zip(columns, values))
@@ -1,14 +1,10 @@
-import os
-import sys
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
-
-from config.settings import NEWSAPI_KEY, DATE_FORMAT
+from config.settings import NEWSAPI_KEY, DATE_FORMAT, REQUEST_TIMEOUT
+from src.logger import logger
+from utils.latency import timed_call
 
 BASE_URL = "https://api-v2.deepsearch.com/v1"
 
@@ -34,8 +30,15 @@ def fetch_kr_economic_news() -> Optional[List[Dict[str, Any]]]:
             "api_key": NEWSAPI_KEY,
         }
 
-        response = requests.get(url, params=params)
+        response = timed_call(
+            "news.kr_economic",
+            requests.get,
+            url,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
+        logger.metrics.add("bytes", len(response.content))
 
         data = response.json()
         return data.get("data", [])
@@ -64,8 +67,15 @@ def fetch_global_news(section: str) -> Optional[List[Dict[str, Any]]]:
             "api_key": NEWSAPI_KEY,
         }
 
-        response = requests.get(url, params=params)
+        response = timed_call(
+            f"news.global_{section}",
+            requests.get,
+            url,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
+        logger.metrics.add("bytes", len(response.content))
 
         data = response.json()
         return data.get("data", [])
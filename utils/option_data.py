@@ -2,15 +2,11 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
-import sys
-import os
 from dateutil.relativedelta import relativedelta
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
-
 from src.logger import logger
+from utils.rate_limiter import yahoo_call
+from utils.http_session import get_session
 
 
 class OptionDataCollector:
@@ -22,12 +18,12 @@ class OptionDataCollector:
             symbol (str): 기초자산 티커 심볼 (기본값: S&P 500)
         """
         self.symbol = symbol
-        self.ticker = yf.Ticker(symbol)
+        self.ticker = yf.Ticker(symbol, session=get_session())
 
     def get_expiry_dates(self) -> List[str]:
         """사용 가능한 모든 만기일 조회"""
         try:
-            return self.ticker.options
+            return yahoo_call(lambda: self.ticker.options, source="yahoo.options")
         except Exception as e:
             logger.error(f"만기일 목록 조회 중 오류 발생: {str(e)}")
             return []
@@ -42,7 +38,7 @@ class OptionDataCollector:
             Tuple[pd.DataFrame, pd.DataFrame]: (콜옵션 DataFrame, 풋옵션 DataFrame)
         """
         try:
-            chains = self.ticker.option_chain(expiry)
+            chains = yahoo_call(self.ticker.option_chain, expiry)
             return chains.calls, chains.puts
         except Exception as e:
             logger.error(f"옵션 체인 데이터 수집 중 오류 발생 ({expiry}): {str(e)}")
@@ -182,7 +178,7 @@ class OptionDataCollector:
     def _get_current_price(self) -> float:
         """기초자산의 현재 가격 조회"""
         try:
-            return self.ticker.history(period="1d")["Close"].iloc[-1]
+            return yahoo_call(self.ticker.history, period="1d")["Close"].iloc[-1]
         except Exception as e:
             logger.error(f"현재가 조회 중 오류 발생: {str(e)}")
             return 0.0
@@ -0,0 +1,228 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import pandas as pd
+
+from config.settings import (
+    YAHOO_RATE,
+    YAHOO_BURST,
+    YAHOO_MIN_CONCURRENCY,
+    YAHOO_MAX_CONCURRENCY,
+    YAHOO_THROTTLE_COOLDOWN,
+)
+from src.isolation import check_cancelled
+from src.logger import logger
+from utils.latency import timed_call
+
+# Yahoo가 요청을 제한할 때 예외 메시지에 나타나는 문구
+THROTTLE_MARKERS = ("429", "Too Many Requests", "Rate limited")
+
+
+class AdaptiveRateLimiter:
+    """토큰 버킷 + 적응형 동시성(AIMD) 요청 제한기
+
+    - 토큰 버킷: 초당 rate개의 토큰을 최대 burst개까지 채우고, 요청마다 1개를 사용
+    - 동시성 한도: 성공하면 조금씩(1/한도) 늘리고, 제한(429)이나 빈 응답이 오면 절반으로 줄임
+    - 429 응답 후에는 cooldown 동안 새 요청을 보내지 않음
+
+    프로세스 전체에서 하나의 인스턴스(yahoo_limiter)를 공유하여 여러 수집기와
+    차트 데이터 조회 스레드가 동시에 요청해도 전체 요청량이 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_concurrency: int = 1,
+        max_concurrency: int = 4,
+        cooldown: float = 5.0,
+    ):
+        """
+        Args:
+            rate: 초당 요청 수
+            burst: 토큰 버킷 크기 (연속 요청 허용 개수)
+            min_concurrency: 동시 요청 한도 하한
+            max_concurrency: 동시 요청 한도 상한
+            cooldown: 요청 제한 응답 후 대기 시간 (초)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.cooldown = cooldown
+
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.stats = {"requests": 0, "throttled": 0, "empty": 0, "wait_seconds": 0.0}
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        """요청 가능할 때까지 남은 시간 (0이면 즉시 가능, None이면 슬롯 반환 대기)"""
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= int(self.limit):
+            return None  # 진행 중인 요청이 끝날 때까지 대기
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0.0
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """요청 슬롯 획득 (토큰과 동시성 한도를 모두 만족할 때까지 대기)
+
+        Raises:
+            CollectCancelledError: 기다리는 동안 수집기의 제한 시간이 지난 경우
+                (취소된 수집기가 토큰과 슬롯을 사용하지 않도록)
+        """
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                check_cancelled()
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now)
+                if wait == 0.0:
+                    break
+                self._condition.wait(wait)
+
+            self.tokens -= 1
+            self.in_flight += 1
+            self.stats["requests"] += 1
+            self.stats["wait_seconds"] += time.monotonic() - started
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self):
+        """성공 응답: 동시성 한도를 조금씩 늘림 (additive increase)"""
+        with self._condition:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def on_throttle(self, pause: bool = True):
+        """제한/빈 응답: 동시성 한도를 절반으로 줄임 (multiplicative decrease)
+
+        Args:
+            pause: 429 응답처럼 명확한 요청 제한이면 cooldown 동안 요청 중지
+        """
+        with self._condition:
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            if pause:
+                self.stats["throttled"] += 1
+                self.paused_until = time.monotonic() + self.cooldown
+            else:
+                self.stats["empty"] += 1
+            limit = int(self.limit)
+
+        if pause:
+            logger.warning(
+                f"Yahoo 요청 제한 감지: {self.cooldown:.0f}초 대기, 동시 요청 한도 {limit}"
+            )
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """요청 슬롯을 이미 얻은 상태에서 함수 호출 후 응답에 따라 한도 조정
+
+        예외 메시지로 요청 제한(429)을 감지하고, 빈 DataFrame/목록 응답은
+        제한의 초기 신호로 보고 동시성 한도만 줄입니다.
+        """
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_throttle_error(e):
+                self.on_throttle()
+            raise
+
+        if is_empty_response(result):
+            self.on_throttle(pause=False)
+        else:
+            self.on_success()
+        return result
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """제한기를 거쳐 함수 호출 (슬롯 획득 후 run)"""
+        with self.acquire():
+            return self.run(func, *args, **kwargs)
+
+    def can_hedge(self) -> bool:
+        """헤지 요청 허용 여부
+
+        429 대기 중이거나 동시성 한도가 상한보다 줄어든 상태(제한 신호를 받은
+        뒤)에는 추가 요청이 제한을 악화시키므로 헤지하지 않습니다.
+        """
+        with self._condition:
+            return (
+                time.monotonic() >= self.paused_until
+                and self.limit >= self.max_concurrency
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 한도와 누적 통계"""
+        with self._condition:
+            return {**self.stats, "limit": round(self.limit, 2)}
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """요청 제한(429) 예외 여부"""
+    message = f"{type(error).__name__}: {error}"
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+def is_empty_response(result: Any) -> bool:
+    """빈 응답 여부 (빈 DataFrame, 빈 만기 목록, 빈 옵션 체인)"""
+    if isinstance(result, pd.DataFrame):
+        return result.empty
+    if isinstance(result, (tuple, list)):
+        return len(result) == 0
+    calls = getattr(result, "calls", None)
+    return isinstance(calls, pd.DataFrame) and calls.empty
+
+
+# 모든 yfinance 호출이 공유하는 프로세스 전역 제한기
+yahoo_limiter = AdaptiveRateLimiter(
+    rate=YAHOO_RATE,
+    burst=YAHOO_BURST,
+    min_concurrency=YAHOO_MIN_CONCURRENCY,
+    max_concurrency=YAHOO_MAX_CONCURRENCY,
+    cooldown=YAHOO_THROTTLE_COOLDOWN,
+)
+
+
+def yahoo_call(
+    func: Callable[..., Any],
+    *args,
+    source: Optional[str] = None,
+    hedge: bool = True,
+    **kwargs,
+) -> Any:
+    """yfinance 호출을 공유 제한기와 지연 시간 예산(헤지 요청)을 거쳐 실행
+
+    지연 시간 예산은 제한기 슬롯을 얻은 뒤부터 계산하므로 제한기 대기 시간은
+    헤지를 일으키지 않고 응답 시간 기록에도 포함되지 않습니다. 헤지 요청도
+    슬롯을 거치며, 요청 제한 중(429 대기, 동시성 한도 축소)에는 보내지 않습니다.
+
+    Args:
+        func: yfinance 조회 함수
+        source: 지연 시간 기록용 소스 이름 (기본값: "yahoo.<함수 이름>")
+        hedge: 헤지 요청 허용 여부 (yf.download처럼 스레드 안전하지 않으면 False)
+
+    예:
+        hist = yahoo_call(yf.Ticker("^GSPC").history, start=start, end=end)
+    """
+    source = source or f"yahoo.{getattr(func, '__name__', 'call')}"
+    return timed_call(
+        source, func, *args, hedge=hedge, limiter=yahoo_limiter, **kwargs
+    )
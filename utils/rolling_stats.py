@@ -0,0 +1,367 @@
+"""
+종목별 증분 롤링 통계
+
+52주 최고가/최저가, 이동평균, 변동성을 종목별 상태(InstrumentStats)로 유지하여
+다음 실행에서는 마지막 봉 이후 구간만 조회하고 새 봉만 반영합니다. 상태는
+RollingStatsStore가 data/rolling_stats.pkl에 저장합니다.
+
+수집기는 begin()으로 저장된 상태의 복사본을 받아 갱신하고, 조회와 지표 계산이
+모두 성공한 뒤에만 commit()으로 저장소에 반영합니다. 제한 시간을 넘겨 재시도로
+넘어간 이전 시도의 스레드가 계속 실행되더라도 재시도와 같은 상태 객체를 동시에
+수정하지 않으며, 실패한 시도의 일부 갱신이 저장되지도 않습니다.
+
+예:
+    stats, start = rolling_store.begin("yahoo:^GSPC")
+    hist = ticker.history(start=start, end=end)
+    stats.update_frame(normalize_ohlcv(hist))
+    metrics = stats.metrics()
+    rolling_store.commit("yahoo:^GSPC", stats)
+"""
+
+import copy
+import math
+import os
+import pickle
+import threading
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from config.settings import (
+    DATE_FORMAT,
+    LOOKBACK_DAYS,
+    ROLLING_MAX_GAP_DAYS,
+    get_rolling_state_filepath,
+)
+from src.history_db import DATE_KEY
+from src.logger import logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 지표별 윈도우: (입력 필드, 종류, 크기, 단위, 최소 데이터 수)
+# - 단위 "bars": 최근 N개 봉 (pandas rolling(N)과 동일)
+# - 단위 "days": 기준일 N일 전(당일 포함)부터의 봉 (52주 고가/저가처럼 조회 기간
+#   history(start=오늘-N일) 기준이므로 정확히 N일 전 봉도 포함)
+WINDOWS = {
+    "year_high": ("high", "max", LOOKBACK_DAYS, "days", 1),
+    "year_low": ("low", "min", LOOKBACK_DAYS, "days", 1),
+    "volume_ma20": ("volume", "mean", 20, "bars", 20),
+    "ma_90": ("close", "mean", 90, "bars", 90),
+    "ma_180": ("close", "mean", 180, "bars", 180),
+    "std_20": ("close", "std", 20, "bars", 2),
+    "std_year": ("close", "std", LOOKBACK_DAYS, "days", 2),
+}
+
+# 봉 필드 → 표준 OHLCV 컬럼 이름 (market_metrics.normalize_ohlcv 결과)
+BAR_COLUMNS = {"high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+# 저장된 상태 형식 버전 (윈도우 구성이 바뀌면 올려서 전체 재계산)
+# 3: 히스토리 DB 거래일 시계열을 채우도록 전체 기간 한 번 다시 조회
+ROLLING_STATE_VERSION = 3
+
+
+class RollingExtreme:
+    """단조 덱(monotonic deque) 기반 윈도우 최댓값/최솟값
+
+    덱에는 이후 최댓값(최솟값)이 될 가능성이 있는 값만 남기므로 값 추가와
+    조회가 모두 분할 상환 O(1)입니다.
+    """
+
+    def __init__(self, size: int, higher: bool = True):
+        self.size = size
+        self.higher = higher
+        self.items: deque = deque()  # (위치, 값)
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new >= old if self.higher else new <= old
+
+    def push(self, position: int, value: float):
+        if value is None or math.isnan(value):
+            return
+        while self.items and self._dominates(value, self.items[-1][1]):
+            self.items.pop()
+        self.items.append((position, value))
+
+    def evict(self, position: int):
+        """position 기준 윈도우를 벗어난 값 제거"""
+        while self.items and self.items[0][0] <= position - self.size:
+            self.items.popleft()
+
+    def value(self, extra: Optional[float] = None) -> float:
+        """윈도우 최댓값(최솟값) (extra: 아직 확정되지 않은 최신 값)"""
+        candidates = [self.items[0][1]] if self.items else []
+        if extra is not None and not math.isnan(extra):
+            candidates.append(extra)
+        if not candidates:
+            return math.nan
+        return max(candidates) if self.higher else min(candidates)
+
+
+class RollingMoments:
+    """누적 합 기반 윈도우 평균/표준편차
+
+    합과 제곱합을 첫 값 기준으로 이동(shift)하여 누적하므로 수익률이나
+    지수처럼 값의 크기가 큰 경우에도 분산 계산의 자릿수 손실을 줄입니다.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.items: deque = deque()  # (위치, 값)
+        self.shift: Optional[float] = None
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def push(self, position: int, value: float):
+        if value is None or math.isnan(value):
+            return
+        if self.shift is None:
+            self.shift = value
+        centered = value - self.shift
+        self.items.append((position, value))
+        self.total += centered
+        self.total_sq += centered * centered
+
+    def evict(self, position: int):
+        while self.items and self.items[0][0] <= position - self.size:
+            _, value = self.items.popleft()
+            centered = value - self.shift
+            self.total -= centered
+            self.total_sq -= centered * centered
+
+    def _moments(self, extra: Optional[float]) -> Tuple[int, float, float]:
+        count, total, total_sq = len(self.items), self.total, self.total_sq
+        if extra is not None and not math.isnan(extra):
+            shift = self.shift if self.shift is not None else extra
+            centered = extra - shift
+            count, total, total_sq = count + 1, total + centered, total_sq + centered**2
+        return count, total, total_sq
+
+    def mean(self, extra: Optional[float] = None) -> float:
+        count, total, _ = self._moments(extra)
+        if count == 0:
+            return math.nan
+        shift = self.shift if self.shift is not None else extra
+        return shift + total / count
+
+    def std(self, extra: Optional[float] = None) -> float:
+        """표본 표준편차 (ddof=1, pandas 기본값과 동일)"""
+        count, total, total_sq = self._moments(extra)
+        if count < 2:
+            return math.nan
+        variance = (total_sq - total * total / count) / (count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def count(self, extra: Optional[float] = None) -> int:
+        return self._moments(extra)[0]
+
+
+class InstrumentStats:
+    """종목별 증분 롤링 통계
+
+    확정된 봉은 윈도우에 누적하고, 가장 최근 봉은 장중 값이 바뀔 수 있으므로
+    "대기" 상태로 두었다가 더 새로운 봉이 들어오면 확정합니다. 새 봉 하나를
+    반영하는 비용은 조회 기간 길이와 무관하게 O(1)입니다.
+    """
+
+    def __init__(self, lookback_days: int = LOOKBACK_DAYS):
+        self.version = ROLLING_STATE_VERSION
+        self.lookback_days = lookback_days
+        self.bars = 0  # 확정된 봉 수
+        self.last_date: Optional[date] = None  # 마지막 확정 봉 날짜
+        self.last_close = math.nan
+        self.pending: Optional[Tuple[date, Dict[str, float]]] = None
+        self.windows: Dict[str, Any] = {}
+        for name, (_, kind, size, unit, _) in WINDOWS.items():
+            # 윈도우는 (기준 위치 - span, 기준 위치] 구간을 유지하므로 "days"는
+            # N일 전 당일까지 포함하도록 하루를 더함
+            span = size + 1 if unit == "days" else size
+            if kind in ("max", "min"):
+                self.windows[name] = RollingExtreme(span, higher=kind == "max")
+            else:
+                self.windows[name] = RollingMoments(span)
+
+    def _positions(self, bar_date: date, bar_index: int) -> Dict[str, int]:
+        return {"days": bar_date.toordinal(), "bars": bar_index}
+
+    def _commit(self, bar_date: date, bar: Dict[str, float]):
+        positions = self._positions(bar_date, self.bars)
+        for name, (field, _, _, unit, _) in WINDOWS.items():
+            window = self.windows[name]
+            window.evict(positions[unit])
+            window.push(positions[unit], bar[field])
+        self.bars += 1
+        self.last_date = bar_date
+        self.last_close = bar["close"]
+
+    def update(self, bar_date: date, bar: Dict[str, float]):
+        """봉 반영 (이미 확정된 날짜는 무시, 대기 중인 날짜는 교체)"""
+        if self.last_date is not None and bar_date <= self.last_date:
+            return
+        if self.pending is not None and bar_date > self.pending[0]:
+            self._commit(*self.pending)
+        self.pending = (bar_date, bar)
+
+    def update_frame(
+        self, frame: "pd.DataFrame", columns: Dict[str, str] = BAR_COLUMNS
+    ):
+        """OHLCV DataFrame의 봉을 순서대로 반영 (새 봉 수에 비례하는 비용)
+
+        Args:
+            frame: 날짜 인덱스 DataFrame (normalize_ohlcv로 정규화된 컬럼)
+            columns: {봉 필드: DataFrame 컬럼 이름}
+        """
+        # pandas는 시작 시간에 영향이 커서 실제로 필요할 때만 로드
+        import pandas as pd
+
+        fields = list(columns)
+        selected = frame[[columns[field] for field in fields]]
+        for index, *values in selected.itertuples(name=None):
+            bar = {field: float(value) for field, value in zip(fields, values)}
+            self.update(pd.Timestamp(index).date(), bar)
+
+    @property
+    def next_start(self) -> Optional[date]:
+        """증분 조회 시작일 (대기 중인 봉부터 다시 조회하여 확정 값으로 교체)"""
+        if self.pending is not None:
+            return self.pending[0]
+        return self.last_date
+
+    def metrics(self) -> Dict[str, Any]:
+        """최신 봉 기준 지표 (최신 봉은 확정 전이어도 포함, trade_date는 최신 봉 거래일)"""
+        if self.pending is None:
+            raise ValueError("반영된 봉이 없습니다")
+
+        bar_date, bar = self.pending
+        positions = self._positions(bar_date, self.bars)
+        result = {
+            DATE_KEY: bar_date.strftime(DATE_FORMAT),
+            "close": bar["close"],
+            "prev_close": self.last_close if self.bars else bar["close"],
+            "high": bar["high"],
+            "low": bar["low"],
+            "volume": bar.get("volume", math.nan),
+        }
+
+        for name, (field, kind, _, unit, min_periods) in WINDOWS.items():
+            window = self.windows[name]
+            window.evict(positions[unit])
+            extra = bar.get(field)
+            if kind in ("max", "min"):
+                result[name] = window.value(extra)
+            elif window.count(extra) < min_periods:
+                result[name] = math.nan
+            elif kind == "mean":
+                result[name] = window.mean(extra)
+            else:
+                result[name] = window.std(extra)
+        return result
+
+
+class RollingStatsStore:
+    """종목별 InstrumentStats 저장소 (실행 간 유지)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 저장 경로 (기본값: settings.get_rolling_state_filepath())
+        """
+        self.path = path
+        self.states: Dict[str, InstrumentStats] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def get_path(self) -> str:
+        return self.path or get_rolling_state_filepath()
+
+    def load(self):
+        """저장된 상태 로드 (없거나 손상되면 빈 상태로 시작)"""
+        self._loaded = True
+        path = self.get_path()
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "rb") as f:
+                states = pickle.load(f)
+            with self._lock:
+                for key, state in states.items():
+                    self.states.setdefault(key, state)
+        except Exception as e:
+            logger.warning(f"롤링 통계 상태 로드 실패: {str(e)}")
+
+    def save(self) -> Optional[str]:
+        """변경된 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self._dirty:
+            return None
+
+        path = self.get_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self._lock:
+                payload = pickle.dumps(self.states, protocol=pickle.HIGHEST_PROTOCOL)
+                self._dirty = False
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            logger.warning(f"롤링 통계 상태 저장 실패: {str(e)}")
+            return None
+
+    def begin(
+        self, key: str, lookback_days: int = LOOKBACK_DAYS
+    ) -> Tuple[InstrumentStats, datetime]:
+        """종목 상태의 복사본과 조회 시작일 반환
+
+        저장된 상태가 있고 마지막 봉이 ROLLING_MAX_GAP_DAYS 이내이면 그 이후만
+        조회하도록 시작일을 돌려주고, 아니면 새 상태와 전체 조회 기간을 돌려줍니다.
+        반환한 상태는 시도마다 별도의 복사본이므로 갱신 결과는 commit()을
+        호출해야 저장소에 반영됩니다.
+
+        Returns:
+            Tuple[InstrumentStats, datetime]: (종목 상태 복사본, 조회 시작일)
+        """
+        if not self._loaded:
+            self.load()
+
+        now = datetime.now()
+        with self._lock:
+            stored = self.states.get(key)
+            start = stored.next_start if stored is not None else None
+            if (
+                stored is None
+                or start is None
+                or getattr(stored, "version", 1) != ROLLING_STATE_VERSION
+                or stored.lookback_days != lookback_days
+                or (now.date() - start).days > ROLLING_MAX_GAP_DAYS
+            ):
+                return InstrumentStats(lookback_days), now - timedelta(
+                    days=lookback_days
+                )
+            stats = copy.deepcopy(stored)
+        return stats, datetime.combine(start, datetime.min.time())
+
+    def commit(self, key: str, stats: InstrumentStats):
+        """조회에 성공한 시도의 종목 상태를 저장소에 반영
+
+        제한 시간을 넘긴 이전 시도가 재시도보다 늦게 끝나더라도 더 오래된
+        봉까지만 반영한 상태로 덮어쓰지 않습니다.
+        """
+        with self._lock:
+            stored = self.states.get(key)
+            if (
+                stored is not None
+                and getattr(stored, "version", 1) == ROLLING_STATE_VERSION
+                and stored.lookback_days == stats.lookback_days
+                and (stored.next_start or date.min) > (stats.next_start or date.min)
+            ):
+                return
+            self.states[key] = stats
+            self._dirty = True
+
+
+# 모든 수집기가 공유하는 프로세스 전역 상태 저장소
+rolling_store = RollingStatsStore()
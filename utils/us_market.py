@@ -1,84 +1,88 @@
 import yfinance as yf
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, Optional
-import sys
-import os
-
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
 
 from config.settings import US_INDICES, LOOKBACK_DAYS
-
-
-def get_market_data(
-    ticker: str, lookback_days: int = LOOKBACK_DAYS
+from src.history_db import series_buffer
+from utils.rate_limiter import yahoo_call
+from utils.http_session import get_session
+from utils.rolling_stats import rolling_store
+from utils.market_metrics import (
+    daily_metrics,
+    derive_metrics,
+    normalize_ohlcv,
+    to_records,
+)
+
+
+def get_market_stats(
+    ticker: str, lookback_days: int = LOOKBACK_DAYS, name: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """
-    지정된 티커의 시장 데이터를 수집합니다.
+    지정된 티커의 기본 지표(종가, 전일 종가, 20일 평균 거래량, 52주 최고가/최저가 등)를 수집합니다.
 
     Args:
         ticker (str): yfinance 티커 심볼
         lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
+        name (str): 히스토리 DB에 조회한 일별 시계열을 기록할 종목 이름 (None이면 기록 안 함)
 
     Returns:
-        Dict[str, Any]: 시장 데이터 딕셔너리 또는 에러 시 None
+        Dict[str, Any]: InstrumentStats.metrics() 형식의 기본 지표 또는 에러 시 None
     """
     try:
         # yfinance 티커 객체 생성
-        yf_ticker = yf.Ticker(ticker)
+        yf_ticker = yf.Ticker(ticker, session=get_session())
 
-        # 시작일과 종료일 설정
+        # 저장된 롤링 통계 이후 구간만 조회 (상태가 없으면 전체 기간)
+        key = f"yahoo:{ticker}"
+        stats, start_date = rolling_store.begin(key, lookback_days)
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=lookback_days)
 
         # 과거 데이터 조회
-        hist = yf_ticker.history(start=start_date, end=end_date)
+        hist = yahoo_call(yf_ticker.history, start=start_date, end=end_date)
 
+        # 증분 조회도 대기 중인 봉 날짜부터 다시 조회하므로 빈 결과는 조회 실패
+        # (저장된 상태의 이전 값을 오늘 데이터로 돌려주지 않음)
         if hist.empty:
             print(f"Warning: No data found for ticker {ticker}")
             return None
 
-        # 최신 데이터와 전일 데이터
-        latest = hist.iloc[-1]
-        prev = (
-            hist.iloc[-2] if len(hist) > 1 else latest
-        )  # 데이터가 하나만 있는 경우 처리
+        # 새 봉만 반영하여 20일 평균 거래량, 52주 최고가/최저가 갱신
+        bars = normalize_ohlcv(hist)
+        prev_close = stats.last_close
+        stats.update_frame(bars)
+        metrics = stats.metrics()
 
-        # 20일 평균 거래량 계산
-        volume_ma20 = hist["Volume"].rolling(window=20).mean()
-        latest_volume_ma20 = volume_ma20.iloc[-1]
+        # 조회와 지표 계산이 모두 성공한 시도의 상태만 저장소에 반영
+        rolling_store.commit(key, stats)
+        if name:
+            # 거래일별 종가/등락을 히스토리 DB 시계열로 기록 (첫 봉은 직전 확정 종가 기준)
+            series_buffer.add(name, daily_metrics(bars, "market", prev_close))
+        return metrics
 
-        # 현재 거래량과 20일 평균 거래량의 비율
-        volume_ratio = (
-            latest["Volume"] / latest_volume_ma20 if latest_volume_ma20 > 0 else 0
-        )
-
-        # 52주 최고가, 최저가 계산
-        year_high = hist["High"].max()
-        year_low = hist["Low"].min()
+    except Exception as e:
+        print(f"Error fetching data for {ticker}: {str(e)}")
+        return None
 
-        # 전일 대비 변화율 계산
-        daily_change = ((latest["Close"] - prev["Close"]) / prev["Close"]) * 100
 
-        # 52주 최고가 대비 비율 계산
-        year_high_ratio = ((latest["Close"] - year_high) / year_high) * 100
+def get_market_data(
+    ticker: str, lookback_days: int = LOOKBACK_DAYS
+) -> Optional[Dict[str, Any]]:
+    """
+    지정된 티커의 시장 데이터를 수집합니다.
 
-        return {
-            "close": latest["Close"],
-            "volume": latest["Volume"],
-            "change": daily_change,
-            "volume_ma20": latest_volume_ma20,
-            "volume_ratio": volume_ratio,
-            "year_high": year_high,
-            "year_low": year_low,
-            "year_high_ratio": year_high_ratio,
-        }
+    Args:
+        ticker (str): yfinance 티커 심볼
+        lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
 
-    except Exception as e:
-        print(f"Error fetching data for {ticker}: {str(e)}")
+    Returns:
+        Dict[str, Any]: 시장 데이터 딕셔너리 또는 에러 시 None
+    """
+    stats = get_market_stats(ticker, lookback_days)
+    if stats is None:
         return None
+    return to_records(derive_metrics({ticker: stats}), "market")[ticker]
 
 
 def get_all_us_market_data() -> Dict[str, Dict[str, Any]]:
@@ -88,16 +92,20 @@ def get_all_us_market_data() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict[str, Dict[str, Any]]: 시장 이름을 키로 하고 데이터를 값으로 하는 딕셔너리
     """
-    market_data = {}
+    market_stats = {}
 
     for market_name, ticker in US_INDICES.items():
-        data = get_market_data(ticker)
-        if data:
-            market_data[market_name] = data
+        stats = get_market_stats(ticker, name=market_name)
+        if stats:
+            market_stats[market_name] = stats
         else:
             print(f"Failed to fetch data for {market_name}")
 
-    return market_data
+    if not market_stats:
+        return {}
+
+    # 전일 대비, 거래량 비율, 고점 대비는 전 지수를 한 번에 계산
+    return to_records(derive_metrics(market_stats), "market")
 
 
 def format_market_data(market_name: str, data: Dict[str, Any]) -> str:
@@ -1,94 +1,110 @@
 import yfinance as yf
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, Optional
-from fredapi import Fred
-import sys
-import os
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(project_root)
-
-from config.settings import US_TREASURIES, LOOKBACK_DAYS, FEDAPI_KEY
-
-fred = Fred(api_key=FEDAPI_KEY)
+from config.settings import US_TREASURIES, LOOKBACK_DAYS
+from src.history_db import series_buffer
+from utils.rate_limiter import yahoo_call
+from utils.latency import timed_call
+from utils.http_session import get_session, get_fred
+from utils.rolling_stats import rolling_store
+from utils.market_metrics import (
+    daily_metrics,
+    derive_metrics,
+    normalize_ohlcv,
+    to_records,
+)
 
 
 def get_fed_rate() -> float:
     """연방기금금리 목표 상단 가져오기"""
     try:
-        fed_rate = fred.get_series("DFEDTARU").iloc[-1]
+        fed_rate = timed_call("fred.get_series", get_fred().get_series, "DFEDTARU").iloc[-1]
         return float(fed_rate)
     except Exception as e:
         print(f"Error fetching Fed rate: {str(e)}")
         return 5.50
 
 
-def get_treasury_data(
-    ticker: str, lookback_days: int = LOOKBACK_DAYS
+def get_treasury_stats(
+    ticker: str, lookback_days: int = LOOKBACK_DAYS, name: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """
-    지정된 미국 국채의 수익률 데이터를 수집합니다.
+    지정된 미국 국채의 기본 지표(수익률, 기간별 평균, 변동성, 52주 최고/최저 등)를 수집합니다.
 
     Args:
         ticker (str): yfinance 티커 심볼
         lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
+        name (str): 히스토리 DB에 조회한 일별 시계열을 기록할 종목 이름 (None이면 기록 안 함)
 
     Returns:
-        Dict[str, Any]: 국채 수익률 데이터 딕셔너리 또는 에러 시 None
+        Dict[str, Any]: InstrumentStats.metrics() 형식의 기본 지표 또는 에러 시 None
     """
     try:
         # yfinance 티커 객체 생성
-        yf_ticker = yf.Ticker(ticker)
+        yf_ticker = yf.Ticker(ticker, session=get_session())
 
-        # 시작일과 종료일 설정
+        # 저장된 롤링 통계 이후 구간만 조회 (상태가 없으면 전체 기간)
+        key = f"yahoo:{ticker}"
+        stats, start_date = rolling_store.begin(key, lookback_days)
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=lookback_days)
 
         # 과거 데이터 조회
-        hist = yf_ticker.history(start=start_date, end=end_date)
+        hist = yahoo_call(yf_ticker.history, start=start_date, end=end_date)
 
+        # 증분 조회도 대기 중인 봉 날짜부터 다시 조회하므로 빈 결과는 조회 실패
+        # (저장된 상태의 이전 값을 오늘 데이터로 돌려주지 않음)
         if hist.empty:
             print(f"Warning: No data found for treasury {ticker}")
             return None
 
-        # 최신 데이터와 전일 데이터
-        latest = hist.iloc[-1]
-        prev = hist.iloc[-2] if len(hist) > 1 else latest
+        # 새 봉만 반영하여 기간별 평균(90일/180일)과 변동성 갱신
+        bars = normalize_ohlcv(hist)
+        prev_close = stats.last_close
+        stats.update_frame(bars)
+        metrics = stats.metrics()
 
-        # 기간별 평균
-        ma_90 = hist["Close"].rolling(window=90).mean().iloc[-1]  # 3개월 평균
-        ma_180 = hist["Close"].rolling(window=180).mean().iloc[-1]  # 6개월 평균
-
-        # 변동성 분석
-        last_month = hist["Close"].tail(20)  # 최근 1개월
-        monthly_volatility = last_month.std()
-        long_term_volatility = hist["Close"].std()
-        volatility_ratio = (
-            monthly_volatility / long_term_volatility if long_term_volatility > 0 else 0
-        )
-
-        fed_rate = get_fed_rate()
-
-        return {
-            "yield_rate": latest["Close"],
-            "change": latest["Close"] - prev["Close"],
-            "year_high": hist["High"].max(),
-            "year_low": hist["Low"].min(),
-            "ma_90": ma_90,
-            "ma_180": ma_180,
-            "monthly_volatility": monthly_volatility,
-            "long_term_volatility": long_term_volatility,
-            "volatility_ratio": volatility_ratio,
-            "fed_spread": latest["Close"] - fed_rate,
-        }
+        # 조회와 지표 계산이 모두 성공한 시도의 상태만 저장소에 반영
+        rolling_store.commit(key, stats)
+        if name:
+            # 거래일별 종가/등락을 히스토리 DB 시계열로 기록 (첫 봉은 직전 확정 종가 기준)
+            series_buffer.add(name, daily_metrics(bars, "treasury", prev_close))
+        return metrics
 
     except Exception as e:
         print(f"Error fetching data for treasury {ticker}: {str(e)}")
         return None
 
 
+def build_treasury_records(
+    treasury_stats: Dict[str, Dict[str, float]], fed_rate: float
+) -> Dict[str, Dict[str, Any]]:
+    """국채별 기본 지표에서 전일 대비, 변동성 비율, 기준금리 스프레드를 계산"""
+    table = derive_metrics(treasury_stats)
+    table["fed_spread"] = table["close"] - fed_rate
+    return to_records(table, "treasury")
+
+
+def get_treasury_data(
+    ticker: str, lookback_days: int = LOOKBACK_DAYS
+) -> Optional[Dict[str, Any]]:
+    """
+    지정된 미국 국채의 수익률 데이터를 수집합니다.
+
+    Args:
+        ticker (str): yfinance 티커 심볼
+        lookback_days (int): 과거 데이터 조회 기간 (기본값: settings.LOOKBACK_DAYS)
+
+    Returns:
+        Dict[str, Any]: 국채 수익률 데이터 딕셔너리 또는 에러 시 None
+    """
+    stats = get_treasury_stats(ticker, lookback_days)
+    if stats is None:
+        return None
+    return build_treasury_records({ticker: stats}, get_fed_rate())[ticker]
+
+
 def get_all_treasury_data() -> Dict[str, Dict[str, Any]]:
     """
     모든 미국 국채 수익률 데이터를 수집합니다.
@@ -96,16 +112,20 @@ def get_all_treasury_data() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict[str, Dict[str, Any]]: 국채 이름을 키로 하고 데이터를 값으로 하는 딕셔너리
     """
-    treasury_data = {}
+    treasury_stats = {}
 
     for treasury_name, ticker in US_TREASURIES.items():
-        data = get_treasury_data(ticker)
-        if data:
-            treasury_data[treasury_name] = data
+        stats = get_treasury_stats(ticker, name=treasury_name)
+        if stats:
+            treasury_stats[treasury_name] = stats
         else:
             print(f"Failed to fetch data for {treasury_name}")
 
-    return treasury_data
+    if not treasury_stats:
+        return {}
+
+    # 기준금리는 섹션당 한 번만 조회
+    return build_treasury_records(treasury_stats, get_fed_rate())
 
 
 def format_treasury_data(treasury_name: str, data: Dict[str, Any]) -> str: